@@ -2,15 +2,37 @@
 
 import heapq
 import math
+from collections import Counter
 from functools import cache
 from itertools import count
 
+import numpy as np
+
 import networkx as nx
 from networkx.algorithms.shortest_paths.weighted import _weight_function
 from networkx.exception import NetworkXNoPath, NodeNotFound
 from networkx.utils.decorators import not_implemented_for
 
-__all__ = ["bidirectional_astar"]
+from Algorithms.csr_graph import CSRGraph, to_csr_graph
+from Algorithms.indexed_heap import IndexedHeap
+from Algorithms.workspace import _workspace_for
+
+__all__ = [
+    "bidirectional_astar",
+    "bidirectional_astar_anytime",
+    "bidirectional_astar_batch",
+    "bidirectional_astar_k_shortest",
+]
+
+
+# Default heuristic: Euclidean distance between 2D grid coordinates
+def _euclidean_heuristic(u, v):
+    try:
+        x1, y1 = u
+        x2, y2 = v
+        return math.hypot(x2 - x1, y2 - y1)
+    except (TypeError, ValueError):
+        return 0
 
 
 # === Bidirectional A* Search ===
@@ -27,15 +49,23 @@ def bidirectional_astar(
         max_nodes_expanded=None,
         max_heuristic_distance=None,
         greedy=False,
+        optimal=True,
+        workspace=None,
+        indexed_heap=False,
 ):
     """Returns a shortest path between source and target using Bidirectional A*.
 
     This implementation performs two simultaneous A* searches—one forward from the
-    source, one backward from the target—until the frontiers meet.
+    source, one backward from the target. By default it keeps the cost μ of the
+    best path seen through any meeting node and stops once the two frontiers
+    prove that μ is optimal; otherwise it stops as soon as the frontiers meet.
 
     Parameters
     ----------
-    G : NetworkX graph
+    G : NetworkX graph or CSRGraph
+        A :class:`~Algorithms.csr_graph.CSRGraph` snapshot takes the
+        integer-indexed fast path; `weight` is then ignored because the
+        weights were fixed when the snapshot was compiled.
 
     source : node
         Starting node for path
@@ -66,6 +96,27 @@ def bidirectional_astar(
         ignoring accumulated cost. Provides faster execution at the cost of
         path optimality.
 
+    optimal : bool, default=True
+        If True, both searches are ordered by the averaged potentials
+        ``p_f(n) = (h(n, target) - h(n, source)) / 2`` and ``p_r = -p_f``,
+        the best meeting cost μ is tracked on every relaxation, nodes whose
+        A* estimate already reaches μ are pruned, and the search stops when
+        the sum of the two frontier minima reaches μ. With a consistent
+        heuristic the returned path is then a shortest path. If False, or
+        when `greedy` is set, the search stops at the first node settled by
+        one side that the other side has already seen.
+
+    workspace : SearchWorkspace, optional
+        Reusable scratch arrays for a CSRGraph snapshot (see
+        :class:`~Algorithms.workspace.SearchWorkspace`). Back-to-back queries
+        sharing a workspace allocate nothing per node. Only valid together
+        with the snapshot the workspace was built for.
+
+    indexed_heap : bool, default=False
+        If True, each frontier is an :class:`~Algorithms.indexed_heap.IndexedHeap`
+        that lowers the key of a queued node in place instead of pushing a
+        duplicate entry, so no stale entries are ever popped.
+
     Returns
     -------
     total_cost : float
@@ -80,6 +131,11 @@ def bidirectional_astar(
         - nodes_expanded_backward
         - total_nodes_expanded
         - explored_percent
+        - optimal (whether the μ stopping rule proved the path optimal)
+        - heap_pushes (entries inserted into the frontiers)
+        - decrease_keys (in-place key decreases; 0 without `indexed_heap`)
+        - stale_pops (outdated entries popped and skipped)
+        - max_heap_size (largest combined frontier size)
 
     Raises
     ------
@@ -89,7 +145,15 @@ def bidirectional_astar(
     Notes
     -----
     This implementation prioritizes performance in large graphs.
-    If `greedy=True`, the path may not be optimal.
+    If `greedy=True`, the path may not be optimal. When `max_nodes_expanded`
+    is exceeded in optimal mode, the best path found so far is returned if
+    there is one; otherwise the search continues greedily.
+
+    The μ stopping rule follows the symmetric bidirectional A* of Ikeda et
+    al. (1994) and Goldberg & Harrelson (2005): with consistent, averaged
+    potentials every reduced edge cost is non-negative, so no path through
+    the unexplored region can be shorter than the sum of the two frontier
+    minima.
 
     """
     if source not in G:
@@ -99,18 +163,19 @@ def bidirectional_astar(
     if source == target:
         return (0, [source], {"total_nodes_expanded": 1})
 
-    # Default heuristic: Euclidean distance between 2D grid coordinates
-    @cache
-    def _euclidean_heuristic(u, v):
-        try:
-            x1, y1 = u
-            x2, y2 = v
-            return math.hypot(x2 - x1, y2 - y1)
-        except (TypeError, ValueError):
-            return 0
+    if isinstance(G, CSRGraph):
+        return _bidirectional_astar_csr(
+            G, source, target, heuristic, max_nodes_expanded,
+            max_heuristic_distance, greedy, optimal, workspace, indexed_heap,
+        )
+
+    if workspace is not None:
+        workspace.check(G)
 
     if heuristic is None:
-        heuristic = _euclidean_heuristic
+        heuristic = cache(_euclidean_heuristic)
+
+    optimal = optimal and not greedy
 
     def h_forward(n):
         return heuristic(n, target)
@@ -118,41 +183,56 @@ def bidirectional_astar(
     def h_backward(n):
         return heuristic(n, source)
 
+    def p_forward(n):
+        return (heuristic(n, target) - heuristic(n, source)) / 2
+
+    h = [h_forward, h_backward]
+    # Averaged potentials: the backward potential is the negated forward one.
+    potential = [p_forward, lambda n: -p_forward(n)]
+
     weight_fn = _weight_function(G, weight)
 
     dist = [{}, {}]
     pred = [{}, {}]
     seen = [{source: 0}, {target: 0}]
-    fringe = [[], []]
     counter = count()
     visited_nodes = [set(), set()]
     frontier_sizes = []
+    stale_pops = 0
 
-    heapq.heappush(
-        fringe[0],
-        ((h_forward(source) if greedy else h_forward(source)), next(counter), source),
-    )
-    heapq.heappush(
-        fringe[1],
-        ((h_backward(target) if greedy else h_backward(target)), next(counter), target),
-    )
+    key = potential if optimal else h
+    if indexed_heap:
+        fringe = [IndexedHeap(), IndexedHeap()]
+        fringe[0].push(source, key[0](source))
+        fringe[1].push(target, key[1](target))
+    else:
+        fringe = [[], []]
+        heapq.heappush(fringe[0], (key[0](source), next(counter), source))
+        heapq.heappush(fringe[1], (key[1](target), next(counter), target))
 
     neighbors = [G._succ, G._pred] if G.is_directed() else [G._adj, G._adj]
     meeting_node = None
+    mu = float("inf")
 
     while fringe[0] and fringe[1]:
         f_cost_0 = fringe[0][0][0]
         f_cost_1 = fringe[1][0][0]
+        if optimal and f_cost_0 + f_cost_1 >= mu:
+            break
         direction = 0 if f_cost_0 <= f_cost_1 else 1
 
-        f_cost, _, curr = heapq.heappop(fringe[direction])
+        if indexed_heap:
+            f_cost, curr = fringe[direction].pop()
+        else:
+            f_cost, _, curr = heapq.heappop(fringe[direction])
         if curr in dist[direction]:
+            stale_pops += 1
             continue
 
         dist[direction][curr] = seen[direction][curr]
         visited_nodes[direction].add(curr)
 
-        if curr in seen[1 - direction]:
+        if not optimal and curr in seen[1 - direction]:
             meeting_node = curr
             break
 
@@ -166,10 +246,15 @@ def bidirectional_astar(
                 max_nodes_expanded is not None
                 and (len(visited_nodes[0]) + len(visited_nodes[1])) > max_nodes_expanded
         ):
+            if optimal and meeting_node is not None:
+                optimal = False
+                break  # budget spent: settle for the best meeting found so far
+            optimal = False
             greedy = True  # force fast greedy fallback
 
         frontier_sizes.append((len(fringe[0]), len(fringe[1])))
 
+        other_seen = seen[1 - direction]
         for nbr, edata in neighbors[direction][curr].items():
             cost = (
                 weight_fn(curr, nbr, edata)
@@ -184,9 +269,20 @@ def bidirectional_astar(
             if nbr not in seen[direction] or new_cost < seen[direction][nbr]:
                 seen[direction][nbr] = new_cost
                 pred[direction][nbr] = curr
-                heuristic_cost = h_forward(nbr) if direction == 0 else h_backward(nbr)
-                total_cost = heuristic_cost if greedy else new_cost + heuristic_cost
-                heapq.heappush(fringe[direction], (total_cost, next(counter), nbr))
+                if optimal:
+                    if nbr in other_seen and new_cost + other_seen[nbr] < mu:
+                        mu = new_cost + other_seen[nbr]
+                        meeting_node = nbr
+                    if new_cost + h[direction](nbr) >= mu:
+                        continue  # cannot lead to a path shorter than mu
+                    total_cost = new_cost + potential[direction](nbr)
+                else:
+                    heuristic_cost = h[direction](nbr)
+                    total_cost = heuristic_cost if greedy else new_cost + heuristic_cost
+                if indexed_heap:
+                    fringe[direction].push(nbr, total_cost)
+                else:
+                    heapq.heappush(fringe[direction], (total_cost, next(counter), nbr))
 
     if meeting_node is None:
         raise NetworkXNoPath(f"No path between {source} and {target}.")
@@ -216,7 +312,11 @@ def bidirectional_astar(
         "explored_percent": (len(visited_nodes[0]) + len(visited_nodes[1]))
                             / G.number_of_nodes()
                             * 100,
+        "optimal": optimal,
+        "stale_pops": stale_pops,
+        "max_heap_size": max((a + b for a, b in frontier_sizes), default=0),
     }
+    stats.update(_heap_counters(fringe, counter, indexed_heap))
 
     total_cost = 0
     for i in range(len(full_path) - 1):
@@ -224,3 +324,873 @@ def bidirectional_astar(
         total_cost += G[u][v].get(weight, 1)
 
     return (total_cost, full_path, stats)
+
+
+def _bidirectional_astar_csr(
+        G, source, target, heuristic, max_nodes_expanded, max_heuristic_distance, greedy,
+        optimal=True, workspace=None, indexed_heap=False,
+):
+    """Bidirectional A* over a CSRGraph snapshot, using integer node ids.
+
+    Mirrors the NetworkX implementation step for step, including the μ
+    stopping rule. Per-node state lives in the generation-stamped arrays of a
+    :class:`~Algorithms.workspace.SearchWorkspace`, so a reused workspace
+    makes the query allocation-free apart from the returned path.
+    """
+    ws = _workspace_for(G, workspace)
+    gen = ws.begin()
+    labels = G.nodes
+    s = G.index[source]
+    t = G.index[target]
+
+    if heuristic is None:
+        heuristic = _euclidean_heuristic
+
+    optimal = optimal and not greedy
+    h_goal = (target, source)
+
+    def h(direction, i):
+        if ws.h_stamp[direction][i] == gen:
+            return ws.h_value[direction][i]
+        value = heuristic(labels[i], h_goal[direction])
+        ws.h_value[direction][i] = value
+        ws.h_stamp[direction][i] = gen
+        return value
+
+    def potential(direction, i):
+        p_forward = (h(0, i) - h(1, i)) / 2
+        return p_forward if direction == 0 else -p_forward
+
+    key = potential if optimal else h
+
+    inf = float("inf")
+    seen, pred, stamp, settled = ws.dist, ws.pred, ws.stamp, ws.closed
+    for direction, root in ((0, s), (1, t)):
+        seen[direction][root] = 0
+        pred[direction][root] = -1
+        stamp[direction][root] = gen
+    expanded = [0, 0]
+
+    indptr = [G._succ_ptr, G._pred_ptr]
+    indices = [G.succ_indices, G.pred_indices]
+    weights = [G.succ_weights, G.pred_weights]
+
+    counter = count()
+    if indexed_heap:
+        fringe = ws.indexed_heaps()
+        fringe[0].push(s, key(0, s))
+        fringe[1].push(t, key(1, t))
+    else:
+        fringe = ws.heap
+        fringe[0].append((key(0, s), next(counter), s))
+        fringe[1].append((key(1, t), next(counter), t))
+    meeting_node = -1
+    mu = inf
+    stale_pops = 0
+    max_heap_size = 0
+
+    while fringe[0] and fringe[1]:
+        if optimal and fringe[0][0][0] + fringe[1][0][0] >= mu:
+            break
+        direction = 0 if fringe[0][0][0] <= fringe[1][0][0] else 1
+        size = len(fringe[0]) + len(fringe[1])
+        if size > max_heap_size:
+            max_heap_size = size
+        if indexed_heap:
+            _, curr = fringe[direction].pop()
+        else:
+            _, _, curr = heapq.heappop(fringe[direction])
+        done = settled[direction]
+        if done[curr] == gen:
+            stale_pops += 1
+            continue
+        done[curr] = gen
+        expanded[direction] += 1
+
+        other, other_stamp = seen[1 - direction], stamp[1 - direction]
+        if not optimal and other_stamp[curr] == gen:
+            meeting_node = curr
+            break
+
+        if (
+                max_heuristic_distance is not None
+                and heuristic(source, target) > max_heuristic_distance
+        ):
+            raise NetworkXNoPath("Path exceeds max heuristic distance.")
+
+        if max_nodes_expanded is not None and expanded[0] + expanded[1] > max_nodes_expanded:
+            if optimal and meeting_node >= 0:
+                optimal = False
+                break  # budget spent: settle for the best meeting found so far
+            optimal = False
+            greedy = True  # force fast greedy fallback
+
+        dist, parent, dist_stamp = seen[direction], pred[direction], stamp[direction]
+        g_curr = dist[curr]
+        start, end = indptr[direction][curr], indptr[direction][curr + 1]
+        for nbr, cost in zip(
+                indices[direction][start:end].tolist(),
+                weights[direction][start:end].tolist(),
+        ):
+            if done[nbr] == gen:
+                continue
+            new_cost = g_curr + (0 if greedy else cost)
+            if dist_stamp[nbr] != gen or new_cost < dist[nbr]:
+                dist[nbr] = new_cost
+                parent[nbr] = curr
+                dist_stamp[nbr] = gen
+                if optimal:
+                    if other_stamp[nbr] == gen and new_cost + other[nbr] < mu:
+                        mu = new_cost + other[nbr]
+                        meeting_node = nbr
+                    if new_cost + h(direction, nbr) >= mu:
+                        continue  # cannot lead to a path shorter than mu
+                    priority = new_cost + potential(direction, nbr)
+                else:
+                    heuristic_cost = h(direction, nbr)
+                    priority = heuristic_cost if greedy else new_cost + heuristic_cost
+                if indexed_heap:
+                    fringe[direction].push(nbr, priority)
+                else:
+                    heapq.heappush(fringe[direction], (priority, next(counter), nbr))
+
+    if meeting_node < 0:
+        raise NetworkXNoPath(f"No path between {source} and {target}.")
+
+    path = _join_csr_paths(pred, meeting_node)
+    stats = {
+        "nodes_expanded_forward": expanded[0],
+        "nodes_expanded_backward": expanded[1],
+        "total_nodes_expanded": expanded[0] + expanded[1],
+        "explored_percent": (expanded[0] + expanded[1]) / len(labels) * 100,
+        "optimal": optimal,
+        "stale_pops": stale_pops,
+        "max_heap_size": max_heap_size,
+    }
+    stats.update(_heap_counters(fringe, counter, indexed_heap))
+    return (G.path_cost(path), G.path_labels(path), stats)
+
+
+def _heap_counters(fringe, counter, indexed_heap):
+    """Push and decrease-key totals of the two frontiers."""
+    if indexed_heap:
+        return {
+            "heap_pushes": fringe[0].pushes + fringe[1].pushes,
+            "decrease_keys": fringe[0].decreases + fringe[1].decreases,
+        }
+    return {"heap_pushes": next(counter), "decrease_keys": 0}
+
+
+def _join_csr_paths(pred, meeting_node):
+    """Joins the forward and backward predecessor chains at `meeting_node`."""
+    path = []
+    node = meeting_node
+    while node >= 0:
+        path.append(node)
+        node = pred[0][node]
+    path.reverse()
+    node = pred[1][meeting_node]
+    while node >= 0:
+        path.append(node)
+        node = pred[1][node]
+    return path
+
+
+# === Anytime bidirectional A* ===
+
+
+@not_implemented_for("multigraph")
+def bidirectional_astar_anytime(
+        G,
+        source,
+        target,
+        heuristic=None,
+        weight="weight",
+        epsilon=3.0,
+        epsilon_step=0.5,
+        max_nodes_expanded=None,
+):
+    """Yields successively better paths with a proven suboptimality bound.
+
+    Runs an anytime repairing bidirectional A* (ARA*, Likhachev et al. 2003)
+    in both directions at once: every iteration orders each frontier by
+    ``g + epsilon * h``, stops when one side's smallest key reaches the best
+    meeting cost μ, and yields the best path found so far. `epsilon` is then
+    lowered by `epsilon_step` and the next iteration resumes from the
+    previous one: g-values are kept, and only the open nodes plus the nodes
+    whose cost improved after being expanded are re-examined.
+
+    Parameters
+    ----------
+    G : NetworkX graph or CSRGraph
+        The graph to search. On a CSRGraph `weight` is ignored.
+
+    source : node
+        Starting node for path
+
+    target : node
+        Ending node for path
+
+    heuristic : function, optional
+        Admissible estimate of the distance between two nodes, as in
+        :func:`bidirectional_astar`. The bounds are only valid if it is
+        consistent. Defaults to the Euclidean heuristic for 2D grid nodes.
+
+    weight : string or function, default="weight"
+        Edge weight specification, as in :func:`bidirectional_astar`.
+
+    epsilon : float, default=3.0
+        Heuristic inflation of the first iteration. A large value behaves
+        like the `greedy` mode of :func:`bidirectional_astar` but still
+        reports a bound.
+
+    epsilon_step : float, default=0.5
+        Amount by which `epsilon` is lowered after each iteration; it never
+        drops below 1.
+
+    max_nodes_expanded : int, optional
+        Total expansion budget over all iterations. When it is spent, the
+        best path found so far is yielded with its current bound and the
+        generator stops; if no path has been found yet, nothing is yielded.
+
+    Yields
+    ------
+    cost : float
+        Cost of the path.
+
+    path : list
+        Nodes from source to target.
+
+    bound : float
+        Upper bound on ``cost / optimal_cost``. The last tuple yielded when
+        the search runs to completion has a bound of 1.0.
+
+    Raises
+    ------
+    NodeNotFound
+        If source or target is not in G.
+
+    NetworkXNoPath
+        If no path exists between source and target.
+
+    ValueError
+        If `epsilon` is smaller than 1 or `epsilon_step` is not positive.
+
+    Examples
+    --------
+    >>> G = nx.grid_2d_graph(4, 4)
+    >>> for cost, path, bound in bidirectional_astar_anytime(G, (0, 0), (3, 3)):
+    ...     pass
+    >>> cost, bound
+    (6, 1.0)
+    """
+    if source not in G:
+        raise NodeNotFound(f"Source {source} is not in G")
+    if target not in G:
+        raise NodeNotFound(f"Target {target} is not in G")
+    if epsilon < 1:
+        raise ValueError("epsilon must be at least 1")
+    if epsilon_step <= 0:
+        raise ValueError("epsilon_step must be positive")
+    if source == target:
+        yield 0, [source], 1.0
+        return
+
+    if heuristic is None:
+        heuristic = _euclidean_heuristic
+
+    if isinstance(G, CSRGraph):
+        labels = G.nodes
+        roots = (G.index[source], G.index[target])
+
+        def expand(direction, u):
+            return G.successors(u) if direction == 0 else G.predecessors(u)
+
+        def estimate(direction, u):
+            return heuristic(labels[u], target if direction == 0 else source)
+
+        def finish(path):
+            return G.path_cost(path), G.path_labels(path)
+
+    else:
+        weight_fn = _weight_function(G, weight)
+        adjacency = [G._succ, G._pred] if G.is_directed() else [G._adj, G._adj]
+        roots = (source, target)
+
+        def expand(direction, u):
+            for v, edata in adjacency[direction][u].items():
+                cost = weight_fn(u, v, edata) if direction == 0 else weight_fn(v, u, edata)
+                if cost is not None:
+                    yield v, cost
+
+        def estimate(direction, u):
+            return heuristic(u, target if direction == 0 else source)
+
+        def finish(path):
+            return sum(weight_fn(u, v, G[u][v]) for u, v in zip(path, path[1:])), path
+
+    yield from _anytime_search(
+        roots, expand, cache(estimate), finish, epsilon, epsilon_step, max_nodes_expanded
+    )
+
+
+def _anytime_search(roots, expand, estimate, finish, epsilon, epsilon_step, max_nodes_expanded):
+    """Graph-agnostic core of :func:`bidirectional_astar_anytime`."""
+    inf = float("inf")
+    g = [{roots[0]: 0}, {roots[1]: 0}]
+    pred = [{roots[0]: None}, {roots[1]: None}]
+    # Per direction: nodes waiting in the heap, nodes expanded in the current
+    # iteration, and nodes whose g improved after they were expanded.
+    opened = [{roots[0]}, {roots[1]}]
+    closed = [set(), set()]
+    incons = [set(), set()]
+    fringe = [[], []]
+    counter = count()
+    mu = inf
+    meeting_node = None
+    expanded = 0
+    reported = (inf, inf)
+
+    def top(direction):
+        heap = fringe[direction]
+        while heap and heap[0][2] not in opened[direction]:
+            heapq.heappop(heap)
+        return heap[0][0] if heap else inf
+
+    def lower_bound():
+        # min(g + h) over OPEN and INCONS bounds the optimal cost from below.
+        best = 0
+        for direction in (0, 1):
+            side = min(
+                (g[direction][u] + estimate(direction, u)
+                 for u in opened[direction] | incons[direction]),
+                default=inf,
+            )
+            best = max(best, side)
+        return best
+
+    def join(node):
+        forward = []
+        while node is not None:
+            forward.append(node)
+            node = pred[0][node]
+        forward.reverse()
+        node = pred[1][forward[-1]]
+        while node is not None:
+            forward.append(node)
+            node = pred[1][node]
+        return forward
+
+    while True:
+        for direction in (0, 1):
+            opened[direction] |= incons[direction]
+            incons[direction].clear()
+            closed[direction].clear()
+            fringe[direction] = [
+                (g[direction][u] + epsilon * estimate(direction, u), next(counter), u)
+                for u in opened[direction]
+            ]
+            heapq.heapify(fringe[direction])
+
+        exhausted = False
+        while True:
+            top_0, top_1 = top(0), top(1)
+            if max(top_0, top_1) >= mu or min(top_0, top_1) == inf:
+                break
+            if max_nodes_expanded is not None and expanded >= max_nodes_expanded:
+                exhausted = True
+                break
+            direction = 0 if top_0 <= top_1 else 1
+            _, _, u = heapq.heappop(fringe[direction])
+            opened[direction].discard(u)
+            closed[direction].add(u)
+            expanded += 1
+
+            dist, parent, other = g[direction], pred[direction], g[1 - direction]
+            g_u = dist[u]
+            for v, cost in expand(direction, u):
+                new_cost = g_u + cost
+                if new_cost < dist.get(v, inf):
+                    dist[v] = new_cost
+                    parent[v] = u
+                    if v in other and new_cost + other[v] < mu:
+                        mu = new_cost + other[v]
+                        meeting_node = v
+                    if v in closed[direction]:
+                        incons[direction].add(v)
+                    else:
+                        opened[direction].add(v)
+                        key = new_cost + epsilon * estimate(direction, v)
+                        heapq.heappush(fringe[direction], (key, next(counter), v))
+
+        if meeting_node is None:
+            if exhausted:
+                return
+            raise NetworkXNoPath("No path between the given source and target.")
+
+        cost, path = finish(join(meeting_node))
+        mu = min(mu, cost)
+        floor = lower_bound()
+        bound = mu / floor if floor > 0 else inf
+        if not exhausted:
+            bound = min(bound, epsilon)  # the iteration ran to completion
+        bound = max(bound, 1.0)
+        bound = min(bound, reported[1])
+        if (cost, bound) != reported:
+            reported = (cost, bound)
+            yield cost, path, bound
+        if exhausted or bound <= 1.0:
+            return
+        epsilon = max(1.0, epsilon - epsilon_step)
+
+
+# === Many-to-many batch queries ===
+
+
+class _SearchTree:
+    """Resumable Dijkstra tree rooted at one endpoint shared by many pairs.
+
+    The tree only grows as far as the queries answered so far required, and
+    its settled distances are exact, so later queries towards the same root
+    can stop as soon as they touch the settled region.
+    """
+
+    def __init__(self, root, indptr, indices, weights):
+        self.root = root
+        self.indptr = indptr
+        self.indices = indices
+        self.weights = weights
+        self.dist = {}
+        self.seen = {root: 0.0}
+        self.pred = {}
+        self.heap = [(0.0, root)]
+
+    def top(self):
+        heap, dist = self.heap, self.dist
+        while heap and heap[0][1] in dist:
+            heapq.heappop(heap)
+        return heap[0][0] if heap else float("inf")
+
+    def step(self):
+        d, node = heapq.heappop(self.heap)
+        self.dist[node] = d
+        seen, pred, dist = self.seen, self.pred, self.dist
+        start, end = self.indptr[node], self.indptr[node + 1]
+        for nbr, w in zip(
+                self.indices[start:end].tolist(), self.weights[start:end].tolist()
+        ):
+            if nbr in dist:
+                continue
+            new_d = d + w
+            if new_d < seen.get(nbr, float("inf")):
+                seen[nbr] = new_d
+                pred[nbr] = node
+                heapq.heappush(self.heap, (new_d, nbr))
+        return node
+
+    def chain(self, node):
+        """Nodes from `node` to the root, following the tree."""
+        path = [node]
+        while node != self.root:
+            node = self.pred[node]
+            path.append(node)
+        return path
+
+
+def _batch_query(tree, origin, h_root, indptr, indices, weights):
+    """A* from `origin` towards the root of `tree`, growing the tree on demand.
+
+    The query uses ``max(h, tree.top())`` as its heuristic on nodes the tree
+    has not settled yet and the exact tree distance on settled ones; both
+    are admissible. It stops once either side's smallest key reaches the best
+    meeting cost μ (Pohl's bidirectional criterion).
+    """
+    inf = float("inf")
+    g = {origin: 0.0}
+    pred = {}
+    mu = tree.seen.get(origin, inf)
+    meet = origin if mu < inf else None
+    tree_dist, tree_seen = tree.dist, tree.seen
+
+    def estimate(n):
+        if n in tree_dist:
+            return tree_dist[n]
+        return max(h_root(n), tree.top())
+
+    counter = count()
+    heap = [(estimate(origin), next(counter), 0.0, origin)]
+    expanded = 0
+
+    while True:
+        top_query = heap[0][0] if heap else inf
+        top_tree = tree.top()
+        if max(top_query, top_tree) >= mu:
+            break
+        if top_query <= top_tree:
+            _, _, g_node, node = heapq.heappop(heap)
+            if g_node > g[node]:
+                continue
+            expanded += 1
+            start, end = indptr[node], indptr[node + 1]
+            for nbr, w in zip(indices[start:end].tolist(), weights[start:end].tolist()):
+                new_g = g_node + w
+                if new_g < g.get(nbr, inf):
+                    g[nbr] = new_g
+                    pred[nbr] = node
+                    if nbr in tree_seen and new_g + tree_seen[nbr] < mu:
+                        mu = new_g + tree_seen[nbr]
+                        meet = nbr
+                    key = new_g + estimate(nbr)
+                    if key < mu:
+                        heapq.heappush(heap, (key, next(counter), new_g, nbr))
+        else:
+            node = tree.step()
+            if node in g and g[node] + tree_dist[node] < mu:
+                mu = g[node] + tree_dist[node]
+                meet = node
+
+    if meet is None:
+        return inf, None, expanded
+    path = [meet]
+    node = meet
+    while node != origin:
+        node = pred[node]
+        path.append(node)
+    path.reverse()
+    return mu, path + tree.chain(meet)[1:], expanded
+
+
+@not_implemented_for("multigraph")
+def bidirectional_astar_batch(G, pairs, heuristic=None, weight="weight", return_paths=False):
+    """Computes shortest-path costs for many (source, target) pairs at once.
+
+    Pairs are grouped by their shared endpoint: each target (or source, when
+    sources repeat more often) gets one resumable search tree that is grown
+    only as far as needed and reused by every pair in its group, while each
+    pair runs a bidirectional A* against that tree from its other endpoint.
+
+    Parameters
+    ----------
+    G : NetworkX graph or CSRGraph
+        The graph to search. A NetworkX graph is compiled once into a
+        :class:`~Algorithms.csr_graph.CSRGraph` snapshot for the whole batch.
+
+    pairs : iterable of (source, target)
+        The origin/destination pairs to answer.
+
+    heuristic : function, optional
+        A function estimating the distance between two nodes, as in
+        :func:`bidirectional_astar`. It must be admissible for the costs to
+        be optimal. Defaults to the Euclidean heuristic for 2D grid nodes.
+
+    weight : string or function, default="weight"
+        Edge weight specification, used when compiling a NetworkX graph.
+
+    return_paths : bool, default=False
+        If True, also return the node path of every pair.
+
+    Returns
+    -------
+    costs : numpy.ndarray
+        Matrix of shape ``(len(stats["sources"]), len(stats["targets"]))``.
+        Requested pairs hold their shortest-path cost, or ``inf`` if the
+        target is unreachable; pairs that were not requested hold ``nan``.
+
+    paths : dict or None
+        ``{(source, target): path}`` for every requested pair, with None for
+        unreachable pairs, if `return_paths` is True.
+
+    stats : dict
+        - sources, targets: row and column labels of `costs`
+        - pairs: number of distinct pairs answered
+        - trees_built: number of shared search trees
+        - tree_nodes_settled: nodes settled by the shared trees
+        - query_nodes_expanded: nodes expanded by the per-pair searches
+
+    Raises
+    ------
+    NodeNotFound
+        If any source or target is not in the graph.
+
+    Examples
+    --------
+    >>> G = nx.path_graph(5)
+    >>> costs, paths, stats = bidirectional_astar_batch(
+    ...     G, [(0, 4), (1, 4), (0, 2)], return_paths=True
+    ... )
+    >>> stats["sources"], stats["targets"]
+    ([0, 1], [4, 2])
+    >>> costs.tolist()
+    [[4.0, 2.0], [3.0, nan]]
+    >>> paths[(1, 4)]
+    [1, 2, 3, 4]
+    """
+    C = G if isinstance(G, CSRGraph) else to_csr_graph(G, weight)
+    if heuristic is None:
+        heuristic = _euclidean_heuristic
+    labels = C.nodes
+
+    pairs = list(dict.fromkeys((s, t) for s, t in pairs))
+    sources = list(dict.fromkeys(s for s, _ in pairs))
+    targets = list(dict.fromkeys(t for _, t in pairs))
+    row = {s: i for i, s in enumerate(sources)}
+    col = {t: j for j, t in enumerate(targets)}
+    for node in (*sources, *targets):
+        C.node_id(node)
+
+    # Group every pair under the endpoint it shares with the most other pairs.
+    source_count = Counter(s for s, _ in pairs)
+    target_count = Counter(t for _, t in pairs)
+    groups = {}
+    for s, t in pairs:
+        root = ("target", t) if target_count[t] >= source_count[s] else ("source", s)
+        groups.setdefault(root, []).append((s, t))
+
+    costs = np.full((len(sources), len(targets)), np.nan)
+    paths = {} if return_paths else None
+    stats = {
+        "sources": sources,
+        "targets": targets,
+        "pairs": len(pairs),
+        "trees_built": 0,
+        "tree_nodes_settled": 0,
+        "query_nodes_expanded": 0,
+    }
+
+    forward = (C._succ_ptr, C.succ_indices, C.succ_weights)
+    backward = (C._pred_ptr, C.pred_indices, C.pred_weights)
+
+    for (side, root_label), group in groups.items():
+        root = C.index[root_label]
+        if side == "target":
+            # Tree grows backwards from the target; queries run forwards.
+            tree = _SearchTree(root, *backward)
+            query_arrays = forward
+        else:
+            tree = _SearchTree(root, *forward)
+            query_arrays = backward
+        stats["trees_built"] += 1
+
+        def h_root(n, root_label=root_label):
+            return heuristic(labels[n], root_label)
+
+        for s, t in group:
+            origin = C.index[s if side == "target" else t]
+            cost, path, expanded = _batch_query(tree, origin, h_root, *query_arrays)
+            stats["query_nodes_expanded"] += expanded
+            costs[row[s], col[t]] = cost
+            if return_paths:
+                if path is not None and side == "source":
+                    path.reverse()
+                paths[(s, t)] = None if path is None else C.path_labels(path)
+
+        stats["tree_nodes_settled"] += len(tree.dist)
+
+    return costs, paths, stats
+
+
+# === k shortest loopless paths ===
+
+
+def _spur_query(tree, origin, h_root, indptr, indices, weights, blocked, banned_next):
+    """A* from `origin` towards the root of `tree` on a masked graph.
+
+    `blocked` is a node mask (bytearray) and `banned_next` the set of
+    successors of `origin` that may not be used first. Settled tree
+    distances ignore the masks, so they stay admissible estimates; a tree
+    branch is only joined to the query when it avoids every masked node.
+    Returns ``(cost, path_ids, nodes_expanded)`` with ``cost = inf`` and
+    ``path_ids = None`` when the masked graph has no path.
+    """
+    inf = float("inf")
+    root = tree.root
+    tree_dist, tree_pred = tree.dist, tree.pred
+    clean = {root: True, origin: False}
+
+    def joinable(node):
+        # True if the tree branch from `node` to the root avoids the masks.
+        branch = []
+        while node not in clean:
+            if blocked[node] or node not in tree_dist:
+                clean[node] = False
+                break
+            branch.append(node)
+            node = tree_pred[node]
+        ok = clean[node]
+        for n in branch:
+            clean[n] = ok
+        return ok
+
+    def estimate(n):
+        if n in tree_dist:
+            return tree_dist[n]
+        return max(h_root(n), tree.top())
+
+    g = {origin: 0.0}
+    pred = {}
+    mu = inf
+    meet = None
+    counter = count()
+    heap = [(estimate(origin), next(counter), 0.0, origin)]
+    expanded = 0
+
+    while heap and heap[0][0] < mu:
+        if tree.top() < heap[0][0]:
+            node = tree.step()
+            if node in g and g[node] + tree_dist[node] < mu and joinable(node):
+                mu = g[node] + tree_dist[node]
+                meet = node
+            continue
+        _, _, g_node, node = heapq.heappop(heap)
+        if g_node > g[node]:
+            continue
+        expanded += 1
+        start, end = indptr[node], indptr[node + 1]
+        for nbr, w in zip(indices[start:end].tolist(), weights[start:end].tolist()):
+            if blocked[nbr] or (node == origin and nbr in banned_next):
+                continue
+            new_g = g_node + w
+            if new_g < g.get(nbr, inf):
+                g[nbr] = new_g
+                pred[nbr] = node
+                if nbr in tree_dist and new_g + tree_dist[nbr] < mu and joinable(nbr):
+                    mu = new_g + tree_dist[nbr]
+                    meet = nbr
+                key = new_g + estimate(nbr)
+                if key < mu:
+                    heapq.heappush(heap, (key, next(counter), new_g, nbr))
+
+    if meet is None:
+        return inf, None, expanded
+    path = [meet]
+    node = meet
+    while node != origin:
+        node = pred[node]
+        path.append(node)
+    path.reverse()
+    return mu, path + tree.chain(meet)[1:], expanded
+
+
+@not_implemented_for("multigraph")
+def bidirectional_astar_k_shortest(G, source, target, k=3, heuristic=None, weight="weight"):
+    """Returns up to `k` shortest loopless paths from source to target.
+
+    Implements Yen's algorithm. Every spur path is found by an A* search from
+    the spur node that meets a single backward search tree rooted at the
+    target; the tree is grown on demand and shared by all spur searches, and
+    the root-path nodes and already-used deviation edges are excluded with
+    masks instead of removing them from a copy of the graph.
+
+    Parameters
+    ----------
+    G : NetworkX graph or CSRGraph
+        The graph to search. A NetworkX graph is compiled once into a
+        :class:`~Algorithms.csr_graph.CSRGraph` snapshot.
+
+    source : node
+        Starting node for the paths
+
+    target : node
+        Ending node for the paths
+
+    k : int, default=3
+        Number of paths to return.
+
+    heuristic : function, optional
+        Admissible estimate of the distance between two nodes, as in
+        :func:`bidirectional_astar`. Defaults to the Euclidean heuristic for
+        2D grid nodes.
+
+    weight : string or function, default="weight"
+        Edge weight specification, used when compiling a NetworkX graph.
+
+    Returns
+    -------
+    routes : list of (cost, path, stats)
+        Paths in order of non-decreasing cost; fewer than `k` if the graph
+        has fewer loopless paths. Each stats dict holds:
+        - spur_node: node where the path leaves an earlier path (None for
+          the first path)
+        - root_length: number of nodes shared with that earlier path
+        - nodes_expanded: nodes expanded by the spur search that found it
+        - tree_nodes_settled: size of the shared target tree at that point
+
+    Raises
+    ------
+    NodeNotFound
+        If source or target is not in G.
+
+    NetworkXNoPath
+        If no path exists between source and target.
+
+    ValueError
+        If `k` is smaller than 1.
+
+    Examples
+    --------
+    >>> G = nx.cycle_graph(6)
+    >>> [(cost, path) for cost, path, _ in bidirectional_astar_k_shortest(G, 0, 3, k=3)]
+    [(3.0, [0, 1, 2, 3]), (3.0, [0, 5, 4, 3])]
+    """
+    if k < 1:
+        raise ValueError("k must be at least 1")
+    C = G if isinstance(G, CSRGraph) else to_csr_graph(G, weight)
+    s = C.node_id(source)
+    t = C.node_id(target)
+    if heuristic is None:
+        heuristic = _euclidean_heuristic
+    labels = C.nodes
+
+    def h_root(n):
+        return heuristic(labels[n], target)
+
+    tree = _SearchTree(t, C._pred_ptr, C.pred_indices, C.pred_weights)
+    forward = (C._succ_ptr, C.succ_indices, C.succ_weights)
+    blocked = bytearray(C.number_of_nodes())
+
+    if s == t:
+        return [(0.0, [source], {"spur_node": None, "root_length": 0,
+                                 "nodes_expanded": 0, "tree_nodes_settled": 0})]
+
+    cost, path, expanded = _spur_query(tree, s, h_root, *forward, blocked, set())
+    if path is None:
+        raise NetworkXNoPath(f"No path between {source} and {target}.")
+
+    accepted = [(cost, path, {"spur_node": None, "root_length": 0,
+                              "nodes_expanded": expanded,
+                              "tree_nodes_settled": len(tree.dist)})]
+    candidates = []
+    known = {tuple(path)}
+    counter = count()
+
+    while len(accepted) < k:
+        _, last, _ = accepted[-1]
+        root_cost = 0.0
+        for i in range(len(last) - 1):
+            spur = last[i]
+            root = last[: i + 1]
+            banned_next = {p[i + 1] for _, p, _ in accepted if p[: i + 1] == root}
+            for node in root[:-1]:
+                blocked[node] = 1
+            spur_cost, spur_path, expanded = _spur_query(
+                tree, spur, h_root, *forward, blocked, banned_next
+            )
+            for node in root[:-1]:
+                blocked[node] = 0
+            if spur_path is not None:
+                path = root[:-1] + spur_path
+                if tuple(path) not in known:
+                    known.add(tuple(path))
+                    stats = {"spur_node": labels[spur], "root_length": i + 1,
+                             "nodes_expanded": expanded,
+                             "tree_nodes_settled": len(tree.dist)}
+                    heapq.heappush(
+                        candidates, (root_cost + spur_cost, next(counter), path, stats)
+                    )
+            root_cost += C.edge_weight(last[i], last[i + 1])
+        if not candidates:
+            break
+        cost, _, path, stats = heapq.heappop(candidates)
+        accepted.append((cost, path, stats))
+
+    return [(C.path_cost(path), C.path_labels(path), stats) for _, path, stats in accepted]
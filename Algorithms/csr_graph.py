@@ -0,0 +1,283 @@
+"""Compiled, read-only CSR (compressed sparse row) snapshots of NetworkX graphs."""
+
+import numpy as np
+
+import networkx as nx
+from networkx.algorithms.shortest_paths.weighted import _weight_function
+from networkx.exception import NodeNotFound
+from networkx.utils.decorators import not_implemented_for
+
+__all__ = ["CSRGraph", "to_csr_graph"]
+
+
+class CSRGraph:
+    """
+    Integer-indexed, read-only snapshot of a weighted graph.
+
+    Node labels are interned to consecutive integer ids and the adjacency is
+    stored as NumPy ``indptr``/``indices``/``weights`` arrays, once for the
+    successors and once for the predecessors of every node. The search
+    algorithms in this package accept a ``CSRGraph`` wherever they accept a
+    NetworkX graph and map their results back to the original node labels.
+
+    Attributes
+    ----------
+    nodes : list
+        Node labels, indexed by node id.
+    index : dict
+        Mapping from node label to node id.
+    weight : str or function
+        The weight specification the snapshot was compiled with.
+    succ_indptr, succ_indices, succ_weights : numpy.ndarray
+        Outgoing edges. The successors of node ``i`` are
+        ``succ_indices[succ_indptr[i]:succ_indptr[i + 1]]``, sorted by id.
+    pred_indptr, pred_indices, pred_weights : numpy.ndarray
+        Incoming edges, laid out like the successor arrays. For undirected
+        graphs these are the same arrays as the successor ones.
+    """
+
+    def __init__(
+            self,
+            nodes,
+            succ_indptr,
+            succ_indices,
+            succ_weights,
+            pred_indptr=None,
+            pred_indices=None,
+            pred_weights=None,
+            directed=True,
+            weight="weight",
+    ):
+        self.nodes = list(nodes)
+        self.index = {node: i for i, node in enumerate(self.nodes)}
+        self.weight = weight
+        self.directed = directed
+
+        self.succ_indptr = _frozen(succ_indptr, np.int64)
+        self.succ_indices = _frozen(succ_indices, np.int64)
+        self.succ_weights = _frozen(succ_weights, np.float64)
+        if directed:
+            self.pred_indptr = _frozen(pred_indptr, np.int64)
+            self.pred_indices = _frozen(pred_indices, np.int64)
+            self.pred_weights = _frozen(pred_weights, np.float64)
+        else:
+            self.pred_indptr = self.succ_indptr
+            self.pred_indices = self.succ_indices
+            self.pred_weights = self.succ_weights
+
+        # Python-level copy of the row pointers: hot loops index it far
+        # faster than they index a NumPy array.
+        self._succ_ptr = self.succ_indptr.tolist()
+        self._pred_ptr = self.pred_indptr.tolist() if directed else self._succ_ptr
+
+    @classmethod
+    def from_edge_arrays(cls, n, rows, cols, weights, nodes=None, directed=True, weight="weight"):
+        """
+        Builds a snapshot straight from parallel edge arrays, without a
+        NetworkX graph.
+
+        Parameters
+        ----------
+        n : int
+            Number of nodes; node ids are ``0 .. n - 1``.
+        rows, cols : array_like of int
+            Tail and head id of every edge. For an undirected snapshot every
+            edge must be listed in both directions, a self-loop only once.
+        weights : array_like of float
+            Weight of every edge.
+        nodes : iterable, optional
+            Node labels indexed by node id. Defaults to the ids themselves.
+        directed : bool, optional (default=True)
+            Whether the edges are directed.
+        weight : str or function, optional (default='weight')
+            Recorded as the snapshot's weight specification.
+
+        Returns
+        -------
+        CSRGraph
+
+        Raises
+        ------
+        ValueError
+            If the arrays differ in length, `nodes` does not hold `n` labels,
+            or an id lies outside ``0 .. n - 1``.
+
+        Examples
+        --------
+        >>> C = CSRGraph.from_edge_arrays(3, [0, 1], [1, 2], [2.0, 3.0])
+        >>> C.number_of_edges(), C.edge_weight(1, 2)
+        (2, 3.0)
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        cols = np.asarray(cols, dtype=np.int64)
+        weights = np.asarray(weights, dtype=np.float64)
+        nodes = range(n) if nodes is None else list(nodes)
+        if not len(rows) == len(cols) == len(weights):
+            raise ValueError("rows, cols and weights must have the same length")
+        if len(nodes) != n:
+            raise ValueError(f"Expected {n} node labels, got {len(nodes)}")
+        if len(rows) and (min(rows.min(), cols.min()) < 0 or max(rows.max(), cols.max()) >= n):
+            raise ValueError(f"Node ids must lie in 0 .. {n - 1}")
+
+        succ = _compress(n, rows, cols, weights)
+        if not directed:
+            return cls(nodes, *succ, directed=False, weight=weight)
+        pred = _compress(n, cols, rows, weights)
+        return cls(nodes, *succ, *pred, directed=True, weight=weight)
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def __contains__(self, node):
+        try:
+            return node in self.index
+        except TypeError:
+            return False
+
+    def __iter__(self):
+        return iter(self.nodes)
+
+    def __repr__(self):
+        kind = "directed" if self.directed else "undirected"
+        return (
+            f"CSRGraph({kind}, {self.number_of_nodes()} nodes, "
+            f"{self.number_of_edges()} edges)"
+        )
+
+    def is_directed(self):
+        return self.directed
+
+    def is_multigraph(self):
+        return False
+
+    def number_of_nodes(self):
+        return len(self.nodes)
+
+    def number_of_edges(self):
+        m = len(self.succ_indices)
+        if self.directed:
+            return m
+        # An undirected edge is stored in both rows, except a self-loop,
+        # which is stored once in its own row.
+        rows = np.repeat(np.arange(len(self.nodes)), np.diff(self.succ_indptr))
+        loops = int(np.count_nonzero(self.succ_indices == rows))
+        return (m + loops) // 2
+
+    def node_id(self, node):
+        """Returns the integer id of `node`, raising NodeNotFound if absent."""
+        try:
+            return self.index[node]
+        except (KeyError, TypeError):
+            raise NodeNotFound(f"Node {node} is not in the graph") from None
+
+    def successors(self, i):
+        """Returns an iterator of ``(neighbor_id, weight)`` for edges leaving `i`."""
+        start, end = self._succ_ptr[i], self._succ_ptr[i + 1]
+        return zip(
+            self.succ_indices[start:end].tolist(),
+            self.succ_weights[start:end].tolist(),
+        )
+
+    def predecessors(self, i):
+        """Returns an iterator of ``(neighbor_id, weight)`` for edges entering `i`."""
+        start, end = self._pred_ptr[i], self._pred_ptr[i + 1]
+        return zip(
+            self.pred_indices[start:end].tolist(),
+            self.pred_weights[start:end].tolist(),
+        )
+
+    def edge_position(self, u, v, reverse=False):
+        """
+        Returns the offset of edge (u, v) in the successor arrays, or of the
+        entry for `u` in the predecessor row of `v` when `reverse` is True.
+        Returns -1 if the edge does not exist.
+        """
+        if reverse:
+            u, v = v, u
+            ptr, indices = self._pred_ptr, self.pred_indices
+        else:
+            ptr, indices = self._succ_ptr, self.succ_indices
+        start, end = ptr[u], ptr[u + 1]
+        pos = start + int(np.searchsorted(indices[start:end], v))
+        if pos < end and indices[pos] == v:
+            return pos
+        return -1
+
+    def edge_weight(self, u, v):
+        """Returns the weight of edge (u, v) given as node ids, or None."""
+        pos = self.edge_position(u, v)
+        return None if pos < 0 else float(self.succ_weights[pos])
+
+    def path_labels(self, path):
+        """Maps a list of node ids back to node labels."""
+        nodes = self.nodes
+        return [nodes[i] for i in path]
+
+    def path_cost(self, path):
+        """Returns the summed weight of a path given as node ids."""
+        return sum(self.edge_weight(u, v) for u, v in zip(path, path[1:]))
+
+
+def _frozen(values, dtype):
+    arr = np.ascontiguousarray(values, dtype=dtype)
+    arr.flags.writeable = False
+    return arr
+
+
+def _compress(n, rows, cols, weights):
+    order = np.lexsort((cols, rows))
+    rows, cols, weights = rows[order], cols[order], weights[order]
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=n), out=indptr[1:])
+    return indptr, cols, weights
+
+
+@not_implemented_for("multigraph")
+def to_csr_graph(G, weight="weight"):
+    """
+    Compiles `G` into a read-only, integer-indexed :class:`CSRGraph`.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+        A directed or undirected graph.
+
+    weight : string or function, optional (default='weight')
+        If a string, edge weights are read from this edge attribute, with
+        a default of 1 when the attribute is missing. If a function, it must
+        accept ``(u, v, edge_data)`` and return a number, or None to hide the
+        edge; hidden edges are left out of the snapshot.
+
+    Returns
+    -------
+    CSRGraph
+        The compiled snapshot. Later changes to `G` are not reflected in it.
+
+    Examples
+    --------
+    >>> G = nx.path_graph(4)
+    >>> C = to_csr_graph(G)
+    >>> C.number_of_nodes(), C.number_of_edges()
+    (4, 3)
+    >>> list(C.successors(C.node_id(1)))
+    [(0, 1.0), (2, 1.0)]
+    """
+    nodes = list(G)
+    index = {node: i for i, node in enumerate(nodes)}
+    n = len(nodes)
+    weight_fn = _weight_function(G, weight)
+
+    rows, cols, weights = [], [], []
+    for u, nbrs in G._adj.items():
+        iu = index[u]
+        for v, data in nbrs.items():
+            w = weight_fn(u, v, data)
+            if w is None:
+                continue
+            rows.append(iu)
+            cols.append(index[v])
+            weights.append(w)
+
+    return CSRGraph.from_edge_arrays(
+        n, rows, cols, weights, nodes=nodes, directed=G.is_directed(), weight=weight
+    )
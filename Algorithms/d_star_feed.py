@@ -0,0 +1,209 @@
+"""Asynchronous, coalescing edge-update feed for live D* Lite planners."""
+
+import asyncio
+import csv
+import time
+
+import numpy as np
+
+__all__ = ["DStarLiteFeed"]
+
+_STOP = object()
+
+
+class DStarLiteFeed:
+    """
+    Applies a stream of edge weight updates to one or more D* Lite instances.
+
+    Updates are submitted from producers running in the same event loop (or
+    read from a file with :meth:`follow_file`). :meth:`run` waits for an
+    update, keeps collecting for `window` seconds, collapses repeated updates
+    of the same edge to the latest weight, and hands the batch to every
+    instance with a single ``modify_edges`` call. A new path is published
+    only when it differs from the last one published for that instance.
+
+    Replanning runs on the event loop thread: instances are not thread-safe
+    and each batch is a short, CPU-bound step.
+
+    Parameters
+    ----------
+    instances : DStarLite or dict
+        A single instance, or a mapping from a name to each instance.
+    window : float, optional (default=0.05)
+        Seconds to keep collecting after the first update of a batch. With
+        0, a batch holds whatever is already queued.
+    on_path : function(name, path), optional
+        Called with the instance name and its new path (None if the target
+        became unreachable) whenever the path changes. A single instance is
+        named None.
+
+    Attributes
+    ----------
+    latest : dict
+        Last published path per instance name.
+    latencies : list of float
+        Seconds from the submission of each update to the end of the
+        replanning pass that applied it, coalesced updates included.
+    batches, applied, coalesced, published, rejected : int
+        Batches replanned, distinct edge updates applied, updates superseded
+        by a later one for the same edge in the same batch, paths
+        published, and unparsable lines skipped by :meth:`follow_file`.
+    failed : int
+        Edge updates an instance raised on, e.g. an edge missing from a
+        CSRGraph snapshot, counted once per instance. They are dropped and
+        the feed keeps running.
+    last_error : Exception or None
+        The most recent of those errors.
+
+    Examples
+    --------
+    >>> import networkx as nx
+    >>> from Algorithms.d_star_lite import new_dstar_lite_instance
+    >>> G = nx.DiGraph([("A", "B", {"weight": 1}), ("B", "C", {"weight": 1}), ("A", "C", {"weight": 5})])
+    >>> feed = DStarLiteFeed(new_dstar_lite_instance(G, "A", "C"), window=0)
+    >>> async def demo():
+    ...     task = asyncio.create_task(feed.run())
+    ...     feed.submit("B", "C", 9)
+    ...     feed.submit("B", "C", 8)
+    ...     feed.close()
+    ...     await task
+    >>> asyncio.run(demo())
+    >>> feed.latest[None], feed.applied, feed.coalesced
+    (['A', 'C'], 1, 1)
+    """
+
+    def __init__(self, instances, window=0.05, on_path=None):
+        if window < 0:
+            raise ValueError("window must be non-negative")
+        self.instances = instances if isinstance(instances, dict) else {None: instances}
+        self.window = window
+        self.on_path = on_path
+        self.latest = {name: dstar.get_path() for name, dstar in self.instances.items()}
+        self.latencies = []
+        self.batches = 0
+        self.applied = 0
+        self.coalesced = 0
+        self.published = 0
+        self.rejected = 0
+        self.failed = 0
+        self.last_error = None
+        self._queue = None
+        self._closed = False
+
+    def _updates(self):
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        return self._queue
+
+    def submit(self, u, v, weight):
+        """Queues a new weight for edge (u, v) without blocking."""
+        if self._closed:
+            raise RuntimeError("feed is closed")
+        self._updates().put_nowait((u, v, weight, time.perf_counter()))
+
+    def close(self):
+        """Stops :meth:`run` once the updates queued so far are applied."""
+        if not self._closed:
+            self._closed = True
+            self._updates().put_nowait(_STOP)
+
+    async def run(self):
+        """Consumes updates in batches until :meth:`close` is called."""
+        queue = self._updates()
+        loop = asyncio.get_running_loop()
+        stop = False
+        while not stop:
+            item = await queue.get()
+            if item is _STOP:
+                break
+            batch, submitted = {}, []
+            deadline = loop.time() + self.window
+            while True:
+                u, v, weight, t = item
+                if (u, v) in batch:
+                    del batch[(u, v)]  # Re-inserted last so the newest update wins.
+                    self.coalesced += 1
+                batch[(u, v)] = weight
+                submitted.append(t)
+                remaining = deadline - loop.time()
+                try:
+                    if remaining > 0:
+                        item = await asyncio.wait_for(queue.get(), remaining)
+                    else:
+                        item = queue.get_nowait()
+                except (asyncio.TimeoutError, asyncio.QueueEmpty):
+                    break
+                if item is _STOP:
+                    stop = True
+                    break
+            self._apply(batch, submitted)
+
+    def _apply(self, batch, submitted):
+        updates = [(u, v, weight) for (u, v), weight in batch.items()]
+        for name, dstar in self.instances.items():
+            try:
+                dstar.modify_edges(updates)
+            except Exception:
+                # Retry one by one so that only the offending updates are lost.
+                for update in updates:
+                    try:
+                        dstar.modify_edges([update])
+                    except Exception as error:
+                        self.failed += 1
+                        self.last_error = error
+            path = dstar.get_path()
+            if path != self.latest[name]:
+                self.latest[name] = path
+                self.published += 1
+                if self.on_path is not None:
+                    self.on_path(name, path)
+        done = time.perf_counter()
+        self.latencies.extend(done - t for t in submitted)
+        self.batches += 1
+        self.applied += len(updates)
+
+    async def follow_file(self, path, poll_interval=0.05, from_start=False, node_type=str):
+        """
+        Tails a text file of ``u,v,weight`` lines and submits each new line,
+        until the feed is closed. Blank and unparsable lines are skipped and
+        counted in `rejected`.
+
+        Parameters
+        ----------
+        path : str or path-like
+            The file to follow.
+        poll_interval : float, optional (default=0.05)
+            Seconds to sleep when no new line is available.
+        from_start : bool, optional (default=False)
+            Read the lines already in the file instead of only new ones.
+        node_type : callable, optional (default=str)
+            Converts the node fields, e.g. ``int`` for integer-labelled graphs.
+        """
+        with open(path, newline="") as f:
+            if not from_start:
+                f.seek(0, 2)
+            pending = ""
+            while not self._closed:
+                chunk = f.readline()
+                if not chunk:
+                    await asyncio.sleep(poll_interval)
+                    continue
+                pending += chunk
+                if not pending.endswith("\n"):
+                    continue  # Partial line: wait for the writer to finish it.
+                line, pending = pending.strip(), ""
+                try:
+                    u, v, weight = next(csv.reader([line]))
+                    self.submit(node_type(u.strip()), node_type(v.strip()), float(weight))
+                except (StopIteration, ValueError):
+                    self.rejected += 1
+
+    def latency_percentiles(self, percentiles=(50, 90, 99)):
+        """
+        Update-to-new-path latency percentiles in seconds, as a dict keyed by
+        percentile; empty if no update was applied yet.
+        """
+        if not self.latencies:
+            return {}
+        values = np.percentile(self.latencies, percentiles)
+        return {p: float(value) for p, value in zip(percentiles, values)}
@@ -1,26 +1,49 @@
 """Dynamic shortest paths and path lengths using the D* Lite ("D star Lite") algorithm."""
 
+import hashlib
 import heapq
+import pickle
+from itertools import chain
+
+import numpy as np
 
 import networkx as nx
 
+from Algorithms.csr_graph import CSRGraph
+
 __all__ = [
     "new_dstar_lite_instance",
     "d_star_modify_edge",
+    "d_star_modify_edges",
+    "d_star_remove_edge",
+    "d_star_add_node",
+    "d_star_remove_node",
+    "d_star_move_source",
     "d_star_recalculate_path",
+    "d_star_get_path_from",
+    "d_star_get_cost_from",
     "d_star_get_path_cost",
     "d_star_get_path_length",
+    "d_star_save_state",
+    "d_star_load_state",
 ]
 
 
 @nx._dispatchable(edge_attrs="weight", preserve_node_attrs="heuristic")
-def new_dstar_lite_instance(G, source, target, weight="weight", heuristic=None):
+def new_dstar_lite_instance(
+        G, source, target, weight="weight", heuristic=None, overlay=False, deferred=False,
+        impact_filter=False, vectorized=False,
+):
     """
     Initializes a new instance of the D* Lite algorithm for a NetworkX graph.
     Parameters
     ----------
-    G : nx.Graph or nx.DiGraph
-        The search graph containing nodes and weighted edges.
+    G : nx.Graph, nx.DiGraph or CSRGraph
+        The search graph containing nodes and weighted edges. A CSRGraph
+        snapshot runs the search over integer node ids; its edge weights
+        were fixed at compile time, so `weight` is ignored. Creating an
+        instance does not allocate per-node state, but the non-overlay modes
+        still copy the graph (NetworkX) or its weight array (CSRGraph).
     source : hashable
         The starting node for the path.
     target : hashable
@@ -30,6 +53,29 @@ def new_dstar_lite_instance(G, source, target, weight="weight", heuristic=None):
         Default is a zero heuristic (equivalent to Dijkstra's algorithm).
     weight : str, optional
         The edge attribute that represents the weights. Default is 'weight'.
+    overlay : bool, optional
+        If True, the instance keeps a read-only reference to `G` instead of
+        copying it, and records modified or added edges in a delta map, so
+        many instances can share one graph and each costs memory in
+        proportion to its own modifications. `G` must not be changed while
+        such instances are in use. Default is False.
+    deferred : bool, optional
+        If True, edge modifications only mark the affected vertices; the
+        replanning pass runs once, at the next path request or call to
+        `d_star_recalculate_path`. Default is False.
+    impact_filter : bool, optional
+        If True, an edge modification that provably leaves the rhs value of
+        its tail unchanged (an increase on an edge no shortest path from the
+        tail uses, a decrease that does not beat the tail's current cost, or
+        a change next to an unreached node) only stores the new weight and
+        is not propagated. Default is False.
+    vectorized : bool, optional
+        If True, g and rhs are kept in NumPy arrays over the node ids of a
+        CSRGraph snapshot, and the rhs minimum of every node with at least
+        `DStarLite.vector_min_degree` successors is computed with one array
+        operation over its contiguous successor ids and weights. Pays off on
+        graphs with high-degree nodes; requires a CSRGraph and allocates
+        O(V) state up front. Default is False.
     Returns
     -------
     DStarLite
@@ -60,7 +106,9 @@ def new_dstar_lite_instance(G, source, target, weight="weight", heuristic=None):
     >>> print(dstar.get_path_cost())
     6
     """
-    return DStarLite(G, source, target, heuristic, weight)
+    return DStarLite(
+        G, source, target, heuristic, weight, overlay, deferred, impact_filter, vectorized
+    )
 
 
 def d_star_modify_edge(instance, u, v, new_weight):
@@ -79,14 +127,106 @@ def d_star_modify_edge(instance, u, v, new_weight):
     Returns
     -------
     nx.Graph or nx.DiGraph
-        The updated graph containing the modified edge.
+        The updated graph containing the modified edge (the unchanged shared
+        graph for an overlay instance).
     """
     return instance.modify_edge(u, v, new_weight)
 
 
+def d_star_modify_edges(instance, updates):
+    """
+    Applies a batch of edge weight changes with a single replanning pass.
+    Parameters
+    ----------
+    instance : DStarLite
+        The active instance of the algorithm.
+    updates : iterable of (u, v, new_weight)
+        The edges to modify; later entries for the same edge win.
+    Returns
+    -------
+    nx.Graph, nx.DiGraph or CSRGraph
+        The updated graph (the unchanged shared graph for an overlay instance).
+    """
+    return instance.modify_edges(updates)
+
+
+def d_star_remove_edge(instance, u, v):
+    """
+    Removes an edge, e.g. a road closure, and updates the path.
+    Parameters
+    ----------
+    instance : DStarLite
+        The active instance of the algorithm.
+    u : hashable
+        The source node of the edge.
+    v : hashable
+        The target node of the edge.
+    Returns
+    -------
+    nx.Graph, nx.DiGraph or CSRGraph
+        The updated graph (the unchanged shared graph for an overlay instance).
+    """
+    return instance.remove_edge(u, v)
+
+
+def d_star_add_node(instance, node):
+    """
+    Adds an isolated node that later edge modifications can connect.
+    Parameters
+    ----------
+    instance : DStarLite
+        The active instance of the algorithm.
+    node : hashable
+        The node to add.
+    Returns
+    -------
+    nx.Graph, nx.DiGraph or CSRGraph
+        The updated graph (the unchanged shared graph for an overlay instance).
+    """
+    return instance.add_node(node)
+
+
+def d_star_remove_node(instance, node):
+    """
+    Removes a node with all its edges and updates the path.
+    Parameters
+    ----------
+    instance : DStarLite
+        The active instance of the algorithm.
+    node : hashable
+        The node to remove; it cannot be the current source or the target.
+    Returns
+    -------
+    nx.Graph, nx.DiGraph or CSRGraph
+        The updated graph (the unchanged shared graph for an overlay instance).
+    """
+    return instance.remove_node(node)
+
+
+def d_star_move_source(instance, new_source):
+    """
+    Moves the start of the search, e.g. after the agent advanced one step,
+    and replans from there reusing the existing search state.
+    Parameters
+    ----------
+    instance : DStarLite
+        The active instance of the algorithm.
+    new_source : hashable
+        The node the agent now stands on.
+    Returns
+    -------
+    list or None
+        The path from the new source, or None if no path exists (or the
+        instance is deferred and has not replanned yet).
+    """
+    return instance.move_source(new_source)
+
+
 def d_star_recalculate_path(instance):
     """
     Recalculates the shortest path after modifications in the graph.
+    Modifications are replanned as they are applied unless the instance is
+    in deferred mode, so the search only runs here if changes are pending.
     Parameters
     ----------
     instance : DStarLite
@@ -96,10 +236,44 @@ def d_star_recalculate_path(instance):
     list or None
         A list of nodes representing the path, or None if no path exists.
     """
-    instance.compute_shortest_path()
     return instance.get_path()
 
 
+def d_star_get_path_from(instance, node):
+    """
+    Returns the shortest path from any node to the instance's target,
+    answered from the existing search state where possible.
+    Parameters
+    ----------
+    instance : DStarLite
+        The active instance of the algorithm.
+    node : hashable
+        The starting node of the path.
+    Returns
+    -------
+    list or None
+        A list of nodes from `node` to the target, or None if no path exists.
+    """
+    return instance.get_path_from(node)
+
+
+def d_star_get_cost_from(instance, node):
+    """
+    Returns the shortest-path cost from any node to the instance's target.
+    Parameters
+    ----------
+    instance : DStarLite
+        The active instance of the algorithm.
+    node : hashable
+        The starting node.
+    Returns
+    -------
+    int or float
+        The cost of the shortest path, or infinity if no path exists.
+    """
+    return instance.get_cost_from(node)
+
+
 def d_star_get_path_cost(instance):
     """
     Returns the total cost of the last computed path.
@@ -136,6 +310,45 @@ def d_star_get_path_length(instance):
     return instance.get_path_length()
 
 
+def d_star_save_state(instance, path):
+    """
+    Writes the converged search state of an instance to a binary file, so it
+    can be restored later without searching again.
+    Parameters
+    ----------
+    instance : DStarLite
+        An overlay instance or an instance on a CSRGraph snapshot.
+    path : str or path-like
+        The file to write.
+    """
+    instance.save_state(path)
+
+
+def d_star_load_state(path, G, heuristic=None):
+    """
+    Restores an instance saved with `d_star_save_state` without re-running
+    the search.
+    Parameters
+    ----------
+    path : str or path-like
+        The file written by `d_star_save_state`. Only load files you trust:
+        the state is stored with pickle.
+    G : nx.Graph, nx.DiGraph or CSRGraph
+        The graph the instance was built on, unmodified.
+    heuristic : function(u, v) -> float, optional
+        The heuristic the instance was built with; functions are not saved.
+    Returns
+    -------
+    DStarLite
+        An instance equivalent to the saved one.
+    Raises
+    ------
+    NetworkXError
+        If `G` does not match the graph the state was saved for.
+    """
+    return DStarLite.load_state(path, G, heuristic)
+
+
 # --------------------------------------------------------------------------------------
 # Fundamental Data Structures
 # --------------------------------------------------------------------------------------
@@ -147,6 +360,16 @@ class PriorityQueue:
       - O(1) priority updates.
       - Lazy removal of obsolete items.
       - Access to the smallest element without removal.
+      - Automatic compaction once invalidated entries dominate the heap.
+    Parameters
+    ----------
+    max_stale_ratio : float or None, optional
+        The heap is rebuilt without its invalidated entries whenever they
+        make up more than this fraction of it. None disables compaction.
+        Default is 0.5, which keeps the heap within twice the live size at
+        amortized O(1) cost per removal.
+    min_compact_size : int, optional
+        Heaps smaller than this are never compacted. Default is 64.
     Attributes
     ----------
     heap : list
@@ -155,13 +378,30 @@ class PriorityQueue:
         A fast mapping from items to their entries in the heap.
     count : int
         A version counter to break ties in priority.
+    stale : int
+        Number of invalidated entries still stored in the heap.
+    compactions : int
+        Number of times the heap was rebuilt.
     """
 
-    def __init__(self):
+    def __init__(self, max_stale_ratio=0.5, min_compact_size=64):
         """Initializes an empty priority queue."""
         self.heap = []
         self.entry_map = {}
         self.count = 0
+        self.max_stale_ratio = max_stale_ratio
+        self.min_compact_size = min_compact_size
+        self.stale = 0
+        self.compactions = 0
+
+    def __len__(self):
+        """Number of live items."""
+        return len(self.entry_map)
+
+    @property
+    def physical_size(self):
+        """Number of entries stored in the heap, live or invalidated."""
+        return len(self.heap)
 
     def push(self, item, priority):
         """
@@ -191,6 +431,20 @@ class PriorityQueue:
         if item in self.entry_map:
             entry = self.entry_map.pop(item)
             entry[-1] = None  # Invalidate the entry without modifying the heap
+            self.stale += 1
+            if (
+                    self.max_stale_ratio is not None
+                    and len(self.heap) >= self.min_compact_size
+                    and self.stale > self.max_stale_ratio * len(self.heap)
+            ):
+                self.compact()
+
+    def compact(self):
+        """Rebuilds the heap from its live entries in O(n)."""
+        self.heap = [entry for entry in self.heap if entry[-1] is not None]
+        heapq.heapify(self.heap)
+        self.stale = 0
+        self.compactions += 1
 
     def pop(self):
         """
@@ -209,6 +463,7 @@ class PriorityQueue:
             if item is not None:
                 del self.entry_map[item]
                 return item
+            self.stale -= 1
         raise KeyError("Priority queue is empty")
 
     def empty(self):
@@ -227,11 +482,25 @@ class PriorityQueue:
             priority, _, item = self.heap[0]
             if item is None:
                 heapq.heappop(self.heap)
+                self.stale -= 1
             else:
                 return priority
         return float("inf"), float("inf")
 
 
+class _InfinityMap(dict):
+    """
+    Cost table that reads as infinity for every node it has not stored.
+    Missing keys are not inserted on lookup, so the table only grows with
+    the nodes the search actually assigns a finite or updated cost to.
+    """
+
+    __slots__ = ()
+
+    def __missing__(self, key):
+        return float("inf")
+
+
 # --------------------------------------------------------------------------------------
 # Core Implementation of D* Lite
 # --------------------------------------------------------------------------------------
@@ -242,53 +511,139 @@ class DStarLite:
     Implementation of the D* Lite algorithm for dynamic graph shortest path problems.
     Attributes
     ----------
-    G : nx.Graph or nx.DiGraph
-        A local copy of the input graph.
+    G : nx.Graph, nx.DiGraph or CSRGraph
+        A local copy of the input graph, or the shared read-only graph in
+        overlay mode and for CSRGraph snapshots.
     source : hashable
-        The current starting node.
+        The current starting node (its integer id on a CSRGraph).
     target : hashable
-        The fixed target node.
+        The fixed target node (its integer id on a CSRGraph).
     weight : str
         The edge attribute representing weights.
     heuristic : function
         The heuristic function used to guide the search.
     g_score : dict
-        The known actual cost of reaching the target from each node.
+        The known actual cost of reaching the target from each node. Nodes
+        the search has not reached are absent and read as infinity.
     rhs : dict
-        The one-step lookahead cost for each node (right-hand side value).
+        The one-step lookahead cost for each node (right-hand side value),
+        stored lazily like `g_score`.
     queue : PriorityQueue
         A priority queue of nodes to be processed.
     k_m : float
-        Accumulated offset used to adjust priorities after changes.
+        Accumulated offset used to adjust priorities after the source moved.
     last_path : list or None
         The last computed shortest path.
+    overlay : bool
+        Whether edge changes are kept in a delta map over the shared graph.
+    deferred : bool
+        Whether edge changes wait for the next path request to be replanned.
+    replans : int
+        Number of calls to compute_shortest_path, including the initial one.
+    impact_filter : bool
+        Whether edge changes that cannot affect any rhs value are skipped.
+    updates_processed, updates_skipped : int
+        Edge modifications that marked vertices for replanning, and those
+        the impact filter discarded after storing the new weight.
+    vectorized : bool
+        Whether g/rhs live in NumPy arrays and rhs minima of high-degree
+        nodes are computed with array operations (CSRGraph only).
     """
 
-    def __init__(self, G, source, target, heuristic=None, weight="weight"):
-        # Validate that source and target exist in the graph.
-        if source not in G:
-            G.add_node(source)
-        if target not in G:
-            G.add_node(target)
+    # Out-degree from which a vectorized instance computes rhs with NumPy;
+    # below it, the per-call overhead of the array operations dominates.
+    vector_min_degree = 16
 
-        self.G = G.copy()  # Make a local copy to avoid side effects.
-        self.source = source
-        self.target = target
+    def __init__(
+            self, G, source, target, heuristic=None, weight="weight", overlay=False,
+            deferred=False, impact_filter=False, vectorized=False,
+    ):
+        self._setup(
+            G, source, target, heuristic, weight, overlay, deferred, impact_filter, vectorized
+        )
+        self.rhs[self.target] = 0
+        self.queue.push(self.target, self.compute_key(self.target))
+        self.compute_shortest_path()
+
+    def _setup(
+            self, G, source, target, heuristic, weight, overlay, deferred, impact_filter,
+            vectorized,
+    ):
+        """Sets up the graph access, options and empty search state without searching."""
+        if vectorized and not isinstance(G, CSRGraph):
+            raise nx.NetworkXError("vectorized=True requires a CSRGraph snapshot")
+        self.vectorized = vectorized
         self.weight = weight
         self.heuristic = heuristic if heuristic else (lambda u, v: 0)
+        self.overlay = overlay
+        self.deferred = deferred
+        self.impact_filter = impact_filter
+        self.replans = 0
+        self.updates_processed = 0
+        self.updates_skipped = 0
+        # Vertices whose outgoing edges changed since the last replanning pass.
+        self._dirty = set()
+        self._source_moved = False
+        # Overlay mode: modified or added edge weights, {u: {v: weight}} on
+        # NetworkX graphs and {u: {edge position: weight}} on CSR snapshots.
+        self._delta = {} if overlay else None
+        self._added_pred = {}
+        # Nodes removed from a shared graph (overlay or CSR), and nodes an
+        # overlay instance added to its view of the shared graph.
+        self._removed = set()
+        self._added_nodes = set()
 
-        """Initialize costs: all nodes start with infinite cost except the target. """
-        self.g_score = {n: float("inf") for n in self.G.nodes}
-        self.rhs = {n: float("inf") for n in self.G.nodes}
-        self.rhs[self.target] = 0
+        if isinstance(G, CSRGraph):
+            self._init_csr(G, source, target)
+        elif overlay:
+            self.G = G
+            self._labels = None
+            self.source = source
+            self.target = target
+        else:
+            # Validate that source and target exist in the graph.
+            if source not in G:
+                G.add_node(source)
+            if target not in G:
+                G.add_node(target)
 
+            self.G = G.copy()  # Make a local copy to avoid side effects.
+            self._labels = None
+            self.source = source
+            self.target = target
+            self._validate_edge_weights()
+
+        # All nodes start with infinite cost except the target; the tables
+        # are filled lazily, so creating an instance is O(1) in graph size.
+        self.g_score = self._cost_table()
+        self.rhs = self._cost_table()
         self.queue = PriorityQueue()
         self.k_m = 0
+        self._last_source = self.source
         self.last_path = None
 
-        self._validate_edge_weights()
-        self.queue.push(self.target, self.compute_key(self.target))
-        self.compute_shortest_path()
+    def _init_csr(self, G, source, target):
+        """
+        Sets up the integer-indexed state for a CSRGraph snapshot. The
+        snapshot itself is shared; only the weight array is copied (or, in
+        overlay mode, a delta map is kept) so that edge modifications stay
+        local to this instance.
+        """
+        self.G = G
+        self._labels = G.nodes
+        self.source = G.node_id(source)
+        self.target = G.node_id(target)
+        self._weights = G.succ_weights if self.overlay else np.array(G.succ_weights)
+
+        label_heuristic = self.heuristic
+        labels = self._labels
+        self.heuristic = lambda u, v: label_heuristic(labels[u], labels[v])
+
+    def _cost_table(self):
+        """Returns an empty g/rhs table in which every node reads as infinity."""
+        if self.vectorized:
+            return np.full(self.G.number_of_nodes(), np.inf)
+        return _InfinityMap()
 
     def _validate_edge_weights(self):
         """
@@ -298,12 +653,125 @@ class DStarLite:
             if self.weight not in data:
                 data[self.weight] = 1  # Safe default value.
 
+    # ----------------------------------------------------------------------------------
+    # Graph access: NetworkX dict-of-dicts or CSR arrays
+    # ----------------------------------------------------------------------------------
+
+    def _node(self, node):
+        """Maps a node label to the key used by the internal state."""
+        return node if self._labels is None else self.G.node_id(node)
+
+    def _successors(self, u):
+        """Yields (v, weight) for every edge leaving u."""
+        if self._labels is None:
+            weight = self.weight
+            if self._delta is None:
+                return ((v, d[weight]) for v, d in self.G._adj[u].items())
+            base = self.G._adj.get(u, {})
+            row = self._delta.get(u)
+            if row is None:
+                return ((v, d.get(weight, 1)) for v, d in base.items())
+            return chain(
+                ((v, row.get(v, d.get(weight, 1))) for v, d in base.items()),
+                ((v, w) for v, w in row.items() if v not in base),
+            )
+        start, end = self.G._succ_ptr[u], self.G._succ_ptr[u + 1]
+        weights = self._weights[start:end].tolist()
+        if self._delta and u in self._delta:
+            for pos, w in self._delta[u].items():
+                weights[pos - start] = w
+        return zip(self.G.succ_indices[start:end].tolist(), weights)
+
+    def _predecessors(self, u):
+        """Returns the nodes with an edge into u."""
+        if self._labels is None:
+            adj = self.G._pred if self.G.is_directed() else self.G._adj
+            if self._delta is None:
+                return adj[u]
+            added = self._added_pred.get(u)
+            base = adj.get(u, {})
+            return base if added is None else chain(base, added)
+        start, end = self.G._pred_ptr[u], self.G._pred_ptr[u + 1]
+        return self.G.pred_indices[start:end].tolist()
+
+    def _out_degree(self, u):
+        """Number of successors of u in a CSRGraph snapshot."""
+        return self.G._succ_ptr[u + 1] - self.G._succ_ptr[u]
+
+    def _successor_arrays(self, u):
+        """Returns the successor ids and current weights of u as NumPy arrays."""
+        start, end = self.G._succ_ptr[u], self.G._succ_ptr[u + 1]
+        weights = self._weights[start:end]
+        if self._delta and u in self._delta:
+            weights = weights.copy()
+            for pos, w in self._delta[u].items():
+                weights[pos - start] = w
+        return self.G.succ_indices[start:end], weights
+
+    def _vector_rhs(self, u):
+        """min over successors v of g(v) + c(u, v), as one array operation."""
+        ids, weights = self._successor_arrays(u)
+        return (self.g_score[ids] + weights).min()
+
+    def _vector_next(self, u):
+        """Successor of u minimizing rhs(v) + c(u, v), or None if all are infinite."""
+        ids, weights = self._successor_arrays(u)
+        costs = self.rhs[ids] + weights
+        i = int(costs.argmin())
+        return int(ids[i]) if costs[i] != np.inf else None
+
+    def _edge_weight(self, u, v):
+        """Returns the current weight of edge (u, v)."""
+        if self._labels is None:
+            if self._delta is None:
+                return self.G[u][v][self.weight]
+            row = self._delta.get(u)
+            if row is not None and v in row:
+                return row[v]
+            return self.G[u][v].get(self.weight, 1)
+        pos = self.G.edge_position(u, v)
+        if self._delta and pos in self._delta.get(u, ()):
+            return self._delta[u][pos]
+        return float(self._weights[pos])
+
+    def _set_edge_weight(self, u, v, new_weight):
+        """Stores a new weight for edge (u, v), adding it on NetworkX graphs."""
+        if self._labels is None:
+            if self._delta is not None:
+                pairs = [(u, v)] if self.G.is_directed() else [(u, v), (v, u)]
+                for a, b in pairs:
+                    if not self.G.has_edge(a, b):
+                        self._added_pred.setdefault(b, set()).add(a)
+                    self._delta.setdefault(a, {})[b] = new_weight
+                return
+            if not self.G.has_edge(u, v):
+                self.G.add_edge(u, v, **{self.weight: new_weight})
+            else:
+                self.G[u][v][self.weight] = new_weight
+            return
+        pos = self.G.edge_position(u, v)
+        if pos < 0:
+            raise nx.NetworkXError(
+                f"Edge ({self._labels[u]}, {self._labels[v]}) is not in the snapshot"
+            )
+        positions = [(u, pos)]
+        if not self.G.is_directed():
+            positions.append((v, self.G.edge_position(v, u)))
+        for a, p in positions:
+            if self._delta is not None:
+                self._delta.setdefault(a, {})[p] = new_weight
+            else:
+                self._weights[p] = new_weight
+
     def compute_key(self, u):
         """
         Computes the priority key for node u.
         Formula
         -------
-        key = (min(g(u), rhs(u)) + h(u, target) + k_m, min(g(u), rhs(u)))
+        key = (min(g(u), rhs(u)) + h(source, u) + k_m, min(g(u), rhs(u)))
+
+        The search runs backwards from the target, so the heuristic estimates
+        the distance from the current source to u.
         Parameters
         ----------
         u : hashable
@@ -314,7 +782,7 @@ class DStarLite:
             The computed key.
         """
         g_rhs_min = min(self.g_score[u], self.rhs[u])
-        h = self.heuristic(u, self.target)
+        h = self.heuristic(self.source, u)
         return g_rhs_min + h + self.k_m, g_rhs_min
 
     def update_vertex(self, u):
@@ -327,13 +795,12 @@ class DStarLite:
         """
         if u != self.target:
             # Compute rhs as the minimum cost from all successors.
-            successors = list(self.G.neighbors(u))
-            costs = [
-                self.g_score[v] + self.G[u][v][self.weight]
-                for v in successors
-                if self.G.has_edge(u, v)
-            ]
-            self.rhs[u] = min(costs) if costs else float("inf")
+            if self.vectorized and self._out_degree(u) >= self.vector_min_degree:
+                self.rhs[u] = self._vector_rhs(u)
+            else:
+                g_score = self.g_score
+                costs = [g_score[v] + w for v, w in self._successors(u)]
+                self.rhs[u] = min(costs) if costs else float("inf")
         if u in self.queue.entry_map:
             self.queue.remove(u)
         if self.g_score[u] != self.rhs[u]:  # Node is inconsistent.
@@ -344,29 +811,52 @@ class DStarLite:
         Executes the main search loop of D* Lite to propagate cost changes until
         either an optimal path is found or it is determined that no path exists.
         For directed graphs, propagation is performed using the predecessors.
+        Vertices touched by pending edge modifications are updated first.
+        """
+        self.replans += 1
+        if self.source != self._last_source:
+            # Queued keys were computed for the old source; raising k_m by
+            # the distance moved keeps them lower bounds of the new keys.
+            self.k_m += self.heuristic(self._last_source, self.source)
+            self._last_source = self.source
+        self._source_moved = False
+        for u in self._dirty:
+            self.update_vertex(u)
+        self._dirty.clear()
+        self._expand_until(self.source)
+        if self.rhs[self.source] == float("inf"):
+            self.last_path = None  # No path exists to the target.
+        else:
+            self.generate_path()
+
+    def _expand_until(self, node):
+        """
+        Processes queued vertices until `node` is locally consistent and its
+        key is not above the smallest queued key, at which point its g value
+        is its exact cost to the target.
         """
         while not self.queue.empty():
             current_key = self.queue.top_key()
-            start_key = self.compute_key(self.source)
             if (
-                self.rhs[self.source] == self.g_score[self.source]
-                and current_key >= start_key
+                self.rhs[node] == self.g_score[node]
+                and current_key >= self.compute_key(node)
             ):
                 break
             u = self.queue.pop()
+            if self.k_m:
+                new_key = self.compute_key(u)
+                if current_key < new_key:  # Key is outdated: requeue it.
+                    self.queue.push(u, new_key)
+                    continue
             if self.g_score[u] > self.rhs[u]:
                 self.g_score[u] = self.rhs[u]
-                for v in self.G.predecessors(u):
+                for v in self._predecessors(u):
                     self.update_vertex(v)
             else:
                 self.g_score[u] = float("inf")
-                for v in self.G.predecessors(u):
+                for v in self._predecessors(u):
                     self.update_vertex(v)
                 self.update_vertex(u)
-        if self.rhs[self.source] == float("inf"):
-            self.last_path = None  # No path exists to the target.
-        else:
-            self.generate_path()
 
     def generate_path(self):
         """
@@ -380,36 +870,39 @@ class DStarLite:
         None
             The computed path is stored in 'self.last_path'. If no path exists, it is set to None.
         """
+        self.last_path = self._extract_path(self.source)
+
+    def _extract_path(self, start):
+        """
+        Follows the lowest rhs + edge weight successor from `start` to the
+        target. Returns the path of internal node keys, or None if it is cut
+        off or runs into a cycle.
+        """
         path = []
-        current = self.source
+        current = start
         visited = set()
         while current != self.target:
             if current in visited:
-                self.last_path = None
-                return
+                return None
             visited.add(current)
             path.append(current)
-            next_node = None
-            min_cost = float("inf")
-            for neighbor in self.G.successors(current):
-                if not self.G.has_edge(current, neighbor):
-                    continue
-                if self.rhs[neighbor] == float("inf"):
-                    continue
-                try:
-                    edge_weight = self.G[current][neighbor][self.weight]
+            if self.vectorized and self._out_degree(current) >= self.vector_min_degree:
+                next_node = self._vector_next(current)
+            else:
+                next_node = None
+                min_cost = float("inf")
+                for neighbor, edge_weight in self._successors(current):
+                    if self.rhs[neighbor] == float("inf"):
+                        continue
                     cost = self.rhs[neighbor] + edge_weight
-                except KeyError:
-                    continue
-                if cost < min_cost:
-                    min_cost = cost
-                    next_node = neighbor
+                    if cost < min_cost:
+                        min_cost = cost
+                        next_node = neighbor
             if next_node is None:
-                self.last_path = None
-                return
+                return None
             current = next_node
         path.append(current)
-        self.last_path = path
+        return path
 
     def modify_edge(self, u, v, new_weight):
         """
@@ -424,19 +917,293 @@ class DStarLite:
             The new weight to assign to the edge.
         Returns
         -------
-        nx.Graph or nx.DiGraph
-            The updated graph.
+        nx.Graph, nx.DiGraph or CSRGraph
+            The updated graph; the unchanged shared graph in overlay mode.
         """
-        if not self.G.has_edge(u, v):
-            self.G.add_edge(u, v, **{self.weight: new_weight})
-        else:
-            self.G[u][v][self.weight] = new_weight
-        self.update_vertex(u)
-        if not self.G.is_directed():
-            self.update_vertex(v)
+        self._apply_edge_change(u, v, new_weight)
+        if not self.deferred and self._dirty:
+            self.compute_shortest_path()
+        return self.G
+
+    def modify_edges(self, updates):
+        """
+        Applies several edge weight changes, then replans once.
+        Every change only marks the affected vertices; their rhs values are
+        recomputed once each and a single compute_shortest_path pass follows
+        (or, in deferred mode, waits for the next path request).
+        Parameters
+        ----------
+        updates : iterable of (u, v, new_weight)
+            The edges to modify and their new weights.
+        Returns
+        -------
+        nx.Graph, nx.DiGraph or CSRGraph
+            The updated graph; the unchanged shared graph in overlay mode.
+        """
+        for u, v, new_weight in updates:
+            self._apply_edge_change(u, v, new_weight)
+        if not self.deferred and self._dirty:
+            self.compute_shortest_path()
+        return self.G
+
+    def move_source(self, new_source):
+        """
+        Moves the start of the search to `new_source`, e.g. the agent's next
+        position, keeping all g/rhs values.
+        The key modifier k_m grows by h(previous source, new source), so
+        keys already in the queue stay valid and the next replanning pass
+        only processes the region affected by edge changes since the last
+        one. Replanning happens immediately unless the instance is deferred.
+        Parameters
+        ----------
+        new_source : hashable
+            The new starting node.
+        Returns
+        -------
+        list or None
+            The shortest path from the new source, or None in deferred mode
+            (it is computed on the next path request).
+        Raises
+        ------
+        NodeNotFound
+            If `new_source` is not in the graph.
+        """
+        self.source = self._known_node(new_source)
+        self._source_moved = True
+        if self.deferred:
+            return None
         self.compute_shortest_path()
+        return self.get_path()
+
+    def get_path_from(self, node):
+        """
+        Returns the shortest path from any `node` to the target, reusing the
+        cost-to-go values the search already holds. The search is only
+        expanded further if `node` has not been settled yet, so one instance
+        per target can serve many starting points.
+        The heuristic still guides the search toward the current source;
+        queries far from it may expand more vertices.
+        Parameters
+        ----------
+        node : hashable
+            The starting node of the path.
+        Returns
+        -------
+        list or None
+            The shortest path from `node`, or None if the target cannot be
+            reached from it.
+        Raises
+        ------
+        NodeNotFound
+            If `node` is not in the graph.
+        """
+        u = self._known_node(node)
+        self._replan_if_pending()
+        self._expand_until(u)
+        if self.rhs[u] == float("inf"):
+            return None
+        path = self._extract_path(u)
+        if path is None or self._labels is None:
+            return path
+        return [self._labels[n] for n in path]
+
+    def get_cost_from(self, node):
+        """
+        Returns the shortest-path cost from any `node` to the target, or
+        infinity if there is none. Expands the search like `get_path_from`.
+        Parameters
+        ----------
+        node : hashable
+            The starting node.
+        Returns
+        -------
+        int or float
+            The cost of the shortest path from `node`.
+        Raises
+        ------
+        NodeNotFound
+            If `node` is not in the graph.
+        """
+        u = self._known_node(node)
+        self._replan_if_pending()
+        self._expand_until(u)
+        return self.rhs[u]
+
+    def remove_edge(self, u, v):
+        """
+        Removes the edge (u, v) and replans from the affected vertex only.
+        Copying instances drop the edge from their graph; overlay and CSR
+        instances record it as an infinite weight, which a later
+        `modify_edge` can replace.
+        Parameters
+        ----------
+        u : hashable
+            The source node of the edge.
+        v : hashable
+            The target node of the edge.
+        Returns
+        -------
+        nx.Graph, nx.DiGraph or CSRGraph
+            The updated graph; the unchanged shared graph in overlay mode.
+        Raises
+        ------
+        NetworkXError
+            If the edge is not in the graph.
+        """
+        a, b = self._node(u), self._node(v)
+        if not self._has_edge(a, b):
+            raise nx.NetworkXError(f"Edge ({u}, {v}) is not in the graph")
+        self._change_edge(a, b, float("inf"))
+        if self._labels is None and self._delta is None:
+            self.G.remove_edge(a, b)
+        if not self.deferred and self._dirty:
+            self.compute_shortest_path()
+        return self.G
+
+    def add_node(self, node):
+        """
+        Adds an isolated node, e.g. before linking it with `modify_edge`.
+        Its g/rhs values start at infinity, so nothing is replanned. Adding a
+        node that is already present does nothing.
+        Parameters
+        ----------
+        node : hashable
+            The node to add.
+        Returns
+        -------
+        nx.Graph, nx.DiGraph or CSRGraph
+            The updated graph; the unchanged shared graph in overlay mode.
+        Raises
+        ------
+        NetworkXError
+            If `node` is new to a CSRGraph snapshot, whose node set is fixed;
+            only removed nodes can be added back.
+        """
+        if self._labels is not None:
+            try:
+                self._removed.discard(self.G.node_id(node))
+            except nx.NodeNotFound:
+                raise nx.NetworkXError(
+                    f"Node {node} is not in the CSRGraph snapshot; its node set is fixed"
+                ) from None
+        elif self._delta is None:
+            self.G.add_node(node)
+        elif node in self._removed:
+            self._removed.discard(node)
+        elif node not in self.G:
+            self._added_nodes.add(node)
         return self.G
 
+    def remove_node(self, node):
+        """
+        Removes `node` and all its edges, replanning from its predecessors
+        only. The current source and the target cannot be removed.
+        Parameters
+        ----------
+        node : hashable
+            The node to remove.
+        Returns
+        -------
+        nx.Graph, nx.DiGraph or CSRGraph
+            The updated graph; the unchanged shared graph in overlay mode.
+        Raises
+        ------
+        NodeNotFound
+            If `node` is not in the graph.
+        NetworkXError
+            If `node` is the current source or the target.
+        """
+        n = self._known_node(node)
+        if n == self.source or n == self.target:
+            raise nx.NetworkXError("Cannot remove the source or the target node")
+        inf = float("inf")
+        incident = [(n, v) for v, w in self._successors(n) if w != inf]
+        if self.G.is_directed():
+            incident += [(p, n) for p in self._predecessors(n) if self._has_edge(p, n)]
+        for a, b in incident:
+            self._change_edge(a, b, inf)
+        if self._labels is None and self._delta is None:
+            self.G.remove_node(n)
+            self.g_score.pop(n, None)
+            self.rhs.pop(n, None)
+            self.queue.remove(n)
+            self._dirty.discard(n)
+        else:
+            self._removed.add(n)
+        if not self.deferred and self._dirty:
+            self.compute_shortest_path()
+        return self.G
+
+    def _has_edge(self, u, v):
+        """Tells whether edge (u, v) is present with a finite weight."""
+        if self._labels is not None and self.G.edge_position(u, v) < 0:
+            return False
+        try:
+            return self._edge_weight(u, v) != float("inf")
+        except KeyError:
+            return False
+
+    def _known_node(self, node):
+        """Maps `node` to its internal key, raising NodeNotFound if it is not in the graph."""
+        u = self._node(node)
+        if u in self._removed or (
+                self._labels is None
+                and u not in self.G
+                and u not in self._added_nodes
+                and not (self._delta and u in self._delta)
+                and u != self.target
+        ):
+            raise nx.NodeNotFound(f"Node {node} is not in G")
+        return u
+
+    def _apply_edge_change(self, u, v, new_weight):
+        """Maps the endpoints to internal keys and applies the change."""
+        self._change_edge(self._node(u), self._node(v), new_weight)
+
+    def _change_edge(self, u, v, new_weight):
+        """Stores the new weight and marks the vertices whose rhs may change."""
+        if self.impact_filter:
+            tails = [u] if self.G.is_directed() else [u, v]
+            heads = [v] if self.G.is_directed() else [v, u]
+            affected = [
+                a for a, b in zip(tails, heads) if self._rhs_may_change(a, b, new_weight)
+            ]
+        else:
+            affected = [u] if self.G.is_directed() else [u, v]
+        self._set_edge_weight(u, v, new_weight)
+        if not affected:
+            self.updates_skipped += 1
+            return
+        self.updates_processed += 1
+        self._dirty.update(affected)
+
+    def _rhs_may_change(self, u, v, new_weight):
+        """
+        Tells whether setting the weight of edge (u, v) can change rhs(u).
+        Relies on the invariant rhs(u) = min over successors s of
+        g(s) + c(u, s), which update_vertex maintains for every vertex but
+        the target.
+        """
+        if u == self.target:
+            return False
+        if u in self._dirty:
+            return True  # Already marked; nothing extra to do.
+        g_v = self.g_score[v]
+        if g_v == float("inf"):
+            return False  # v does not contribute to rhs(u) before or after.
+        try:
+            old_weight = self._edge_weight(u, v)
+        except KeyError:
+            old_weight = float("inf")  # A new edge.
+        if new_weight > old_weight:
+            return g_v + old_weight <= self.rhs[u]  # The edge was a best choice.
+        return g_v + new_weight < self.rhs[u]
+
+    def _replan_if_pending(self):
+        """Runs the deferred replanning pass if modifications or a move are waiting."""
+        if self._dirty or self._source_moved:
+            self.compute_shortest_path()
+
     def get_path(self):
         """
         Returns a safe copy of the last computed path.
@@ -445,7 +1212,12 @@ class DStarLite:
         list or None
             The shortest path as a list of nodes, or None if no path exists.
         """
-        return self.last_path.copy() if self.last_path else None
+        self._replan_if_pending()
+        if not self.last_path:
+            return None
+        if self._labels is None:
+            return self.last_path.copy()
+        return [self._labels[n] for n in self.last_path]
 
     def get_path_length(self):
         """
@@ -455,6 +1227,7 @@ class DStarLite:
         int or float
             The path length.
         """
+        self._replan_if_pending()
         return len(self.last_path) - 1 if self.last_path else float("inf")
 
     def get_path_cost(self):
@@ -466,8 +1239,161 @@ class DStarLite:
         int or float
             The total cost of the path, or infinity if there is no computed path.
         """
+        self._replan_if_pending()
         if self.last_path is None:
             return float("inf")
         return sum(
-            self.G[u][v]["weight"] for u, v in zip(self.last_path, self.last_path[1:])
-        )
\ No newline at end of file
+            self._edge_weight(u, v) for u, v in zip(self.last_path, self.last_path[1:])
+        )
+
+    # ----------------------------------------------------------------------------------
+    # Snapshot and warm start
+    # ----------------------------------------------------------------------------------
+
+    _STATE_VERSION = 1
+
+    def save_state(self, path):
+        """
+        Writes g/rhs, the queue contents, k_m, the edge weight changes and the
+        options to a binary file, together with a fingerprint of the shared
+        graph. Pending deferred changes are replanned first. The heuristic
+        is not saved.
+        Only overlay instances and instances on a CSRGraph can be saved: a
+        copying NetworkX instance no longer holds the graph it was built on.
+        Parameters
+        ----------
+        path : str or path-like
+            The file to write.
+        Raises
+        ------
+        NetworkXError
+            For a copying instance on a NetworkX graph.
+        """
+        if self._labels is None and self._delta is None:
+            raise nx.NetworkXError(
+                "save_state requires an overlay instance or a CSRGraph snapshot"
+            )
+        self._replan_if_pending()
+        label = self._label
+        entries = sorted(
+            (entry for entry in self.queue.heap if entry[-1] is not None), key=lambda e: e[1]
+        )
+        state = {
+            "version": self._STATE_VERSION,
+            "fingerprint": _graph_fingerprint(self.G, self.weight),
+            "source": label(self.source),
+            "target": label(self.target),
+            "last_source": self._last_source,
+            "options": {
+                "weight": self.weight,
+                "overlay": self.overlay,
+                "deferred": self.deferred,
+                "impact_filter": self.impact_filter,
+                "vectorized": self.vectorized,
+            },
+            "g_score": self.g_score if self.vectorized else dict(self.g_score),
+            "rhs": self.rhs if self.vectorized else dict(self.rhs),
+            "queue": [(item, priority) for priority, _, item in entries],
+            "k_m": self.k_m,
+            "deltas": self._weight_changes(),
+            "last_path": self.last_path,
+            "removed": list(self._removed),
+            "added_nodes": list(self._added_nodes),
+            "counters": (self.replans, self.updates_processed, self.updates_skipped),
+        }
+        with open(path, "wb") as f:
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load_state(cls, path, G, heuristic=None):
+        """
+        Restores an instance written by `save_state` on the unmodified graph
+        `G`, without searching. Only load files you trust: the state is
+        stored with pickle.
+        Parameters
+        ----------
+        path : str or path-like
+            The file written by `save_state`.
+        G : nx.Graph, nx.DiGraph or CSRGraph
+            The graph the instance was built on.
+        heuristic : function(u, v) -> float, optional
+            The heuristic the instance was built with.
+        Returns
+        -------
+        DStarLite
+        Raises
+        ------
+        NetworkXError
+            If the file has an unknown format or `G` does not match the
+            graph the state was saved for.
+        """
+        with open(path, "rb") as f:
+            state = pickle.load(f)
+        if state.get("version") != cls._STATE_VERSION:
+            raise nx.NetworkXError("Unsupported D* Lite state file")
+        options = state["options"]
+        if state["fingerprint"] != _graph_fingerprint(G, options["weight"]):
+            raise nx.NetworkXError("G does not match the graph the D* Lite state was saved for")
+
+        instance = cls.__new__(cls)
+        instance._setup(
+            G, state["source"], state["target"], heuristic, options["weight"],
+            options["overlay"], options["deferred"], options["impact_filter"],
+            options["vectorized"],
+        )
+        for u, v, w in state["deltas"]:
+            instance._set_edge_weight(u, v, w)
+        if instance.vectorized:
+            instance.g_score, instance.rhs = state["g_score"], state["rhs"]
+        else:
+            instance.g_score = _InfinityMap(state["g_score"])
+            instance.rhs = _InfinityMap(state["rhs"])
+        for item, priority in state["queue"]:
+            instance.queue.push(item, priority)
+        instance.k_m = state["k_m"]
+        instance._last_source = state["last_source"]
+        instance.last_path = state["last_path"]
+        instance._removed = set(state.get("removed", ()))
+        instance._added_nodes = set(state.get("added_nodes", ()))
+        instance.replans, instance.updates_processed, instance.updates_skipped = state["counters"]
+        return instance
+
+    def _label(self, node):
+        """Maps an internal node key back to its label."""
+        return node if self._labels is None else self._labels[node]
+
+    def _weight_changes(self):
+        """Lists the instance's edge weight changes as internal (u, v, weight) triples."""
+        if self._labels is None:
+            return [(u, v, w) for u, row in self._delta.items() for v, w in row.items()]
+        indices = self.G.succ_indices
+        if self._delta is not None:
+            return [
+                (u, int(indices[pos]), w) for u, row in self._delta.items()
+                for pos, w in row.items()
+            ]
+        changed = np.flatnonzero(self._weights != self.G.succ_weights)
+        tails = np.searchsorted(self.G.succ_indptr, changed, side="right") - 1
+        return [
+            (int(u), int(indices[pos]), float(self._weights[pos]))
+            for u, pos in zip(tails, changed)
+        ]
+
+
+def _graph_fingerprint(G, weight):
+    """
+    SHA-256 digest of the nodes, edges and edge weights of `G` in iteration
+    order, used to check that a saved D* Lite state belongs to a graph.
+    """
+    digest = hashlib.sha256()
+    if isinstance(G, CSRGraph):
+        digest.update(repr((G.directed, G.nodes)).encode())
+        for array in (G.succ_indptr, G.succ_indices, G.succ_weights):
+            digest.update(array.tobytes())
+        return digest.hexdigest()
+    digest.update(repr((G.is_directed(), list(G.nodes))).encode())
+    for u, nbrs in G._adj.items():
+        digest.update(
+            repr((u, [(v, d.get(weight, 1)) for v, d in nbrs.items()])).encode()
+        )
+    return digest.hexdigest()
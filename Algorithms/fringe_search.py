@@ -0,0 +1,317 @@
+"""Shortest paths and path lengths using Fringe Search."""
+
+import networkx as nx
+from networkx.algorithms.shortest_paths.weighted import _weight_function
+
+from Algorithms.csr_graph import CSRGraph
+from Algorithms.workspace import _workspace_for
+
+__all__ = ["fringe_search_path", "fringe_search_path_length"]
+
+
+def fringe_search_path(G, source, target, heuristic=None, weight="weight", workspace=None, search_stats=None):
+    """Returns a list of nodes in a shortest path between source and target
+    using Fringe Search.
+
+    There may be more than one shortest path. This function only returns one.
+
+    Parameters
+    ----------
+    G : NetworkX graph or CSRGraph
+        A graph (directed or undirected) representing the structure to search.
+        A :class:`~Algorithms.csr_graph.CSRGraph` snapshot is searched over
+        integer node ids; `weight` is then ignored.
+
+    source : node
+        Starting node for path.
+
+    target : node
+        Ending node for path.
+
+    heuristic : function, optional
+        A function to estimate the cost from a node to the target. It must take
+        two node arguments and return a number. If not provided, the default is
+        a zero heuristic.
+
+    weight : string or function, optional (default='weight')
+        If a string, it is interpreted as the edge attribute used as the edge
+        weight. If a function, it must accept exactly three positional arguments:
+        the two endpoints of an edge and the dictionary of edge attributes for
+        that edge. It must return a numeric value or None to hide the edge.
+
+    workspace : SearchWorkspace, optional
+        Reusable, generation-stamped scratch arrays for the CSRGraph snapshot
+        `G`; lets back-to-back queries skip per-node allocation.
+
+    search_stats : dict, optional (default=None)
+        If given, filled with the counters of the search: iterations (f-limits
+        tried), expanded (nodes whose successors were generated, a node
+        counting again when a cheaper path reopens it) and max_fringe (largest
+        number of entries carried over to the next iteration).
+
+    Returns
+    -------
+    path : list
+        List of nodes representing the path from source to target.
+
+    Raises
+    ------
+    NetworkXNoPath
+        If no path exists between source and target.
+
+    NetworkXNodeNotFound
+        If either source or target is not in the graph.
+
+    Examples
+    --------
+    >>> G = nx.path_graph(5)
+    >>> print(fringe_search_path(G, 0, 4))
+    [0, 1, 2, 3, 4]
+    >>> G = nx.grid_graph(dim=[3, 3])  # nodes are two-tuples (x,y)
+    >>> nx.set_edge_attributes(G, {e: e[1][0] * 2 for e in G.edges()}, "cost")
+    >>> def dist(a, b):
+    ...     (x1, y1) = a
+    ...     (x2, y2) = b
+    ...     return ((x1 - x2) ** 2 + (y1 - y2) ** 2) ** 0.5
+    >>> print(fringe_search_path(G, (0, 0), (2, 2), heuristic=dist, weight="cost"))
+    [(0, 0), (0, 1), (0, 2), (1, 2), (2, 2)]
+
+    Notes
+    -----
+    Fringe Search raises an f-cost limit like IDA*, but instead of restarting
+    from the source every iteration it keeps the fringe: the nodes whose
+    f-cost exceeded the limit are stored, in order, and the next iteration
+    resumes from them. Nodes within the limit are expanded depth-first, their
+    children being visited right after them. A cache of the best g-cost and
+    parent per node drops the entries superseded by a cheaper path, so no
+    node is ever expanded twice at the same cost.
+
+    Memory holds the fringe and the cache, both bounded by the number of
+    nodes reached, without A*'s sorted open list. The path is optimal when
+    the heuristic is admissible; edge weights must be non-negative numbers.
+
+    See Also
+    --------
+    idastar_path, astar_path
+    """
+    if source not in G:
+        raise nx.NodeNotFound(f"Source {source} is not in G")
+
+    if target not in G:
+        raise nx.NodeNotFound(f"Target {target} is not in G")
+
+    if heuristic is None:
+        # Default heuristic is h=0, equivalent to Dijkstra's algorithm
+        def heuristic(u, v):
+            return 0
+
+    if isinstance(G, CSRGraph):
+        return _fringe_search_csr(G, source, target, heuristic, workspace, search_stats)
+    if workspace is not None:
+        workspace.check(G)
+
+    weight_fn = _weight_function(G, weight)
+    G_succ = G._adj
+    inf = float("inf")
+
+    g_score = {source: 0}
+    parent = {source: None}
+    h_cache = {}
+
+    def h(node):
+        value = h_cache.get(node)
+        if value is None:
+            value = h_cache[node] = heuristic(node, target)
+        return value
+
+    # `now` is used as a stack: the entry on top is the next one in fringe
+    # order. Entries are (node, g); an entry whose g no longer matches
+    # g_score was superseded by a cheaper path and is skipped.
+    now, later = [(source, 0)], []
+    f_limit = h(source)
+    iterations = expanded = max_fringe = 0
+
+    while now:
+        iterations += 1
+        f_min = inf
+        while now:
+            node, g_cost = now.pop()
+            if g_cost != g_score[node]:
+                continue
+            f_cost = g_cost + h(node)
+            if f_cost > f_limit:
+                if f_cost < f_min:
+                    f_min = f_cost
+                later.append((node, g_cost))
+                continue
+
+            if node == target:
+                _record_stats(search_stats, iterations, expanded, max_fringe)
+                path = [node]
+                while parent[node] is not None:
+                    node = parent[node]
+                    path.append(node)
+                return path[::-1]
+
+            expanded += 1
+            children = []
+            for neighbor, edge_attrs in G_succ[node].items():
+                cost = weight_fn(node, neighbor, edge_attrs)
+                if cost is None:
+                    continue
+                next_g = g_cost + cost
+                if next_g < g_score.get(neighbor, inf):
+                    g_score[neighbor] = next_g
+                    parent[neighbor] = node
+                    children.append((neighbor, next_g))
+            children.reverse()  # So the first child is visited first
+            now.extend(children)
+
+        max_fringe = max(max_fringe, len(later))
+        later.reverse()
+        now, later = later, now
+        f_limit = f_min
+
+    _record_stats(search_stats, iterations, expanded, max_fringe)
+    raise nx.NetworkXNoPath(f"Node {target} not reachable from {source}")
+
+
+def _fringe_search_csr(G, source, target, heuristic, workspace=None, search_stats=None):
+    """Fringe Search over a CSRGraph snapshot; returns the path as node labels.
+
+    The g-cost and parent caches are the workspace's generation-stamped
+    arrays, so a new query does not clear or reallocate them.
+    """
+    ws = _workspace_for(G, workspace)
+    gen = ws.begin()
+    labels = G.nodes
+    s = G.index[source]
+    t = G.index[target]
+    indptr, indices, weights = G._succ_ptr, G.succ_indices, G.succ_weights
+    g_score, parent, stamp = ws.dist[0], ws.pred[0], ws.stamp[0]
+    h_value, h_stamp = ws.h_value[0], ws.h_stamp[0]
+    inf = float("inf")
+
+    def h(i):
+        if h_stamp[i] == gen:
+            return h_value[i]
+        value = h_value[i] = heuristic(labels[i], target)
+        h_stamp[i] = gen
+        return value
+
+    g_score[s] = 0
+    parent[s] = -1
+    stamp[s] = gen
+    now, later = [(s, 0)], []
+    f_limit = h(s)
+    iterations = expanded = max_fringe = 0
+
+    while now:
+        iterations += 1
+        f_min = inf
+        while now:
+            node, g_cost = now.pop()
+            if g_cost != g_score[node]:
+                continue
+            f_cost = g_cost + h(node)
+            if f_cost > f_limit:
+                if f_cost < f_min:
+                    f_min = f_cost
+                later.append((node, g_cost))
+                continue
+
+            if node == t:
+                _record_stats(search_stats, iterations, expanded, max_fringe)
+                path = [node]
+                while parent[node] >= 0:
+                    node = parent[node]
+                    path.append(node)
+                return G.path_labels(path[::-1])
+
+            expanded += 1
+            start, end = indptr[node], indptr[node + 1]
+            children = []
+            for neighbor, cost in zip(
+                    indices[start:end].tolist(), weights[start:end].tolist()
+            ):
+                next_g = g_cost + cost
+                if stamp[neighbor] != gen or next_g < g_score[neighbor]:
+                    g_score[neighbor] = next_g
+                    parent[neighbor] = node
+                    stamp[neighbor] = gen
+                    children.append((neighbor, next_g))
+            children.reverse()  # So the first child is visited first
+            now.extend(children)
+
+        max_fringe = max(max_fringe, len(later))
+        later.reverse()
+        now, later = later, now
+        f_limit = f_min
+
+    _record_stats(search_stats, iterations, expanded, max_fringe)
+    raise nx.NetworkXNoPath(f"Node {target} not reachable from {source}")
+
+
+def _record_stats(search_stats, iterations, expanded, max_fringe):
+    """Copies the counters of a finished search into `search_stats`."""
+    if search_stats is None:
+        return
+    search_stats["iterations"] = iterations
+    search_stats["expanded"] = expanded
+    search_stats["max_fringe"] = max_fringe
+
+
+def fringe_search_path_length(G, source, target, heuristic=None, weight="weight"):
+    """Returns the length of the shortest path between source and target using
+    Fringe Search.
+
+    Parameters
+    ----------
+    G : NetworkX graph or CSRGraph
+        A graph (directed or undirected) representing the structure to search.
+
+    source : node
+        Starting node for path.
+
+    target : node
+        Ending node for path.
+
+    heuristic : function, optional
+        A function to estimate the cost from a node to the target. It must take
+        two node arguments and return a number. If not provided, the default is
+        a zero heuristic.
+
+    weight : string or function, optional (default='weight')
+        If a string, it is interpreted as the edge attribute used as the edge
+        weight. If a function, it must accept exactly three positional arguments:
+        the two endpoints of an edge and the dictionary of edge attributes for
+        that edge. It must return a numeric value or None to hide the edge.
+
+    Returns
+    -------
+    length : float
+        The total length (sum of edge weights) of the path found.
+
+    Raises
+    ------
+    NetworkXNoPath
+        If no path exists between source and target.
+
+    NetworkXNodeNotFound
+        If either source or target is not in the graph.
+
+    See Also
+    --------
+    fringe_search_path
+    """
+    if source not in G or target not in G:
+        msg = f"Either source {source} or target {target} is not in G"
+        raise nx.NodeNotFound(msg)
+
+    if isinstance(G, CSRGraph):
+        path = fringe_search_path(G, source, target, heuristic)
+        return G.path_cost([G.index[node] for node in path])
+
+    weight = _weight_function(G, weight)
+    path = fringe_search_path(G, source, target, heuristic, weight)
+    return sum(weight(u, v, G[u][v]) for u, v in zip(path[:-1], path[1:]))
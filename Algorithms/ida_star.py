@@ -1,8 +1,18 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed, wait
+
 import networkx as nx
 from networkx.algorithms.shortest_paths.weighted import _weight_function
 from collections import deque
 
-def idastar_path(G, source, target, heuristic=None, weight="weight"):
+from Algorithms.csr_graph import CSRGraph, to_csr_graph
+from Algorithms.workspace import _workspace_for
+
+def idastar_path(
+        G, source, target, heuristic=None, weight="weight", workspace=None,
+        threshold_growth=None, suboptimality=1.0, search_stats=None, transposition_size=None,
+        processes=None, split_depth=2,
+):
     """Returns a list of nodes in a shortest path between source and target
     using the Iterative Deepening A* (IDA*) algorithm.
 
@@ -10,8 +20,10 @@ def idastar_path(G, source, target, heuristic=None, weight="weight"):
 
     Parameters
     ----------
-    G : NetworkX graph
+    G : NetworkX graph or CSRGraph
         A graph (directed or undirected) representing the structure to search.
+        A :class:`~Algorithms.csr_graph.CSRGraph` snapshot is searched over
+        integer node ids; `weight` is then ignored.
 
     source : node
         Starting node for path.
@@ -30,6 +42,59 @@ def idastar_path(G, source, target, heuristic=None, weight="weight"):
         the two endpoints of an edge and the dictionary of edge attributes for
         that edge. It must return a numeric value or None to hide the edge.
 
+    workspace : SearchWorkspace, optional
+        Reusable, generation-stamped scratch arrays for the CSRGraph snapshot
+        `G`; lets back-to-back queries skip per-node allocation.
+
+    threshold_growth : float, optional (default=None)
+        If given (it must be greater than 1), thresholds are raised with the
+        IDA*-CR policy: the f-costs pruned by an iteration are bucketed and
+        the next threshold is chosen so that the next iteration expands about
+        `threshold_growth` times as many nodes. With real-valued weights this
+        avoids iterations that add a single node. The path is still optimal
+        for an admissible heuristic unless `suboptimality` is raised. If None,
+        each threshold is the smallest f-cost pruned by the previous iteration.
+
+    suboptimality : float, optional (default=1.0)
+        With `threshold_growth`, the first path found whose cost is at most
+        `suboptimality` times the current lower bound on the optimal cost is
+        returned at once. Costlier paths, and every path when this is 1, are
+        only returned after the rest of the iteration proves that no cheaper
+        path is within the threshold. Must be at least 1.
+
+    search_stats : dict, optional (default=None)
+        If given, filled with the counters of the search: iterations,
+        expanded (nodes whose successors were generated, summed over all
+        iterations), reexpanded (expansions before the last iteration) and
+        per_iteration, a list of {"threshold", "expanded"} dicts. With a
+        transposition table it also holds transposition_pruned and
+        transposition_replaced; with `processes`, subtrees counts the tasks
+        handed to workers.
+
+    transposition_size : int, optional (default=None)
+        If given, the search keeps a transposition table with this many
+        slots holding the best g-cost seen per node. A node reached again at
+        a higher cost, or at the same cost later in the same iteration, is
+        pruned, within and across iterations. The table is direct-mapped, so
+        its memory is fixed: on a collision the entry from the current
+        iteration and the lowest g-cost (the larger subtree) is kept.
+
+    processes : int, optional (default=None)
+        If given, every iteration is split across a pool of this many worker
+        processes. The calling process expands the first `split_depth` levels
+        below the threshold and hands each remaining subtree to a worker;
+        workers report the smallest f-cost they pruned, and as soon as one of
+        them finds an acceptable path the others stop. The graph is compiled
+        to a read-only CSRGraph snapshot (`weight` applied) that is sent once
+        to each worker, so `heuristic` must be picklable, e.g. a module-level
+        function or a :class:`~Algorithms.geo_heuristic.HaversineHeuristic`.
+        With a transposition table, each subtree gets its own table of
+        `transposition_size` slots. `workspace` is not used.
+
+    split_depth : int, optional (default=2)
+        Depth of the tree expanded by the calling process before the
+        subtrees are distributed; deeper splits give more, smaller tasks.
+
     Returns
     -------
     path : list
@@ -43,6 +108,11 @@ def idastar_path(G, source, target, heuristic=None, weight="weight"):
     NetworkXNodeNotFound
         If either source or target is not in the graph.
 
+    ValueError
+        If `threshold_growth` is not greater than 1, `suboptimality` is
+        smaller than 1, or `transposition_size`, `processes` or
+        `split_depth` is smaller than 1.
+
     Examples
     --------
     >>> G = nx.path_graph(5)
@@ -72,7 +142,10 @@ def idastar_path(G, source, target, heuristic=None, weight="weight"):
     This function is suitable for graphs with large search spaces where memory
     efficiency is important or memory capacity is reduced, as it uses depth-first
     search and avoids storing all frontier nodes, keeping track of only the nodes
-    that construct the path and removing the ones that do not.
+    that construct the path and removing the ones that do not. Each iteration
+    keeps a single path stack that is extended and backtracked in place, with a
+    set of the nodes on it to reject cycles in constant time, so memory grows
+    with the depth of the path rather than with the number of expansions.
 
     See Also
     --------
@@ -84,55 +157,415 @@ def idastar_path(G, source, target, heuristic=None, weight="weight"):
     if target not in G:
         raise nx.NodeNotFound(f"Target {target} is not in G")
 
+    if threshold_growth is not None and threshold_growth <= 1:
+        raise ValueError("threshold_growth must be greater than 1")
+    if suboptimality < 1:
+        raise ValueError("suboptimality must be at least 1")
+    if transposition_size is not None and transposition_size < 1:
+        raise ValueError("transposition_size must be at least 1")
+    if processes is not None and processes < 1:
+        raise ValueError("processes must be at least 1")
+    if split_depth < 1:
+        raise ValueError("split_depth must be at least 1")
+
     if heuristic is None:
         # Default heuristic is h=0, equivalent to Dijkstra's algorithm
-        def heuristic(u, v):
-            return 0
+        heuristic = _zero_heuristic
+
+    policy = (threshold_growth, suboptimality, search_stats, transposition_size)
+    if processes is not None:
+        C = G if isinstance(G, CSRGraph) else to_csr_graph(G, weight)
+        return _idastar_parallel(C, source, target, heuristic, processes, split_depth, *policy)
+    if isinstance(G, CSRGraph):
+        return _idastar_csr(G, source, target, heuristic, workspace, policy)
+    if workspace is not None:
+        workspace.check(G)
 
     weight_fn = _weight_function(G, weight)
     G_succ = G._adj
 
-    threshold = heuristic(source, target)
+    def successors(node):
+        for neighbor, edge_attrs in G_succ[node].items():
+            cost = weight_fn(node, neighbor, edge_attrs)
+            if cost is not None:
+                yield neighbor, cost
 
-    while True:
-        stack = [(source, 0, [source])]
-        visited = set()
-        min_threshold = float("inf")
+    def h(node):
+        return heuristic(node, target)
 
-        while stack:
-            node, g_cost, path = stack.pop()
-            f_cost = g_cost + heuristic(node, target)
+    return _iterative_deepening(source, target, successors, h, *policy)
 
-            if f_cost > threshold:
-                min_threshold = min(min_threshold, f_cost)
-                continue
 
-            if node == target:
-                return path
+def _zero_heuristic(u, v):
+    return 0
 
-            if node in visited:
-                continue
-            visited.add(node)
 
-            neighbors = []
-            for neighbor, edge_attrs in G_succ[node].items():
-                if neighbor in path:
-                    continue
-                cost = weight_fn(node, neighbor, edge_attrs)
-                if cost is None:
-                    continue
-                next_g = g_cost + cost
-                f_neighbor = next_g + heuristic(neighbor, target)
-                neighbors.append((f_neighbor, neighbor, next_g, path + [neighbor]))
+def _idastar_csr(G, source, target, heuristic, workspace=None, policy=()):
+    """IDA* over a CSRGraph snapshot; returns the path as node labels.
 
-            neighbors.sort(reverse=True)  # So lowest f_cost is last (stack = LIFO)
-            for _, neighbor, next_g, next_path in neighbors:
-                stack.append((neighbor, next_g, next_path))
+    Heuristic values are cached in the workspace for the whole query, so
+    every iteration after the first reuses them.
+    """
+    ws = _workspace_for(G, workspace)
+    query_gen = ws.begin()
+    labels = G.nodes
+    indptr, indices, weights = G._succ_ptr, G.succ_indices, G.succ_weights
+    h_value, h_stamp = ws.h_value[0], ws.h_stamp[0]
+
+    def h(i):
+        if h_stamp[i] == query_gen:
+            return h_value[i]
+        value = h_value[i] = heuristic(labels[i], target)
+        h_stamp[i] = query_gen
+        return value
+
+    def successors(node):
+        # A generator over positions, so a pending frame copies nothing.
+        for k in range(indptr[node], indptr[node + 1]):
+            yield indices.item(k), weights.item(k)
+
+    path = _iterative_deepening(G.index[source], G.index[target], successors, h, *policy)
+    return G.path_labels(path)
+
+
+def _iterative_deepening(
+        source, target, successors, h, growth=None, suboptimality=1.0, stats=None, table_size=None
+):
+    """Raises the f-cost threshold until a bounded depth-first search reaches
+    `target`; `successors(u)` yields (v, cost) pairs and `h(u)` estimates the
+    cost from u to the target.
+
+    With `growth`, thresholds follow the IDA*-CR policy of
+    :class:`_ThresholdBuckets`; otherwise each threshold is the smallest
+    f-cost pruned by the previous iteration.
+    """
+    inf = float("inf")
+    threshold = lower_bound = h(source)
+    table = _TranspositionTable(table_size) if table_size is not None else None
+    iterations = []
+    while True:
+        if table is not None:
+            table.iteration += 1
+        buckets = _ThresholdBuckets(threshold) if growth is not None and threshold > 0 else None
+        # Classic IDA* only finds paths of cost <= lower bound, so it keeps
+        # the first one; a CR threshold may overshoot the optimum.
+        accept = suboptimality * lower_bound if buckets is not None else inf
+        path, next_threshold, expanded = _bounded_dfs(
+            [source], 0, threshold, target, successors, h, accept, buckets, table
+        )
+        iterations.append({"threshold": threshold, "expanded": expanded})
+        if path is not None or next_threshold == inf:
+            break
+        lower_bound = next_threshold
+        if buckets is not None:
+            next_threshold = buckets.next_threshold((growth - 1) * expanded)
+        threshold = next_threshold
+
+    if stats is not None:
+        total = sum(it["expanded"] for it in iterations)
+        stats["iterations"] = len(iterations)
+        stats["expanded"] = total
+        stats["reexpanded"] = total - iterations[-1]["expanded"]
+        stats["per_iteration"] = iterations
+        if table is not None:
+            stats["transposition_pruned"] = table.pruned
+            stats["transposition_replaced"] = table.replaced
+    if path is None:
+        raise nx.NetworkXNoPath(f"Node {target} not reachable from {source}")
+    return path
+
+
+class _ThresholdBuckets:
+    """Histogram of the f-costs pruned by one IDA*-CR iteration.
+
+    The range above the current threshold is split into buckets of a fixed
+    fraction of the threshold; costs beyond the last bucket share it. The
+    next threshold is the upper edge of the first bucket at which enough
+    pruned nodes are covered to grow the next iteration by the requested
+    factor, instead of the single smallest pruned cost.
+    """
+
+    n_buckets = 100
+    width_ratio = 0.01
+
+    def __init__(self, threshold):
+        self.threshold = threshold
+        self.width = threshold * self.width_ratio
+        self.counts = [0] * self.n_buckets
+        self.largest = threshold
+
+    def add(self, f_cost):
+        index = int((f_cost - self.threshold) / self.width)
+        self.counts[min(index, self.n_buckets - 1)] += 1
+        if f_cost > self.largest:
+            self.largest = f_cost
+
+    def next_threshold(self, wanted):
+        covered = 0
+        last = self.n_buckets - 1
+        for index, count in enumerate(self.counts):
+            covered += count
+            if covered >= wanted and index < last:
+                return self.threshold + (index + 1) * self.width
+        return self.largest
+
+
+class _TranspositionTable:
+    """Fixed-size, direct-mapped table of the best g-cost reached per node.
+
+    Each slot holds one node, its lowest known g-cost and the iteration that
+    stored it. A cheaper path always replaces a costlier one; on a collision
+    between two nodes the slot goes to the current iteration, then to the
+    lower g-cost, whose subtree is usually larger.
+    """
 
-        if min_threshold == float("inf"):
-            raise nx.NetworkXNoPath(f"Node {target} not reachable from {source}")
+    def __init__(self, size):
+        self.size = size
+        self.nodes = [None] * size
+        self.g_costs = [0.0] * size
+        self.stamps = [0] * size
+        self.iteration = 0
+        self.pruned = 0
+        self.replaced = 0
+
+    def dominated(self, node, g_cost):
+        """
+        Returns True if `node` was already reached at a lower g-cost, or at
+        the same one earlier in this iteration; otherwise records `g_cost`.
+        """
+        slot = hash(node) % self.size
+        occupant = self.nodes[slot]
+        if occupant is not None and occupant == node:
+            stored = self.g_costs[slot]
+            if g_cost > stored or (g_cost == stored and self.stamps[slot] == self.iteration):
+                self.pruned += 1
+                return True
+        elif occupant is not None:
+            if self.stamps[slot] == self.iteration and self.g_costs[slot] <= g_cost:
+                return False
+            self.replaced += 1
+        self.nodes[slot] = node
+        self.g_costs[slot] = g_cost
+        self.stamps[slot] = self.iteration
+        return False
+
+
+def _bounded_dfs(
+        path, g_cost, threshold, target, successors, h, accept=float("inf"), buckets=None, table=None,
+        leaves=None, leaf_depth=None, stop=None,
+):
+    """Depth-first search below `threshold`, extending `path` in place.
+
+    `path` is the single path stack shared by the whole iteration: a child is
+    pushed when it is entered and popped when its subtree is exhausted, and
+    the set of nodes on the path rejects cycles in O(1). Each stack frame
+    only holds the g-cost of its node and a lazy iterator over its
+    successors, which are visited in adjacency order, so the memory used is
+    O(depth) whatever the branching factor.
+
+    A solution costing at most `accept` is returned at once. A costlier one
+    becomes the incumbent: the rest of the iteration only looks for cheaper
+    paths (branch and bound) and the best one found is returned. Pruned
+    f-costs are added to `buckets` when given, and nodes that `table`
+    reports as dominated are skipped. With `leaves`, paths reaching
+    `leaf_depth` edges are appended to it as (path, g_cost) instead of being
+    expanded. The search gives up early once the `stop` event is set.
+
+    Returns (path, threshold, expanded) when the target is reached, or
+    (None, next_threshold, expanded) with the smallest f-cost that exceeded
+    `threshold` (infinity if nothing was pruned). `expanded` counts the
+    nodes whose successors were generated.
+    """
+    inf = float("inf")
+    node = path[-1]
+    f_cost = g_cost + h(node)
+    if f_cost > threshold:
+        return None, f_cost, 0
+    if node == target:
+        return path, threshold, 0
+    if table is not None:
+        table.dominated(node, g_cost)
+
+    on_path = set(path)
+    next_threshold = inf
+    best, best_cost = None, inf
+    expanded = 0
+
+    frames = [successors(node)]
+    costs = [g_cost]
+    expanded += 1
+    while frames:
+        child = next(frames[-1], None)
+        if child is None:
+            # Subtree exhausted: backtrack in place.
+            frames.pop()
+            costs.pop()
+            if frames:
+                on_path.discard(path.pop())
+            continue
+
+        node, cost = child
+        if node in on_path:
+            continue
+        g_cost = costs[-1] + cost
+        f_cost = g_cost + h(node)
+        if f_cost > threshold:
+            if f_cost < next_threshold:
+                next_threshold = f_cost
+            if buckets is not None:
+                buckets.add(f_cost)
+            continue
+        if f_cost >= best_cost:
+            continue
+        if node == target:
+            if g_cost <= accept:
+                path.append(node)
+                return path, threshold, expanded
+            best, best_cost = path + [node], g_cost
+            continue
+        if table is not None and table.dominated(node, g_cost):
+            continue
+        path.append(node)
+        if leaves is not None and len(path) > leaf_depth:
+            leaves.append((path.copy(), g_cost))
+            path.pop()
+            continue
+        on_path.add(node)
+        frames.append(successors(node))
+        costs.append(g_cost)
+        expanded += 1
+        if stop is not None and expanded % 64 == 0 and stop.is_set():
+            break
+
+    if best is not None:
+        return best, threshold, expanded
+    return None, next_threshold, expanded
+
+
+def _csr_search_functions(C, heuristic, target):
+    """Returns (successors, h) over the node ids of the CSRGraph `C`, with
+    heuristic values cached per id."""
+    labels = C.nodes
+    indptr, indices, weights = C._succ_ptr, C.succ_indices, C.succ_weights
+    h_cache = {}
+
+    def h(i):
+        value = h_cache.get(i)
+        if value is None:
+            value = h_cache[i] = heuristic(labels[i], target)
+        return value
+
+    def successors(node):
+        # A generator over positions, so a pending frame copies nothing.
+        for k in range(indptr[node], indptr[node + 1]):
+            yield indices.item(k), weights.item(k)
+
+    return successors, h
+
+
+_subtree_worker = None
+
+
+def _init_subtree_worker(C, heuristic, target, stop):
+    """Pool initializer: keeps the read-only snapshot in the worker process."""
+    global _subtree_worker
+    successors, h = _csr_search_functions(C, heuristic, target)
+    _subtree_worker = (C, C.index[target], successors, h, stop)
+
+
+def _search_subtree(prefix, g_cost, threshold, accept, bucketed, table_size):
+    """Searches the subtree below `prefix` in a worker process.
+
+    Returns (path, cost, next_threshold, expanded, histogram); the histogram
+    is the (counts, largest) pair of the IDA*-CR buckets, or None. The stop
+    event is set as soon as an acceptable path is found.
+    """
+    C, t, successors, h, stop = _subtree_worker
+    if stop.is_set():
+        return None, float("inf"), float("inf"), 0, None
+    buckets = _ThresholdBuckets(threshold) if bucketed else None
+    table = None
+    if table_size is not None:
+        table = _TranspositionTable(table_size)
+        table.iteration = 1
+    path, next_threshold, expanded = _bounded_dfs(
+        prefix, g_cost, threshold, t, successors, h, accept, buckets, table, stop=stop
+    )
+    cost = C.path_cost(path) if path is not None else float("inf")
+    if path is not None and cost <= accept:
+        stop.set()
+    histogram = (buckets.counts, buckets.largest) if buckets is not None else None
+    return path, cost, next_threshold, expanded, histogram
+
+
+def _idastar_parallel(
+        C, source, target, heuristic, processes, split_depth,
+        growth=None, suboptimality=1.0, stats=None, table_size=None,
+):
+    """IDA* with every iteration split into root subtrees searched by a
+    process pool; mirrors :func:`_iterative_deepening`."""
+    inf = float("inf")
+    successors, h = _csr_search_functions(C, heuristic, target)
+    s, t = C.index[source], C.index[target]
+    stop = multiprocessing.Event()
+    threshold = lower_bound = h(s)
+    iterations = []
+    subtrees = 0
+    with ProcessPoolExecutor(
+            processes, initializer=_init_subtree_worker, initargs=(C, heuristic, target, stop)
+    ) as pool:
+        while True:
+            stop.clear()
+            bucketed = growth is not None and threshold > 0
+            buckets = _ThresholdBuckets(threshold) if bucketed else None
+            accept = suboptimality * lower_bound if bucketed else inf
+            leaves = []
+            best, next_threshold, expanded = _bounded_dfs(
+                [s], 0, threshold, t, successors, h, accept, buckets, leaves=leaves, leaf_depth=split_depth
+            )
+            best_cost = C.path_cost(best) if best is not None else inf
+            if best is None or best_cost > accept:
+                futures = [
+                    pool.submit(_search_subtree, prefix, g_cost, threshold, accept, bucketed, table_size)
+                    for prefix, g_cost in leaves
+                ]
+                subtrees += len(futures)
+                for future in as_completed(futures):
+                    path, cost, pruned, work, histogram = future.result()
+                    expanded += work
+                    next_threshold = min(next_threshold, pruned)
+                    if histogram is not None:
+                        counts, largest = histogram
+                        buckets.counts = [a + b for a, b in zip(buckets.counts, counts)]
+                        buckets.largest = max(buckets.largest, largest)
+                    if cost < best_cost:
+                        best, best_cost = path, cost
+                    if best is not None and best_cost <= accept:
+                        stop.set()
+                        for pending in futures:
+                            pending.cancel()
+                        wait(futures)
+                        break
+
+            iterations.append({"threshold": threshold, "expanded": expanded})
+            if best is not None or next_threshold == inf:
+                break
+            lower_bound = next_threshold
+            if buckets is not None:
+                next_threshold = buckets.next_threshold((growth - 1) * expanded)
+            threshold = next_threshold
+
+    if stats is not None:
+        total = sum(it["expanded"] for it in iterations)
+        stats["iterations"] = len(iterations)
+        stats["expanded"] = total
+        stats["reexpanded"] = total - iterations[-1]["expanded"]
+        stats["per_iteration"] = iterations
+        stats["subtrees"] = subtrees
+    if best is None:
+        raise nx.NetworkXNoPath(f"Node {target} not reachable from {source}")
+    return C.path_labels(best)
 
-        threshold = min_threshold
 
 def idastar_path_length(G, source, target, heuristic=None, weight="weight"):
     """Returns the length of the shortest path between source and target using
@@ -186,6 +619,10 @@ def idastar_path_length(G, source, target, heuristic=None, weight="weight"):
         msg = f"Either source {source} or target {target} is not in G"
         raise nx.NodeNotFound(msg)
 
+    if isinstance(G, CSRGraph):
+        path = idastar_path(G, source, target, heuristic)
+        return G.path_cost([G.index[node] for node in path])
+
     # Get the graph node weights
     weight = _weight_function(G, weight)
     path = idastar_path(G, source, target, heuristic, weight)
@@ -0,0 +1,194 @@
+"""Indexed d-ary min-heap with decrease-key, shared by the search algorithms."""
+
+from itertools import count
+
+__all__ = ["IndexedHeap"]
+
+
+class IndexedHeap:
+    """
+    Priority queue holding at most one entry per item.
+
+    A position map tracks where every item sits in the heap, so lowering the
+    priority of a queued item moves its entry in place (decrease-key)
+    instead of pushing a duplicate that later has to be popped and skipped.
+    The heap therefore never grows beyond the live frontier.
+
+    Entries are ``(priority, seq, item)`` tuples; `seq` increases with every
+    push or decrease, so equal priorities pop in FIFO order like the
+    ``(priority, next(counter), item)`` tuples used with :mod:`heapq`.
+    Entries can be read like a heapq list: ``heap[0]`` is the minimum entry.
+
+    Parameters
+    ----------
+    arity : int, optional (default=4)
+        Number of children per heap node. Wider heaps are shallower, which
+        makes decrease-key and push cheaper at the cost of slower pops.
+    capacity : int, optional
+        If given, items must be integers in ``range(capacity)`` (e.g.
+        CSRGraph node ids) and positions are kept in a preallocated list
+        instead of a dictionary.
+
+    Attributes
+    ----------
+    pushes : int
+        Number of items inserted.
+    decreases : int
+        Number of in-place priority decreases, i.e. duplicate entries a
+        lazy heapq queue would have pushed and later popped as stale.
+    max_size : int
+        Largest number of entries held at once.
+
+    Examples
+    --------
+    >>> heap = IndexedHeap()
+    >>> heap.push("a", 5)
+    True
+    >>> heap.push("b", 3)
+    True
+    >>> heap.push("a", 1)
+    True
+    >>> heap.push("a", 4)
+    False
+    >>> len(heap), heap.decreases
+    (2, 1)
+    >>> heap.pop()
+    (1, 'a')
+    """
+
+    def __init__(self, arity=4, capacity=None):
+        if arity < 2:
+            raise ValueError("arity must be at least 2")
+        self.arity = arity
+        self._entries = []
+        self._array = capacity is not None
+        self._pos = [-1] * capacity if self._array else {}
+        self._seq = count()
+        self.pushes = 0
+        self.decreases = 0
+        self.max_size = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __bool__(self):
+        return bool(self._entries)
+
+    def __getitem__(self, index):
+        return self._entries[index]
+
+    def __contains__(self, item):
+        return self._position(item) >= 0
+
+    def _position(self, item):
+        if self._array:
+            return self._pos[item]
+        return self._pos.get(item, -1)
+
+    def push(self, item, priority):
+        """
+        Inserts `item`, or lowers its priority if it is already queued.
+
+        Returns True if the heap changed, False if `item` was already queued
+        with a priority that is lower or equal.
+        """
+        i = self._position(item)
+        if i < 0:
+            entries = self._entries
+            entries.append((priority, next(self._seq), item))
+            self.pushes += 1
+            if len(entries) > self.max_size:
+                self.max_size = len(entries)
+            self._sift_up(len(entries) - 1)
+            return True
+        if priority >= self._entries[i][0]:
+            return False
+        self._entries[i] = (priority, next(self._seq), item)
+        self.decreases += 1
+        self._sift_up(i)
+        return True
+
+    def peek(self):
+        """Returns ``(priority, item)`` of the minimum without removing it."""
+        priority, _, item = self._entries[0]
+        return priority, item
+
+    def pop(self):
+        """Removes and returns ``(priority, item)`` of the minimum entry."""
+        priority, _, item = self._remove_at(0)
+        return priority, item
+
+    def priority(self, item):
+        """Returns the queued priority of `item`; raises KeyError if absent."""
+        i = self._position(item)
+        if i < 0:
+            raise KeyError(item)
+        return self._entries[i][0]
+
+    def remove(self, item):
+        """Removes `item` from the heap; raises KeyError if absent."""
+        i = self._position(item)
+        if i < 0:
+            raise KeyError(item)
+        self._remove_at(i)
+
+    def clear(self):
+        """Empties the heap in O(len(self)) and resets the counters."""
+        if self._array:
+            for _, _, item in self._entries:
+                self._pos[item] = -1
+        else:
+            self._pos.clear()
+        self._entries.clear()
+        self.pushes = self.decreases = self.max_size = 0
+
+    def _remove_at(self, i):
+        entries = self._entries
+        entry = entries[i]
+        last = entries.pop()
+        if self._array:
+            self._pos[entry[2]] = -1
+        else:
+            del self._pos[entry[2]]
+        if i < len(entries):
+            entries[i] = last
+            self._pos[last[2]] = i
+            if i > 0 and last < entries[(i - 1) // self.arity]:
+                self._sift_up(i)
+            else:
+                self._sift_down(i)
+        return entry
+
+    def _sift_up(self, i):
+        entries, pos, arity = self._entries, self._pos, self.arity
+        entry = entries[i]
+        while i > 0:
+            parent = (i - 1) // arity
+            above = entries[parent]
+            if above <= entry:
+                break
+            entries[i] = above
+            pos[above[2]] = i
+            i = parent
+        entries[i] = entry
+        pos[entry[2]] = i
+
+    def _sift_down(self, i):
+        entries, pos, arity = self._entries, self._pos, self.arity
+        n = len(entries)
+        entry = entries[i]
+        while True:
+            child = arity * i + 1
+            if child >= n:
+                break
+            best, best_entry = child, entries[child]
+            for j in range(child + 1, min(child + arity, n)):
+                if entries[j] < best_entry:
+                    best, best_entry = j, entries[j]
+            if entry <= best_entry:
+                break
+            entries[i] = best_entry
+            pos[best_entry[2]] = i
+            i = best
+        entries[i] = entry
+        pos[entry[2]] = i
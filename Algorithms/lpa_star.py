@@ -0,0 +1,397 @@
+"""Incremental shortest paths between fixed endpoints using Lifelong Planning A* (LPA*)."""
+
+import networkx as nx
+
+from Algorithms.d_star_lite import PriorityQueue, _InfinityMap
+
+__all__ = [
+    "new_lpa_star_instance",
+    "lpa_star_modify_edge",
+    "lpa_star_modify_edges",
+    "lpa_star_remove_edge",
+    "lpa_star_recalculate_path",
+    "lpa_star_get_path_cost",
+    "lpa_star_get_path_length",
+]
+
+
+@nx._dispatchable(edge_attrs="weight", preserve_node_attrs="heuristic")
+def new_lpa_star_instance(G, source, target, weight="weight", heuristic=None, deferred=False):
+    """
+    Initializes a new instance of Lifelong Planning A* for a NetworkX graph.
+
+    LPA* searches forward from the source and repairs its g/rhs values when
+    edge weights change, like D* Lite does, but it assumes both endpoints
+    stay fixed: there is no key modifier and no backward search. Use it for
+    routes whose start never moves; use D* Lite for a moving agent.
+    Parameters
+    ----------
+    G : nx.Graph or nx.DiGraph
+        The search graph containing nodes and weighted edges. The instance
+        works on a copy; edges without `weight` count as 1.
+    source : hashable
+        The starting node for the path.
+    target : hashable
+        The target node for the path.
+    weight : str, optional
+        The edge attribute that represents the weights. Default is 'weight'.
+    heuristic : function(u, v) -> float, optional
+        A consistent estimate of the distance between two nodes; it is
+        called as heuristic(u, target). Default is a zero heuristic.
+    deferred : bool, optional
+        If True, edge modifications only mark the affected vertices; the
+        replanning pass runs once, at the next path request. Default is False.
+    Returns
+    -------
+    LPAStar
+        A configured instance, with the initial path already computed.
+    Raises
+    ------
+    NodeNotFound
+        If `source` or `target` is not in `G`.
+    Examples
+    --------
+    >>> G = nx.DiGraph()
+    >>> G.add_weighted_edges_from([("A", "B", 1), ("B", "C", 2), ("A", "D", 4), ("D", "C", 1), ("C", "E", 3)])
+    >>> lpa = new_lpa_star_instance(G, "A", "E")
+    >>> lpa.get_path(), lpa.get_path_cost()
+    (['A', 'B', 'C', 'E'], 6)
+    >>> _ = lpa_star_modify_edge(lpa, "B", "C", 10)
+    >>> lpa_star_recalculate_path(lpa), lpa.get_path_cost()
+    (['A', 'D', 'C', 'E'], 8)
+    """
+    return LPAStar(G, source, target, heuristic, weight, deferred)
+
+
+def lpa_star_modify_edge(instance, u, v, new_weight):
+    """
+    Dynamically modifies (or adds) the edge (u, v) and updates the path.
+    Parameters
+    ----------
+    instance : LPAStar
+        The active instance of the algorithm.
+    u, v : hashable
+        The endpoints of the edge.
+    new_weight : float
+        The new weight/cost of the edge.
+    Returns
+    -------
+    nx.Graph or nx.DiGraph
+        The instance's updated graph.
+    """
+    return instance.modify_edge(u, v, new_weight)
+
+
+def lpa_star_modify_edges(instance, updates):
+    """
+    Applies a batch of edge weight changes with a single replanning pass.
+    Parameters
+    ----------
+    instance : LPAStar
+        The active instance of the algorithm.
+    updates : iterable of (u, v, new_weight)
+        The edges to modify; later entries for the same edge win.
+    Returns
+    -------
+    nx.Graph or nx.DiGraph
+        The instance's updated graph.
+    """
+    return instance.modify_edges(updates)
+
+
+def lpa_star_remove_edge(instance, u, v):
+    """
+    Removes the edge (u, v) and updates the path.
+    Parameters
+    ----------
+    instance : LPAStar
+        The active instance of the algorithm.
+    u, v : hashable
+        The endpoints of the edge.
+    Returns
+    -------
+    nx.Graph or nx.DiGraph
+        The instance's updated graph.
+    """
+    return instance.remove_edge(u, v)
+
+
+def lpa_star_recalculate_path(instance):
+    """
+    Returns the current shortest path, replanning first if modifications
+    are pending (deferred mode).
+    Parameters
+    ----------
+    instance : LPAStar
+        The active instance of the algorithm.
+    Returns
+    -------
+    list or None
+        A list of nodes representing the path, or None if no path exists.
+    """
+    return instance.get_path()
+
+
+def lpa_star_get_path_cost(instance):
+    """
+    Returns the total cost of the current path, or infinity if no path exists.
+    Parameters
+    ----------
+    instance : LPAStar
+        The active instance of the algorithm.
+    Returns
+    -------
+    int or float
+        The sum of the edge weights along the path.
+    """
+    return instance.get_path_cost()
+
+
+def lpa_star_get_path_length(instance):
+    """
+    Returns the number of edges of the current path, or infinity if no path exists.
+    Parameters
+    ----------
+    instance : LPAStar
+        The active instance of the algorithm.
+    Returns
+    -------
+    int or float
+        The number of edges in the path.
+    """
+    return instance.get_path_length()
+
+
+class LPAStar:
+    """
+    Implementation of Lifelong Planning A* for fixed source/target replanning.
+    Attributes
+    ----------
+    G : nx.Graph or nx.DiGraph
+        The instance's copy of the input graph.
+    source, target : hashable
+        The fixed endpoints.
+    weight : str
+        The edge attribute representing weights.
+    heuristic : function
+        The heuristic, evaluated as heuristic(u, target).
+    g_score : dict
+        The known cost from the source to each node; nodes the search has
+        not reached read as infinity.
+    rhs : dict
+        The one-step lookahead cost from the source, stored like `g_score`.
+    queue : PriorityQueue
+        The locally inconsistent nodes, shared implementation with D* Lite.
+    last_path : list or None
+        The last computed shortest path.
+    deferred : bool
+        Whether edge changes wait for the next path request to be replanned.
+    replans : int
+        Number of calls to compute_shortest_path, including the initial one.
+    """
+
+    def __init__(self, G, source, target, heuristic=None, weight="weight", deferred=False):
+        for node in (source, target):
+            if node not in G:
+                raise nx.NodeNotFound(f"Node {node} is not in G")
+        self.G = G.copy()
+        self.source = source
+        self.target = target
+        self.weight = weight
+        self.heuristic = heuristic if heuristic else (lambda u, v: 0)
+        self.deferred = deferred
+        self.replans = 0
+        self._dirty = set()
+
+        self.g_score = _InfinityMap()
+        self.rhs = _InfinityMap()
+        self.rhs[source] = 0
+        self.queue = PriorityQueue()
+        self.last_path = None
+        self.queue.push(source, self.compute_key(source))
+        self.compute_shortest_path()
+
+    def _predecessors(self, u):
+        """Yields (p, weight) for every edge entering u."""
+        adj = self.G._pred if self.G.is_directed() else self.G._adj
+        weight = self.weight
+        return ((p, d.get(weight, 1)) for p, d in adj[u].items())
+
+    def compute_key(self, u):
+        """
+        Computes the priority key for node u.
+        Formula
+        -------
+        key = (min(g(u), rhs(u)) + h(u, target), min(g(u), rhs(u)))
+        """
+        g_rhs_min = min(self.g_score[u], self.rhs[u])
+        return g_rhs_min + self.heuristic(u, self.target), g_rhs_min
+
+    def update_vertex(self, u):
+        """
+        Recomputes rhs(u) from the predecessors of u and queues u if it is
+        locally inconsistent.
+        """
+        if u != self.source:
+            g_score = self.g_score
+            costs = [g_score[p] + w for p, w in self._predecessors(u)]
+            self.rhs[u] = min(costs) if costs else float("inf")
+        self.queue.remove(u)
+        if self.g_score[u] != self.rhs[u]:
+            self.queue.push(u, self.compute_key(u))
+
+    def compute_shortest_path(self):
+        """
+        Expands inconsistent nodes until the target is locally consistent
+        and no queued key is smaller than its key, then rebuilds the path.
+        Vertices touched by pending edge modifications are updated first.
+        """
+        self.replans += 1
+        for u in self._dirty:
+            if u in self.G:
+                self.update_vertex(u)
+        self._dirty.clear()
+        target = self.target
+        while not self.queue.empty():
+            if (
+                    self.rhs[target] == self.g_score[target]
+                    and self.queue.top_key() >= self.compute_key(target)
+            ):
+                break
+            u = self.queue.pop()
+            if self.g_score[u] > self.rhs[u]:
+                self.g_score[u] = self.rhs[u]
+                for v in self.G._adj[u]:
+                    self.update_vertex(v)
+            else:
+                self.g_score[u] = float("inf")
+                for v in self.G._adj[u]:
+                    self.update_vertex(v)
+                self.update_vertex(u)
+        self.last_path = self._extract_path()
+
+    def _extract_path(self):
+        """
+        Walks back from the target through a predecessor p that realizes
+        rhs(u) = g(p) + c(p, u), preferring one that is itself locally
+        consistent, so the path costs exactly rhs(target). Returns None if
+        the target is unreachable.
+        """
+        if self.rhs[self.target] == float("inf"):
+            return None
+        g_score, rhs = self.g_score, self.rhs
+        path = [self.target]
+        visited = {self.target}
+        current = self.target
+        while current != self.source:
+            best = None
+            for p, w in self._predecessors(current):
+                if g_score[p] + w == rhs[current]:
+                    if g_score[p] == rhs[p]:
+                        best = p
+                        break
+                    if best is None:
+                        best = p
+            if best is None or best in visited:
+                return None
+            visited.add(best)
+            path.append(best)
+            current = best
+        path.reverse()
+        return path
+
+    def modify_edge(self, u, v, new_weight):
+        """
+        Sets the weight of edge (u, v), adding the edge if needed, and
+        replans unless the instance is deferred.
+        Returns
+        -------
+        nx.Graph or nx.DiGraph
+            The instance's updated graph.
+        """
+        self._apply_edge_change(u, v, new_weight)
+        if not self.deferred:
+            self.compute_shortest_path()
+        return self.G
+
+    def modify_edges(self, updates):
+        """
+        Applies several edge weight changes, then replans once (or, in
+        deferred mode, at the next path request).
+        Parameters
+        ----------
+        updates : iterable of (u, v, new_weight)
+            The edges to modify and their new weights.
+        Returns
+        -------
+        nx.Graph or nx.DiGraph
+            The instance's updated graph.
+        """
+        for u, v, new_weight in updates:
+            self._apply_edge_change(u, v, new_weight)
+        if not self.deferred and self._dirty:
+            self.compute_shortest_path()
+        return self.G
+
+    def remove_edge(self, u, v):
+        """
+        Removes the edge (u, v) and replans unless the instance is deferred.
+        Returns
+        -------
+        nx.Graph or nx.DiGraph
+            The instance's updated graph.
+        Raises
+        ------
+        NetworkXError
+            If the edge is not in the graph.
+        """
+        self.G.remove_edge(u, v)
+        self._mark(u, v)
+        if not self.deferred:
+            self.compute_shortest_path()
+        return self.G
+
+    def _apply_edge_change(self, u, v, new_weight):
+        """Stores the new weight and marks the vertices whose rhs may change."""
+        if self.G.has_edge(u, v):
+            self.G[u][v][self.weight] = new_weight
+        else:
+            self.G.add_edge(u, v, **{self.weight: new_weight})
+        self._mark(u, v)
+
+    def _mark(self, u, v):
+        # The forward search reads edge (u, v) when computing rhs(v).
+        self._dirty.add(v)
+        if not self.G.is_directed():
+            self._dirty.add(u)
+
+    def _replan_if_pending(self):
+        """Runs the deferred replanning pass if modifications are waiting."""
+        if self._dirty:
+            self.compute_shortest_path()
+
+    def get_path(self):
+        """
+        Returns a copy of the current shortest path, or None if no path exists.
+        """
+        self._replan_if_pending()
+        return self.last_path.copy() if self.last_path else None
+
+    def get_path_length(self):
+        """
+        Returns the number of edges in the current path, or infinity if there is no path.
+        """
+        self._replan_if_pending()
+        return len(self.last_path) - 1 if self.last_path else float("inf")
+
+    def get_path_cost(self):
+        """
+        Returns the total cost of the current path, or infinity if there is no path.
+        """
+        self._replan_if_pending()
+        if self.last_path is None:
+            return float("inf")
+        weight = self.weight
+        return sum(
+            self.G[u][v].get(weight, 1) for u, v in zip(self.last_path, self.last_path[1:])
+        )
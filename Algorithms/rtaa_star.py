@@ -8,6 +8,9 @@ from networkx.algorithms.shortest_paths.weighted import _weight_function
 from networkx.exception import NetworkXNoPath, NodeNotFound
 from networkx.utils import not_implemented_for
 
+from Algorithms.csr_graph import CSRGraph
+from Algorithms.indexed_heap import IndexedHeap
+
 __all__ = ["rtaa_star_path", "rtaa_star_path_length"]
 
 """
@@ -25,6 +28,8 @@ def _rtaa_star_search(
         lookahead=None,
         move_limit=1,
         landmarks=None,
+        indexed_heap=False,
+        heap_stats=None,
 ):
     """
     Internal function that executes the enhanced RTAA* algorithm and
@@ -46,8 +51,27 @@ def _rtaa_star_search(
                 if node not in G:
                     raise NodeNotFound(f"Landmark {node} is not in the graph")
 
+    # On a CSRGraph snapshot the search runs over integer node ids; labels
+    # are only used to evaluate the heuristic and to report the path.
+    labels = None
+    if isinstance(G, CSRGraph):
+        labels = G.nodes
+        source, target = G.index[source], G.index[target]
+        if landmarks and not isinstance(landmarks, int):
+            landmarks = [G.index[node] for node in landmarks]
+        if heuristic is not None:
+            label_heuristic = heuristic
+
+            def heuristic(u, v):
+                return label_heuristic(labels[u], labels[v])
+
+        def neighbors(node):
+            return G.successors(node)
+
+        edge_cost = G.edge_weight
+
     # Function to retrieve edge weight (attribute or function)
-    if callable(weight):
+    elif callable(weight):
         weight_func = weight
     else:
 
@@ -55,10 +79,19 @@ def _rtaa_star_search(
             data = G.get_edge_data(u, v, default={})
             return data.get(weight, 1)  # assume weight 1 if attribute is missing
 
+    if labels is None:
+
+        def neighbors(node):
+            return ((nbr, weight_func(node, nbr)) for nbr in G[node])
+
+        edge_cost = weight_func
+
     # Euclidean distance function (if coordinates available, else 0)
     def euclidean_distance(u, v):
         # Try to extract node coordinates (from 'pos' attribute or tuple)
         def get_coords(node):
+            if labels is not None:
+                node = labels[node]
             # If the node is directly a numeric tuple (e.g., (x, y))
             if (
                     isinstance(node, tuple)
@@ -67,7 +100,7 @@ def _rtaa_star_search(
             ):
                 return node
             # If the node has position attributes in the graph
-            if node in G.nodes:
+            if labels is None and node in G.nodes:
                 data = G.nodes[node]
                 if "pos" in data:
                     return data["pos"]
@@ -105,8 +138,8 @@ def _rtaa_star_search(
                     d, node = heappop(open_heap)
                     if d != dist_map[node]:
                         continue
-                    for nbr in G[node]:
-                        new_d = d + weight_func(node, nbr)
+                    for nbr, w in neighbors(node):
+                        new_d = d + w
                         if new_d < dist_map.get(nbr, float("inf")):
                             dist_map[nbr] = new_d
                             heappush(open_heap, (new_d, nbr))
@@ -125,8 +158,8 @@ def _rtaa_star_search(
                     d, node = heappop(open_heap)
                     if d != dist_map[node]:
                         continue
-                    for nbr in G[node]:
-                        new_d = d + weight_func(node, nbr)
+                    for nbr, w in neighbors(node):
+                        new_d = d + w
                         if new_d < dist_map.get(nbr, float("inf")):
                             dist_map[nbr] = new_d
                             heappush(open_heap, (new_d, nbr))
@@ -149,8 +182,8 @@ def _rtaa_star_search(
                 d, node = heappop(open_heap)
                 if d != distances[node]:
                     continue
-                for nbr in G[node]:
-                    new_d = d + weight_func(node, nbr)
+                for nbr, w in neighbors(node):
+                    new_d = d + w
                     if new_d < distances.get(nbr, float("inf")):
                         distances[nbr] = new_d
                         heappush(open_heap, (new_d, nbr))
@@ -195,31 +228,46 @@ def _rtaa_star_search(
     # Determine expansion limit (lookahead); None/0 => full search
     expansion_limit = float("inf") if not lookahead or lookahead <= 0 else lookahead
 
+    # Queue counters, summed over all lookahead searches
+    counters = {"heap_pushes": 0, "decrease_keys": 0, "stale_pops": 0, "max_heap_size": 0}
+
     # Current state of the agent (starts at source)
     current = source
     # Main loop of RTAA*
     while current != target:
         # Set up A* search from the current state
-        open_heap = []  # heap of (f, order, node)
         closed_set = set()
         g = {current: 0.0}
         parent = {current: None}
         # Insert current node
         f_start = adapt_h.get(current, base_heuristic(current))
-        heappush(open_heap, (f_start, 0, current))
+        if indexed_heap:
+            open_heap = IndexedHeap()  # one (f, order, node) entry per node
+            open_heap.push(current, f_start)
+        else:
+            open_heap = []  # heap of (f, order, node)
+            heappush(open_heap, (f_start, 0, current))
+        counters["heap_pushes"] += 1
         expansions = 0
         s_bar = None
         found_goal = False
 
         # Limited A* (expand up to expansion_limit nodes)
         while open_heap and expansions < expansion_limit:
-            f_val, _, node = heappop(open_heap)
+            if len(open_heap) > counters["max_heap_size"]:
+                counters["max_heap_size"] = len(open_heap)
+            if indexed_heap:
+                f_val, node = open_heap.pop()
+            else:
+                f_val, _, node = heappop(open_heap)
             if node in closed_set:
+                counters["stale_pops"] += 1
                 continue
             closed_set.add(node)
             # Check if the entry is outdated
             # (can occur if g/h values were improved)
             if f_val != g[node] + adapt_h.get(node, base_heuristic(node)):
+                counters["stale_pops"] += 1
                 continue
             # If goal is reached, exit
             if node == target:
@@ -228,15 +276,23 @@ def _rtaa_star_search(
                 break
             # Expand neighbors of the current node
             expansions += 1
-            for nbr in G[node]:
+            for nbr, w in neighbors(node):
                 if nbr in closed_set:
                     continue
-                new_cost = g[node] + weight_func(node, nbr)
+                new_cost = g[node] + w
                 if new_cost < g.get(nbr, float("inf")):
                     g[nbr] = new_cost
                     parent[nbr] = node
                     f_nbr = new_cost + adapt_h.get(nbr, base_heuristic(nbr))
-                    heappush(open_heap, (f_nbr, expansions, nbr))
+                    if indexed_heap:
+                        if nbr in open_heap:
+                            counters["decrease_keys"] += 1
+                        else:
+                            counters["heap_pushes"] += 1
+                        open_heap.push(nbr, f_nbr)
+                    else:
+                        counters["heap_pushes"] += 1
+                        heappush(open_heap, (f_nbr, expansions, nbr))
             # If expansion limit reached, choose best frontier node
             if expansions >= expansion_limit:
                 if open_heap:
@@ -300,10 +356,14 @@ def _rtaa_star_search(
                 next_node = segment[i]
                 path.append(next_node)
                 # add edge cost (current -> next_node)
-                path_cost += weight_func(current, next_node)
+                path_cost += edge_cost(current, next_node)
                 current = next_node
             # Main loop continues with the current state updated
+    if heap_stats is not None:
+        heap_stats.update(counters)
     # Return the complete path and its total cost
+    if labels is not None:
+        path = [labels[node] for node in path]
     return path, path_cost
 
 
@@ -317,6 +377,8 @@ def rtaa_star_path(
         lookahead=None,
         move_limit=1,
         landmarks=None,
+        indexed_heap=False,
+        heap_stats=None,
 ):
     """
     Return a list of nodes in a path between source and target using
@@ -329,8 +391,10 @@ def rtaa_star_path(
 
     Parameters
     ----------
-    G : NetworkX graph
-        The input graph.
+    G : NetworkX graph or CSRGraph
+        The input graph. A :class:`~Algorithms.csr_graph.CSRGraph`
+        snapshot is searched over integer node ids; `weight` is then
+        ignored.
 
     source : node
         Starting node for the path.
@@ -370,6 +434,16 @@ def rtaa_star_path(
         estimate. If an iterable of nodes is given, those nodes are
         used as landmarks. If None, no landmark heuristic is used.
 
+    indexed_heap : bool, optional (default=False)
+        If True, every lookahead search keeps its open list in an
+        :class:`~Algorithms.indexed_heap.IndexedHeap`, which lowers the key
+        of a queued node in place instead of pushing a duplicate entry.
+
+    heap_stats : dict, optional (default=None)
+        If given, filled with the open-list counters summed over all
+        lookahead searches: heap_pushes, decrease_keys, stale_pops and
+        max_heap_size.
+
     Returns
     -------
     path : list
@@ -413,7 +487,8 @@ def rtaa_star_path(
     [0, 1, 2, 3, 4]
     """
     path, cost = _rtaa_star_search(
-        G, source, target, heuristic, weight, lookahead, move_limit, landmarks
+        G, source, target, heuristic, weight, lookahead, move_limit, landmarks,
+        indexed_heap, heap_stats,
     )
     return path
 
@@ -428,6 +503,7 @@ def rtaa_star_path_length(
         lookahead=None,
         move_limit=1,
         landmarks=None,
+        indexed_heap=False,
 ):
     """
     Return the length (total weight) of a path between source and target
@@ -464,6 +540,9 @@ def rtaa_star_path_length(
     landmarks : int or iterable, optional (default=None)
         Landmarks for ALT heuristic (see `rtaa_star_path`).
 
+    indexed_heap : bool, optional (default=False)
+        Use a decrease-key open list (see `rtaa_star_path`).
+
     Returns
     -------
     length : number
@@ -477,6 +556,7 @@ def rtaa_star_path_length(
         If no path exists between source and target.
     """
     path, cost = _rtaa_star_search(
-        G, source, target, heuristic, weight, lookahead, move_limit, landmarks
+        G, source, target, heuristic, weight, lookahead, move_limit, landmarks,
+        indexed_heap,
     )
     return cost
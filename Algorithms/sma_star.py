@@ -10,6 +10,9 @@ __all__ = ["sma_star_path", "sma_star_path_length"]
 
 from networkx.algorithms.shortest_paths.weighted import _weight_function
 
+from Algorithms.csr_graph import CSRGraph
+from Algorithms.indexed_heap import IndexedHeap
+from Algorithms.workspace import _workspace_for
 from Config import MEMORY_LIMIT
 
 
@@ -44,26 +47,39 @@ def euclidean_heuristic(G, u, v):
 
 
 def sma_star_path(
-        G, source, target, heuristic=None, weight="weight", memory_limit=MEMORY_LIMIT
+        G, source, target, heuristic=None, weight="weight", memory_limit=MEMORY_LIMIT,
+        workspace=None, indexed_heap=False, heap_stats=None,
 ):
     """
     Returns the shortest path between 'source' and 'target' using the SMA* algorithm.
 
     Parameters
     ----------
-    G : networkx.Graph or networkx.DiGraph
-        Graph on which to perform the search.
+    G : networkx.Graph, networkx.DiGraph or CSRGraph
+        Graph on which to perform the search. A CSRGraph snapshot is
+        searched over integer node ids; `weight` is then ignored.
     source : node
         Starting node.
     target : node
         Goal node.
     heuristic : callable, optional
         Heuristic function h(u, v) estimating the cost between nodes.
-        Defaults to Euclidean distance if not provided.
+        Defaults to Euclidean distance if not provided (zero on a CSRGraph,
+        which carries no node attributes).
     weight : string or callable, optional
         Edge data key corresponding to the edge weight (default: "weight").
     memory_limit : int, optional
         Maximum number of nodes to keep in memory (default: 10000).
+    workspace : SearchWorkspace, optional
+        Reusable, generation-stamped scratch arrays for the CSRGraph snapshot
+        `G`; lets back-to-back queries skip per-node allocation.
+    indexed_heap : bool, optional
+        If True, the queue is an :class:`~Algorithms.indexed_heap.IndexedHeap`
+        that holds one entry per node and lowers its key in place, instead of
+        a heapq list that accumulates stale duplicates (default: False).
+    heap_stats : dict, optional
+        If given, filled with the queue counters of the search:
+        heap_pushes, decrease_keys, stale_pops and max_heap_size.
 
     Returns
     -------
@@ -82,6 +98,13 @@ def sma_star_path(
     if target not in G:
         raise nx.NodeNotFound(f"Target {target} is not in G")
 
+    if isinstance(G, CSRGraph):
+        return _sma_star_csr(
+            G, source, target, heuristic, memory_limit, workspace, indexed_heap, heap_stats
+        )
+    if workspace is not None:
+        workspace.check(G)
+
     if heuristic is None:
         def heuristic(u, v):
             return euclidean_heuristic(G, u, v)
@@ -90,25 +113,42 @@ def sma_star_path(
     weight_fn = _weight_function(G, weight)
     G_succ = G._adj
     counter = count()
+    stats = {"stale_pops": 0, "max_heap_size": 0}
 
-    queue = [(0, next(counter), source, 0, None)]
+    if indexed_heap:
+        queue = IndexedHeap()
+        queue.push(source, 0)
+        queued_parent = {}
+    else:
+        queue = [(0, next(counter), source, 0, None)]
     best_cost = {source: 0}
     came_from = {}
 
     while queue:
+        if len(queue) > stats["max_heap_size"]:
+            stats["max_heap_size"] = len(queue)
         if len(queue) > memory_limit:
-            queue.sort(reverse=True, key=lambda x: x[0])
-            queue.pop(0)
+            if indexed_heap:
+                queue.remove(max(queue)[2])
+            else:
+                queue.sort(reverse=True, key=lambda x: x[0])
+                queue.pop(0)
 
-        f, _, current, g, parent = pop(queue)
+        if indexed_heap:
+            _, current = queue.pop()
+            g, parent = best_cost[current], queued_parent.get(current)
+        else:
+            f, _, current, g, parent = pop(queue)
 
         if g > best_cost.get(current, float("inf")):
+            stats["stale_pops"] += 1
             continue
 
         if parent is not None:
             came_from[current] = parent
 
         if current == target:
+            _record_heap_stats(heap_stats, stats, queue, counter, indexed_heap)
             path = [current]
             while current in came_from:
                 current = came_from[current]
@@ -124,13 +164,116 @@ def sma_star_path(
             if new_cost < best_cost.get(neighbor, float("inf")):
                 best_cost[neighbor] = new_cost
                 h = heuristic(neighbor, target)
-                push(queue, (new_cost + h, next(counter), neighbor, new_cost, current))
+                if indexed_heap:
+                    queue.push(neighbor, new_cost + h)
+                    queued_parent[neighbor] = current
+                else:
+                    push(queue, (new_cost + h, next(counter), neighbor, new_cost, current))
 
+    _record_heap_stats(heap_stats, stats, queue, counter, indexed_heap)
+    raise nx.NetworkXNoPath(f"Node {target} not reachable from {source}")
+
+
+def _record_heap_stats(heap_stats, stats, queue, counter, indexed_heap):
+    """Copies the queue counters of a finished search into `heap_stats`."""
+    if heap_stats is None:
+        return
+    heap_stats.update(stats)
+    if indexed_heap:
+        heap_stats["heap_pushes"] = queue.pushes
+        heap_stats["decrease_keys"] = queue.decreases
+    else:
+        heap_stats["heap_pushes"] = next(counter)
+        heap_stats["decrease_keys"] = 0
+
+
+def _sma_star_csr(
+        G, source, target, heuristic, memory_limit, workspace=None, indexed_heap=False,
+        heap_stats=None,
+):
+    """SMA* over a CSRGraph snapshot; returns the path as node labels."""
+    ws = _workspace_for(G, workspace)
+    gen = ws.begin()
+    labels = G.nodes
+    s = G.index[source]
+    t = G.index[target]
+    indptr, indices, weights = G._succ_ptr, G.succ_indices, G.succ_weights
+    best_cost, came_from, stamp = ws.dist[0], ws.pred[0], ws.stamp[0]
+
+    if heuristic is None:
+        def heuristic(u, v):
+            return 0
+
+    push, pop = heappush, heappop
+    counter = count()
+    stats = {"stale_pops": 0, "max_heap_size": 0}
+
+    if indexed_heap:
+        queue = ws.indexed_heaps()[0]
+        queue.push(s, 0)
+        queued_parent = ws.pred[1]
+    else:
+        queue = ws.heap[0]
+        queue.append((0, next(counter), s, 0, -1))
+    best_cost[s] = 0
+    came_from[s] = -1
+    stamp[s] = gen
+
+    while queue:
+        if len(queue) > stats["max_heap_size"]:
+            stats["max_heap_size"] = len(queue)
+        if len(queue) > memory_limit:
+            if indexed_heap:
+                queue.remove(max(queue)[2])
+            else:
+                queue.sort(reverse=True, key=lambda x: x[0])
+                queue.pop(0)
+
+        if indexed_heap:
+            _, current = queue.pop()
+            g = best_cost[current]
+            parent = queued_parent[current] if current != s else -1
+        else:
+            f, _, current, g, parent = pop(queue)
+
+        if g > best_cost[current]:
+            stats["stale_pops"] += 1
+            continue
+
+        if parent >= 0:
+            came_from[current] = parent
+
+        if current == t:
+            _record_heap_stats(heap_stats, stats, queue, counter, indexed_heap)
+            path = [current]
+            while came_from[current] >= 0 and current != s:
+                current = came_from[current]
+                path.append(current)
+            return G.path_labels(path[::-1])
+
+        start, end = indptr[current], indptr[current + 1]
+        for neighbor, cost in zip(
+                indices[start:end].tolist(), weights[start:end].tolist()
+        ):
+            new_cost = g + cost
+            if stamp[neighbor] != gen or new_cost < best_cost[neighbor]:
+                best_cost[neighbor] = new_cost
+                came_from[neighbor] = -1
+                stamp[neighbor] = gen
+                h = heuristic(labels[neighbor], target)
+                if indexed_heap:
+                    queue.push(neighbor, new_cost + h)
+                    queued_parent[neighbor] = current
+                else:
+                    push(queue, (new_cost + h, next(counter), neighbor, new_cost, current))
+
+    _record_heap_stats(heap_stats, stats, queue, counter, indexed_heap)
     raise nx.NetworkXNoPath(f"Node {target} not reachable from {source}")
 
 
 def sma_star_path_length(
-        G, source, target, heuristic=None, weight="weight", memory_limit=MEMORY_LIMIT
+        G, source, target, heuristic=None, weight="weight", memory_limit=MEMORY_LIMIT,
+        indexed_heap=False,
 ):
     """
     Returns the total cost of the shortest path found by SMA*.
@@ -149,13 +292,19 @@ def sma_star_path_length(
         Edge data key corresponding to the edge weight.
     memory_limit : int, optional
         Maximum number of nodes to keep in memory (default: 10000).
+    indexed_heap : bool, optional
+        Use a decrease-key queue, as in :func:`sma_star_path`.
 
     Returns
     -------
     float
         Total cost of the computed path.
     """
-    path = sma_star_path(G, source, target, heuristic, weight, memory_limit)
+    path = sma_star_path(
+        G, source, target, heuristic, weight, memory_limit, indexed_heap=indexed_heap
+    )
+    if isinstance(G, CSRGraph):
+        return G.path_cost([G.index[node] for node in path])
     return sum(
         _weight_function(G, weight)(u, v, G[u][v]) for u, v in zip(path[:-1], path[1:])
     )
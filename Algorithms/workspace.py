@@ -0,0 +1,106 @@
+"""Reusable, generation-stamped scratch space for repeated searches on one graph."""
+
+import networkx as nx
+
+from Algorithms.csr_graph import CSRGraph
+from Algorithms.indexed_heap import IndexedHeap
+
+__all__ = ["SearchWorkspace"]
+
+
+class SearchWorkspace:
+    """
+    Preallocated per-node arrays shared by back-to-back queries on a CSRGraph.
+
+    Every array slot is paired with a stamp. A slot only holds a value for the
+    current query when its stamp equals the current generation, so starting a
+    new query is a single counter increment instead of clearing or
+    reallocating ``dist``/``pred``/``seen``/``visited`` structures.
+
+    A workspace may be passed as ``workspace=`` to ``bidirectional_astar``,
+    ``idastar_path`` and ``sma_star_path`` when they are called with the
+    snapshot it was built for. It is not thread-safe: use one workspace per
+    thread or process.
+
+    Attributes
+    ----------
+    graph : CSRGraph
+        The snapshot the arrays are sized for.
+    generation : int
+        Stamp of the current query; bumped by :meth:`begin`.
+    dist, pred, stamp : list of lists
+        Per-direction tentative cost, predecessor id and validity stamp.
+    closed : list of lists
+        Per-direction stamp marking nodes as settled/visited.
+    h_value, h_stamp : list of lists
+        Per-direction heuristic cache and its validity stamp.
+    heap : list of lists
+        Per-direction priority queues, emptied in place between queries.
+        Searches run with ``indexed_heap=True`` use :meth:`indexed_heaps`
+        instead.
+    queries : int
+        Number of queries run on this workspace.
+
+    Examples
+    --------
+    >>> from Algorithms.csr_graph import to_csr_graph
+    >>> from Algorithms.bi_astar import bidirectional_astar
+    >>> C = to_csr_graph(nx.path_graph(5))
+    >>> ws = SearchWorkspace(C)
+    >>> [bidirectional_astar(C, 0, t, workspace=ws)[0] for t in (2, 4)]
+    [2.0, 4.0]
+    >>> ws.queries
+    2
+    """
+
+    def __init__(self, G, directions=2):
+        if not isinstance(G, CSRGraph):
+            raise nx.NetworkXError("SearchWorkspace requires a CSRGraph snapshot")
+        n = G.number_of_nodes()
+        self.graph = G
+        self.generation = 0
+        self.queries = 0
+        self.dist = [[0.0] * n for _ in range(directions)]
+        self.pred = [[-1] * n for _ in range(directions)]
+        self.stamp = [[0] * n for _ in range(directions)]
+        self.closed = [[0] * n for _ in range(directions)]
+        self.h_value = [[0.0] * n for _ in range(directions)]
+        self.h_stamp = [[0] * n for _ in range(directions)]
+        self.heap = [[] for _ in range(directions)]
+        self._indexed = None
+
+    def begin(self):
+        """
+        Starts a new query: invalidates every slot in O(1) and empties the
+        heaps in place. Returns the new generation.
+        """
+        self.generation += 1
+        self.queries += 1
+        for heap in self.heap:
+            heap.clear()
+        return self.generation
+
+    def indexed_heaps(self):
+        """
+        Per-direction array-backed :class:`~Algorithms.indexed_heap.IndexedHeap`
+        queues, allocated on first use and emptied before being returned.
+        """
+        if self._indexed is None:
+            n = self.graph.number_of_nodes()
+            self._indexed = [IndexedHeap(capacity=n) for _ in self.heap]
+        for heap in self._indexed:
+            heap.clear()
+        return self._indexed
+
+    def check(self, G):
+        """Raises NetworkXError unless this workspace was built for `G`."""
+        if G is not self.graph:
+            raise nx.NetworkXError("workspace was built for a different graph")
+
+
+def _workspace_for(G, workspace):
+    """Returns `workspace` after checking it matches `G`, or a fresh one."""
+    if workspace is None:
+        return SearchWorkspace(G)
+    workspace.check(G)
+    return workspace
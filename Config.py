@@ -5,5 +5,6 @@ N_MODIFICATIONS = 100
 SOURCE = "Tirana"
 TARGET = "Helsinki"
 CSV_PATH = "Csv/cities_nodes_special.csv"
+COORDS_PATH = "Csv/cities_coordinates.csv"
 EXCEL_FILE = "metrics.xlsx"
 DIRECTED = False
@@ -1,6 +1,8 @@
 import pandas as pd
 import networkx as nx
 
+from Algorithms.geo_heuristic import CoordinateIndex
+
 def generate_graph_from_csv(csv_path: str, weight_field: str = "distance_km", directed=False) -> nx.Graph:
     df = pd.read_csv(csv_path)
 
@@ -15,3 +17,9 @@ def generate_graph_from_csv(csv_path: str, weight_field: str = "distance_km", di
     print(G)
 
     return G
+
+
+def load_coordinate_index(csv_path: str, node_field: str = "city", lat_field: str = "lat",
+                          lon_field: str = "lon") -> CoordinateIndex:
+    df = pd.read_csv(csv_path)
+    return CoordinateIndex(df[node_field].tolist(), df[lat_field].to_numpy(), df[lon_field].to_numpy())
@@ -1,9 +1,16 @@
+import itertools
+
 import pytest
 
 import networkx as nx
 from networkx.utils import pairwise
 
-from Algorithms.bi_astar import bidirectional_astar
+from Algorithms.bi_astar import (
+    bidirectional_astar,
+    bidirectional_astar_anytime,
+    bidirectional_astar_batch,
+    bidirectional_astar_k_shortest,
+)
 
 
 class TestAStar:
@@ -306,4 +313,139 @@ class TestBidirectionalAStar:
         cost, path, stats = bidirectional_astar(G, "a", "a")
         assert path == ["a"]
         assert cost == 0
-        assert stats["total_nodes_expanded"] == 1
\ No newline at end of file
+        assert stats["total_nodes_expanded"] == 1
+
+    def test_bidirectional_astar_optimal_cost(self):
+        G = nx.gnp_random_graph(80, 0.06, seed=11, directed=True)
+        for u, v in G.edges():
+            G[u][v]["weight"] = (u * 7 + v * 13) % 17 + 1
+        for s, t in [(0, 40), (5, 77), (12, 3), (60, 21)]:
+            if not nx.has_path(G, s, t):
+                continue
+            cost, path, stats = bidirectional_astar(G, s, t)
+            assert cost == nx.dijkstra_path_length(G, s, t)
+            assert stats["optimal"]
+
+    def test_bidirectional_astar_mu_with_heuristic(self):
+        G = nx.grid_2d_graph(12, 12)
+        for u, v in G.edges():
+            G[u][v]["weight"] = 1 + (u[0] * v[1]) % 3
+
+        def manhattan(u, v):
+            return abs(u[0] - v[0]) + abs(u[1] - v[1])
+
+        cost, path, stats = bidirectional_astar(G, (0, 0), (11, 11), heuristic=manhattan)
+        first_meet = bidirectional_astar(G, (0, 0), (11, 11), heuristic=manhattan, optimal=False)
+        assert cost == nx.dijkstra_path_length(G, (0, 0), (11, 11))
+        assert cost <= first_meet[0]
+        assert path[0] == (0, 0) and path[-1] == (11, 11)
+
+    def test_bidirectional_astar_budget_keeps_best_meeting(self):
+        G = nx.path_graph(30)
+        cost, path, stats = bidirectional_astar(G, 0, 29, max_nodes_expanded=4)
+        assert path[0] == 0 and path[-1] == 29
+        assert cost == 29
+
+
+class TestBidirectionalAStarAnytime:
+    @pytest.mark.parametrize("directed", [False, True])
+    def test_anytime_converges_with_valid_bounds(self, directed):
+        G = nx.gnp_random_graph(80, 0.06, seed=11, directed=directed)
+        for u, v in G.edges():
+            G[u][v]["weight"] = (u * 7 + v * 13) % 17 + 1
+        for s, t in [(0, 40), (5, 77), (12, 3), (60, 21)]:
+            if not nx.has_path(G, s, t):
+                continue
+            best = nx.dijkstra_path_length(G, s, t)
+            results = list(bidirectional_astar_anytime(G, s, t, epsilon=4.0))
+            for cost, path, bound in results:
+                assert path[0] == s and path[-1] == t
+                assert sum(G[a][b]["weight"] for a, b in pairwise(path)) == cost
+                assert best <= cost <= bound * best
+            for earlier, later in pairwise(results):
+                assert later[0] <= earlier[0] and later[2] <= earlier[2]
+            assert results[-1][0] == best and results[-1][2] == 1.0
+
+    def test_anytime_first_route_is_bounded_by_epsilon(self):
+        G = nx.grid_2d_graph(15, 15)
+        cost, path, bound = next(bidirectional_astar_anytime(G, (0, 0), (14, 14), epsilon=2.0))
+        assert 1.0 <= bound <= 2.0
+        assert cost <= bound * 28
+
+    def test_anytime_budget_and_errors(self):
+        G = nx.path_graph(30)
+        assert list(bidirectional_astar_anytime(G, 0, 29, max_nodes_expanded=3)) == []
+        assert list(bidirectional_astar_anytime(G, 4, 4)) == [(0, [4], 1.0)]
+        with pytest.raises(nx.NetworkXNoPath):
+            list(bidirectional_astar_anytime(nx.empty_graph(2), 0, 1))
+        with pytest.raises(ValueError):
+            list(bidirectional_astar_anytime(G, 0, 29, epsilon=0.5))
+
+
+class TestBidirectionalAStarKShortest:
+    @pytest.mark.parametrize("directed", [False, True])
+    def test_k_shortest_matches_networkx(self, directed):
+        G = nx.gnp_random_graph(60, 0.08, seed=5, directed=directed)
+        for u, v in G.edges():
+            G[u][v]["weight"] = (u * 7 + v * 13) % 17 + 1
+        for s, t in [(0, 40), (5, 57), (12, 3)]:
+            if not nx.has_path(G, s, t):
+                continue
+            expected = [
+                sum(G[a][b]["weight"] for a, b in pairwise(path))
+                for path in itertools.islice(nx.shortest_simple_paths(G, s, t, weight="weight"), 5)
+            ]
+            routes = bidirectional_astar_k_shortest(G, s, t, k=5)
+            assert [cost for cost, _, _ in routes] == expected
+            assert len({tuple(path) for _, path, _ in routes}) == len(routes)
+            for cost, path, stats in routes:
+                assert len(set(path)) == len(path)
+                assert sum(G[a][b]["weight"] for a, b in pairwise(path)) == cost
+                assert stats["nodes_expanded"] >= 0
+
+    def test_k_shortest_fewer_paths_than_k(self):
+        G = nx.path_graph(5)
+        routes = bidirectional_astar_k_shortest(G, 0, 4, k=4)
+        assert [(cost, path) for cost, path, _ in routes] == [(4.0, [0, 1, 2, 3, 4])]
+        assert routes[0][2]["spur_node"] is None
+
+    def test_k_shortest_errors(self):
+        with pytest.raises(nx.NetworkXNoPath):
+            bidirectional_astar_k_shortest(nx.empty_graph(2), 0, 1)
+        with pytest.raises(nx.NodeNotFound):
+            bidirectional_astar_k_shortest(nx.path_graph(3), 0, 9)
+        with pytest.raises(ValueError):
+            bidirectional_astar_k_shortest(nx.path_graph(3), 0, 2, k=0)
+
+
+class TestBidirectionalAStarBatch:
+    @pytest.mark.parametrize("directed", [False, True])
+    def test_batch_matches_dijkstra(self, directed):
+        G = nx.gnp_random_graph(120, 0.04, seed=3, directed=directed)
+        for u, v in G.edges():
+            G[u][v]["weight"] = (u * 5 + v * 3) % 11 + 1
+        nodes = list(G)
+        pairs = [(s, t) for s in nodes[::9] for t in nodes[:4]] + [(nodes[0], t) for t in nodes[50:60]]
+        costs, paths, stats = bidirectional_astar_batch(G, pairs, return_paths=True)
+        for s, t in pairs:
+            cost = costs[stats["sources"].index(s), stats["targets"].index(t)]
+            if nx.has_path(G, s, t):
+                assert cost == nx.dijkstra_path_length(G, s, t)
+                path = paths[(s, t)]
+                assert path[0] == s and path[-1] == t
+                assert sum(G[a][b]["weight"] for a, b in pairwise(path)) == cost
+            else:
+                assert cost == float("inf")
+                assert paths[(s, t)] is None
+        assert stats["trees_built"] < len(pairs)
+
+    def test_batch_unrequested_pairs_are_nan(self):
+        G = nx.path_graph(4)
+        costs, paths, stats = bidirectional_astar_batch(G, [(0, 3), (1, 2), (2, 2)])
+        assert paths is None
+        assert costs[0, 0] == 3 and costs[1, 1] == 1 and costs[2, 1] == 0
+        assert costs[0, 1] != costs[0, 1]  # nan
+
+    def test_batch_node_not_found(self):
+        with pytest.raises(nx.NodeNotFound):
+            bidirectional_astar_batch(nx.path_graph(3), [(0, 7)])
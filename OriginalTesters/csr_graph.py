@@ -0,0 +1,148 @@
+import random
+
+import networkx as nx
+import pytest
+
+from Algorithms.bi_astar import bidirectional_astar
+from Algorithms.csr_graph import CSRGraph, to_csr_graph
+from Algorithms.d_star_lite import new_dstar_lite_instance, d_star_modify_edge, d_star_recalculate_path
+from Algorithms.ida_star import idastar_path
+from Algorithms.rtaa_star import rtaa_star_path, rtaa_star_path_length
+from Algorithms.sma_star import sma_star_path, sma_star_path_length
+
+
+def random_weighted_graph(n=60, p=0.08, directed=False, seed=7):
+    rng = random.Random(seed)
+    G = nx.gnp_random_graph(n, p, seed=seed, directed=directed)
+    for u, v in G.edges():
+        G[u][v]["weight"] = rng.randint(1, 20)
+    return G
+
+
+class TestCSRGraph:
+    def test_layout_directed(self):
+        G = nx.DiGraph()
+        G.add_weighted_edges_from([("a", "b", 2), ("a", "c", 5), ("c", "b", 1)])
+        C = to_csr_graph(G)
+        a, b, c = (C.node_id(x) for x in "abc")
+        assert C.number_of_nodes() == 3
+        assert C.number_of_edges() == 3
+        assert sorted(C.successors(a)) == sorted([(b, 2.0), (c, 5.0)])
+        assert sorted(C.predecessors(b)) == sorted([(a, 2.0), (c, 1.0)])
+        assert C.edge_weight(c, b) == 1.0
+        assert C.edge_weight(b, c) is None
+        assert not C.succ_weights.flags.writeable
+
+    def test_layout_undirected(self):
+        G = nx.path_graph(4)
+        C = to_csr_graph(G)
+        assert C.number_of_edges() == 3
+        assert C.pred_indices is C.succ_indices
+        assert C.edge_weight(1, 0) == C.edge_weight(0, 1) == 1.0
+
+    def test_undirected_self_loops_are_counted(self):
+        G = nx.Graph([(0, 1), (1, 1), (1, 2)])
+        C = to_csr_graph(G)
+        assert C.number_of_edges() == G.number_of_edges() == 3
+        assert C.edge_weight(1, 1) == 1.0
+
+    def test_from_edge_arrays(self):
+        C = CSRGraph.from_edge_arrays(3, [1, 0, 1], [2, 1, 0], [3.0, 2.0, 4.0], nodes="abc")
+        assert C.nodes == ["a", "b", "c"]
+        assert C.number_of_edges() == 3
+        assert list(C.successors(1)) == [(0, 4.0), (2, 3.0)]
+        assert sorted(C.predecessors(1)) == [(0, 2.0)]
+
+        G = nx.Graph([(0, 1), (1, 1), (1, 2)])
+        rows, cols = zip(*[(u, v) for u in G for v in G[u]])
+        U = CSRGraph.from_edge_arrays(3, rows, cols, [1.0] * len(rows), directed=False)
+        D = to_csr_graph(G)
+        assert U.number_of_edges() == 3
+        assert U.succ_indptr.tolist() == D.succ_indptr.tolist()
+        assert U.succ_indices.tolist() == D.succ_indices.tolist()
+
+    def test_from_edge_arrays_rejects_bad_input(self):
+        with pytest.raises(ValueError):
+            CSRGraph.from_edge_arrays(2, [0], [1, 0], [1.0])
+        with pytest.raises(ValueError):
+            CSRGraph.from_edge_arrays(2, [0], [2], [1.0])
+        with pytest.raises(ValueError):
+            CSRGraph.from_edge_arrays(2, [0], [1], [1.0], nodes="abc")
+
+    def test_weight_function_hides_edges(self):
+        G = nx.Graph()
+        G.add_weighted_edges_from([(0, 1, 1), (1, 2, 100)])
+        C = to_csr_graph(G, weight=lambda u, v, d: None if d["weight"] > 10 else d["weight"])
+        assert C.number_of_edges() == 1
+
+    def test_node_not_found(self):
+        C = to_csr_graph(nx.path_graph(3))
+        assert "x" not in C
+        with pytest.raises(nx.NodeNotFound):
+            C.node_id("x")
+
+    def test_multigraph_not_supported(self):
+        with pytest.raises(nx.NetworkXNotImplemented):
+            to_csr_graph(nx.MultiGraph([(0, 1)]))
+
+
+class TestCSRAlgorithms:
+    @pytest.mark.parametrize("directed", [False, True])
+    def test_paths_match_networkx(self, directed):
+        G = random_weighted_graph(directed=directed)
+        C = to_csr_graph(G)
+        nodes = list(G)
+        rng = random.Random(3)
+        for _ in range(10):
+            s, t = rng.sample(nodes, 2)
+            if not nx.has_path(G, s, t):
+                continue
+            best = nx.dijkstra_path_length(G, s, t)
+
+            cost_nx, path_nx, _ = bidirectional_astar(G, s, t)
+            cost_csr, path_csr, stats = bidirectional_astar(C, s, t)
+            assert (cost_csr, path_csr) == (cost_nx, path_nx)
+            assert stats["total_nodes_expanded"] > 0
+
+            assert idastar_path(C, s, t) == idastar_path(G, s, t)
+            assert sma_star_path_length(C, s, t, memory_limit=10_000) == best
+            assert rtaa_star_path_length(C, s, t) == rtaa_star_path_length(G, s, t)
+            assert rtaa_star_path(C, s, t, lookahead=3, landmarks=3) == rtaa_star_path(
+                G, s, t, lookahead=3, landmarks=3
+            )
+
+            dstar = new_dstar_lite_instance(C, s, t)
+            assert dstar.get_path()[0] == s
+            assert dstar.get_path_cost() == best
+
+    def test_labels_are_returned(self):
+        G = nx.grid_2d_graph(4, 4)
+        C = to_csr_graph(G)
+        assert idastar_path(C, (0, 0), (3, 3))[-1] == (3, 3)
+        assert sma_star_path(C, (0, 0), (3, 3))[0] == (0, 0)
+
+    def test_no_path(self):
+        G = nx.Graph()
+        G.add_weighted_edges_from([(1, 2, 1), (3, 4, 1)])
+        C = to_csr_graph(G)
+        with pytest.raises(nx.NetworkXNoPath):
+            bidirectional_astar(C, 1, 4)
+        with pytest.raises(nx.NetworkXNoPath):
+            idastar_path(C, 1, 4)
+        with pytest.raises(nx.NodeNotFound):
+            bidirectional_astar(C, 1, 9)
+
+    def test_dstar_lite_modifications_stay_local(self):
+        G = nx.DiGraph()
+        G.add_weighted_edges_from(
+            [("A", "B", 1), ("B", "C", 2), ("A", "D", 4), ("D", "C", 1), ("C", "E", 3), ("B", "E", 5)]
+        )
+        C = to_csr_graph(G)
+        dstar = new_dstar_lite_instance(C, "A", "E")
+        assert dstar.get_path() == ["A", "B", "C", "E"]
+        d_star_modify_edge(dstar, "B", "C", 10)
+        assert d_star_recalculate_path(dstar) == ["A", "B", "E"]
+        assert dstar.get_path_cost() == 6
+        assert C.edge_weight(C.node_id("B"), C.node_id("C")) == 2.0
+        with pytest.raises(nx.NetworkXError):
+            d_star_modify_edge(dstar, "E", "A", 1)
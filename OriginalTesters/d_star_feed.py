@@ -0,0 +1,128 @@
+import asyncio
+import random
+
+import networkx as nx
+import pytest
+
+from Algorithms.csr_graph import to_csr_graph
+from Algorithms.d_star_feed import DStarLiteFeed
+from Algorithms.d_star_lite import new_dstar_lite_instance
+
+
+def weighted_grid(side=10, seed=0):
+    G = nx.grid_2d_graph(side, side).to_directed()
+    rng = random.Random(seed)
+    for u, v in G.edges():
+        G[u][v]["weight"] = rng.randint(1, 9)
+    return G
+
+
+class TestDStarLiteFeed:
+    def test_batches_match_direct_updates(self):
+        G = weighted_grid()
+        world = G.copy()
+        instances = {
+            "north": new_dstar_lite_instance(G, (0, 0), (9, 9), overlay=True),
+            "south": new_dstar_lite_instance(G, (9, 0), (0, 9), overlay=True),
+        }
+        published = []
+        feed = DStarLiteFeed(instances, window=0.01, on_path=lambda name, path: published.append(name))
+        rng = random.Random(1)
+        edges = list(G.edges())
+
+        async def producer():
+            for _ in range(200):
+                u, v = rng.choice(edges)
+                world[u][v]["weight"] = rng.randint(1, 30)
+                feed.submit(u, v, world[u][v]["weight"])
+                if rng.random() < 0.1:
+                    await asyncio.sleep(0.002)
+            feed.close()
+
+        async def main():
+            await asyncio.gather(feed.run(), producer())
+
+        asyncio.run(main())
+        assert feed.applied + feed.coalesced == 200
+        assert feed.batches < 200
+        assert len(feed.latencies) == 200
+        assert feed.published == len(published) > 0
+        for name, (source, target) in {"north": ((0, 0), (9, 9)), "south": ((9, 0), (0, 9))}.items():
+            assert instances[name].get_path_cost() == nx.dijkstra_path_length(world, source, target)
+            assert feed.latest[name] == instances[name].get_path()
+        p = feed.latency_percentiles((50, 99))
+        assert 0 <= p[50] <= p[99]
+
+    def test_publishes_only_changed_paths(self):
+        G = nx.DiGraph([("A", "B", {"weight": 1}), ("B", "C", {"weight": 1}), ("A", "C", {"weight": 5})])
+        published = []
+        feed = DStarLiteFeed(
+            new_dstar_lite_instance(G, "A", "C"), window=0, on_path=lambda name, path: published.append(path)
+        )
+
+        async def main():
+            task = asyncio.create_task(feed.run())
+            for weight in (2, 3, 9):
+                feed.submit("B", "C", weight)
+                await asyncio.sleep(0.01)
+            feed.submit("B", "C", 1)
+            feed.close()
+            await task
+
+        asyncio.run(main())
+        assert feed.batches == 4
+        assert published == [["A", "C"], ["A", "B", "C"]]
+        with pytest.raises(RuntimeError):
+            feed.submit("A", "B", 1)
+
+    def test_follow_file(self, tmp_path):
+        G = nx.path_graph(5, create_using=nx.DiGraph)
+        nx.set_edge_attributes(G, 1, "weight")
+        G.add_edge(0, 4, weight=10)
+        updates = tmp_path / "updates.csv"
+        updates.write_text("0,4,9\n")
+        feed = DStarLiteFeed(new_dstar_lite_instance(G, 0, 4, overlay=True), window=0.01)
+
+        async def writer():
+            await asyncio.sleep(0.05)
+            with open(updates, "a") as f:
+                f.write("0,4,2\nnot a line\n2,3,")
+                f.flush()
+                await asyncio.sleep(0.05)
+                f.write("5\n")
+            await asyncio.sleep(0.1)
+            feed.close()
+
+        async def main():
+            await asyncio.gather(feed.run(), feed.follow_file(updates, poll_interval=0.01, node_type=int), writer())
+
+        asyncio.run(main())
+        assert feed.rejected == 1
+        assert feed.applied == 2
+        assert feed.latest[None] == [0, 4]
+
+    def test_invalid_update_does_not_stop_the_feed(self):
+        G = nx.path_graph(5, create_using=nx.DiGraph)
+        nx.set_edge_attributes(G, 1, "weight")
+        G.add_edge(0, 4, weight=10)
+        feed = DStarLiteFeed(new_dstar_lite_instance(to_csr_graph(G), 0, 4), window=0)
+
+        async def main():
+            task = asyncio.create_task(feed.run())
+            feed.submit(0, 3, 1)  # Not in the snapshot
+            await asyncio.sleep(0.01)
+            feed.submit(0, 4, 2)
+            await asyncio.sleep(0.01)
+            # A batch mixing both: the valid update still goes through.
+            feed.submit(1, 2, 5)
+            feed.submit(0, 9, 1)
+            feed.close()
+            await task
+
+        asyncio.run(main())
+        assert feed.failed == 2
+        assert isinstance(feed.last_error, nx.NodeNotFound)
+        assert feed.batches == 3
+        assert feed.latest[None] == [0, 4]
+        assert feed.instances[None].get_path_cost() == 2
+        assert feed.instances[None].get_cost_from(1) == 7
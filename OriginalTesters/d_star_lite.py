@@ -4,7 +4,20 @@ import time
 import networkx as nx
 import pytest
 
-from Algorithms.d_star_lite import new_dstar_lite_instance, d_star_modify_edge, d_star_recalculate_path
+from Algorithms.d_star_lite import (
+    new_dstar_lite_instance,
+    d_star_modify_edge,
+    d_star_modify_edges,
+    d_star_move_source,
+    d_star_recalculate_path,
+    d_star_get_path_from,
+    d_star_get_cost_from,
+    d_star_save_state,
+    d_star_load_state,
+)
+from Algorithms.d_star_lite import DStarLite, PriorityQueue
+from Algorithms.csr_graph import to_csr_graph
+from Testers.d_star_lite import DStarLiteVsAStarComparison
 
 
 def create_predefined_graph():
@@ -176,6 +189,411 @@ class TestDStarLiteLargeGraphs:
             print(f"[Dynamic Grid] New path: {path}, cost={cost}")
 
 
+class TestDStarLiteOverlay:
+    @pytest.mark.parametrize("directed", [True, False])
+    def test_overlay_matches_copy(self, directed):
+        G = nx.gnp_random_graph(60, 0.08, seed=4, directed=directed)
+        rng = random.Random(4)
+        for u, v in G.edges():
+            G[u][v]["weight"] = rng.randint(1, 20)
+        snapshot = nx.to_dict_of_dicts(G)
+        source, target = 0, 59
+        copied = new_dstar_lite_instance(G, source, target)
+        shared = new_dstar_lite_instance(G, source, target, overlay=True)
+        edges = list(G.edges())
+        for _ in range(20):
+            u, v = rng.choice(edges)
+            new_w = rng.randint(1, 40)
+            d_star_modify_edge(copied, u, v, new_w)
+            assert d_star_modify_edge(shared, u, v, new_w) is G
+            assert d_star_recalculate_path(shared) == d_star_recalculate_path(copied)
+            assert shared.get_path_cost() == copied.get_path_cost()
+        assert nx.to_dict_of_dicts(G) == snapshot
+
+    def test_overlay_adds_edges_without_touching_graph(self):
+        G, source, target = create_predefined_graph()
+        agents = [new_dstar_lite_instance(G, source, target, overlay=True) for _ in range(3)]
+        d_star_modify_edge(agents[0], "A", "E", 2)
+        d_star_modify_edge(agents[1], "B", "C", 10)
+        assert agents[0].get_path() == ["A", "E"] and agents[0].get_path_cost() == 2
+        assert agents[1].get_path() == ["A", "B", "E"]
+        assert agents[2].get_path() == ["A", "B", "C", "E"]
+        assert not G.has_edge("A", "E") and G["B"]["C"]["weight"] == 2
+        assert sum(len(row) for row in agents[2]._delta.values()) == 0
+
+    def test_overlay_missing_weight_and_nodes(self):
+        G = nx.DiGraph([("A", "B"), ("B", "C")])
+        dstar = new_dstar_lite_instance(G, "A", "C", overlay=True)
+        assert dstar.get_path_cost() == 2
+        assert new_dstar_lite_instance(G, "A", "Z", overlay=True).get_path() is None
+        assert "Z" not in G
+
+
+class TestDStarLiteBatchedUpdates:
+    @pytest.mark.parametrize("directed", [True, False])
+    def test_batch_matches_sequential_updates(self, directed):
+        G = nx.gnp_random_graph(80, 0.06, seed=8, directed=directed)
+        rng = random.Random(8)
+        for u, v in G.edges():
+            G[u][v]["weight"] = rng.randint(1, 20)
+        edges = list(G.edges())
+        sequential = new_dstar_lite_instance(G, 0, 79)
+        batched = new_dstar_lite_instance(G, 0, 79)
+        deferred = new_dstar_lite_instance(G, 0, 79, deferred=True)
+        for _ in range(5):
+            updates = [(*rng.choice(edges), rng.randint(1, 40)) for _ in range(15)]
+            for u, v, w in updates:
+                d_star_modify_edge(sequential, u, v, w)
+            d_star_modify_edges(batched, updates)
+            for u, v, w in updates:
+                d_star_modify_edge(deferred, u, v, w)
+            expected = sequential.get_path_cost()
+            assert batched.get_path_cost() == expected
+            assert deferred.get_path_cost() == expected
+            assert deferred.get_path() == d_star_recalculate_path(deferred)
+        assert batched.replans == 1 + 5
+        assert deferred.replans == 1 + 5
+        assert sequential.replans == 1 + 5 * 15
+
+    def test_deferred_waits_for_path_request(self):
+        G, source, target = create_predefined_graph()
+        dstar = new_dstar_lite_instance(G, source, target, deferred=True)
+        d_star_modify_edges(dstar, [("B", "C", 10), ("B", "E", 20)])
+        assert dstar.replans == 1
+        assert dstar.get_path() == ["A", "D", "C", "E"]
+        assert dstar.replans == 2
+        assert dstar.get_path_cost() == 8 and dstar.replans == 2
+
+
+class TestDStarLiteMovingSource:
+    @staticmethod
+    def manhattan(u, v):
+        return abs(u[0] - v[0]) + abs(u[1] - v[1])
+
+    @pytest.mark.parametrize("deferred", [False, True])
+    def test_drive_while_edges_change(self, deferred):
+        rng = random.Random(5)
+        G = nx.grid_2d_graph(12, 12).to_directed()
+        for u, v in G.edges():
+            G[u][v]["weight"] = rng.randint(1, 5)
+        world = G.copy()
+        dstar = new_dstar_lite_instance(G, (0, 0), (11, 11), heuristic=self.manhattan, deferred=deferred)
+        position = (0, 0)
+        edges = list(world.edges())
+        while position != (11, 11):
+            assert dstar.get_path_cost() == nx.dijkstra_path_length(world, position, (11, 11))
+            position = dstar.get_path()[1]
+            updates = [(*rng.choice(edges), rng.randint(1, 5)) for _ in range(4)]
+            for u, v, w in updates:
+                world[u][v]["weight"] = w
+            d_star_modify_edges(dstar, updates)
+            d_star_move_source(dstar, position)
+        assert dstar.get_path() == [(11, 11)]
+        assert dstar.k_m > 0
+
+    def test_move_without_changes_reuses_search(self):
+        G, source, target = create_predefined_graph()
+        dstar = new_dstar_lite_instance(G, source, target)
+        assert d_star_move_source(dstar, "B") == ["B", "C", "E"]
+        assert dstar.get_path_cost() == 5
+        with pytest.raises(nx.NodeNotFound):
+            d_star_move_source(dstar, "Z")
+
+
+class TestDStarLiteLazyState:
+    def test_state_only_covers_touched_nodes(self):
+        G = nx.path_graph(5000, create_using=nx.DiGraph)
+        nx.set_edge_attributes(G, 1, "weight")
+        dstar = new_dstar_lite_instance(G, 10, 20, overlay=True)
+        assert dstar.get_path() == list(range(10, 21))
+        assert len(dstar.g_score) < 50 and len(dstar.rhs) < 50
+        assert dstar.g_score[4000] == float("inf")
+        assert 4000 not in dstar.g_score
+
+    def test_csr_state_is_lazy(self):
+        G = nx.grid_2d_graph(30, 30)
+        C = to_csr_graph(G)
+        dstar = new_dstar_lite_instance(C, (0, 0), (2, 2), overlay=True)
+        assert dstar.get_path_cost() == 4
+        assert len(dstar.rhs) < C.number_of_nodes() // 2
+        d_star_modify_edge(dstar, (0, 0), (0, 1), 10)
+        assert dstar.get_path_cost() == 4
+        assert dstar.get_path()[1] == (1, 0)
+
+
+class TestDStarLiteQueriesFromAnyNode:
+    @staticmethod
+    def manhattan(u, v):
+        return abs(u[0] - v[0]) + abs(u[1] - v[1])
+
+    @pytest.mark.parametrize("use_csr", [False, True])
+    def test_costs_from_every_node_match_dijkstra(self, use_csr):
+        G = nx.gnp_random_graph(70, 0.06, seed=13, directed=True)
+        rng = random.Random(13)
+        for u, v in G.edges():
+            G[u][v]["weight"] = rng.randint(1, 15)
+        dstar = new_dstar_lite_instance(to_csr_graph(G) if use_csr else G, 0, 69)
+        edges = list(G.edges())
+        for _ in range(3):
+            expected = nx.shortest_path_length(G, target=69, weight="weight")
+            for node in rng.sample(list(G), 25):
+                cost = d_star_get_cost_from(dstar, node)
+                path = d_star_get_path_from(dstar, node)
+                if node not in expected:
+                    assert cost == float("inf") and path is None
+                    continue
+                assert cost == expected[node]
+                assert path[0] == node and path[-1] == 69
+                assert nx.path_weight(G, path, "weight") == cost
+            u, v = rng.choice(edges)
+            G[u][v]["weight"] = rng.randint(1, 30)
+            d_star_modify_edge(dstar, u, v, G[u][v]["weight"])
+
+    def test_depot_serves_vehicles_after_source_moved(self):
+        G = nx.grid_2d_graph(15, 15).to_directed()
+        rng = random.Random(2)
+        for u, v in G.edges():
+            G[u][v]["weight"] = rng.randint(1, 9)
+        depot = (14, 14)
+        dstar = new_dstar_lite_instance(G, (0, 0), depot, heuristic=self.manhattan, overlay=True)
+        d_star_move_source(dstar, (3, 4))
+        for vehicle in [(0, 14), (7, 7), (14, 0), (13, 14), depot]:
+            assert dstar.get_cost_from(vehicle) == nx.dijkstra_path_length(G, vehicle, depot)
+        assert dstar.get_path_from(depot) == [depot]
+        assert dstar.get_path_cost() == nx.dijkstra_path_length(G, (3, 4), depot)
+        with pytest.raises(nx.NodeNotFound):
+            dstar.get_path_from((20, 20))
+
+    def test_depot_benchmark_with_float_weights(self):
+        # Backward rhs sums and forward path sums round differently.
+        G = nx.grid_2d_graph(8, 8).to_directed()
+        rng = random.Random(5)
+        for u, v in G.edges():
+            G[u][v]["weight"] = round(rng.uniform(100, 900), 1)
+        result = DStarLiteVsAStarComparison(G, (0, 0), (7, 7)).compare_depot()
+        assert result["Depot Vehicles"] > 0
+
+
+class TestDStarLiteImpactFilter:
+    @pytest.mark.parametrize("directed", [True, False])
+    @pytest.mark.parametrize("overlay", [False, True])
+    def test_filtered_updates_keep_optimal_paths(self, directed, overlay):
+        G = nx.gnp_random_graph(90, 0.05, seed=17, directed=directed)
+        rng = random.Random(17)
+        for u, v in G.edges():
+            G[u][v]["weight"] = rng.randint(1, 20)
+        world = G.copy()
+        dstar = new_dstar_lite_instance(G, 0, 89, overlay=overlay, impact_filter=True)
+        edges = list(world.edges())
+        for i in range(60):
+            u, v = rng.choice(edges)
+            world[u][v]["weight"] = rng.randint(1, 40)
+            d_star_modify_edge(dstar, u, v, world[u][v]["weight"])
+            if nx.has_path(world, 0, 89):
+                assert dstar.get_path_cost() == nx.dijkstra_path_length(world, 0, 89)
+                assert nx.path_weight(world, dstar.get_path(), "weight") == dstar.get_path_cost()
+            else:
+                assert dstar.get_path() is None
+        assert dstar.updates_skipped > 0
+        assert dstar.updates_skipped + dstar.updates_processed == 60
+        assert dstar.replans == 1 + dstar.updates_processed
+
+    def test_classification(self):
+        G, source, target = create_predefined_graph()
+        dstar = new_dstar_lite_instance(G, source, target, impact_filter=True)
+        d_star_modify_edge(dstar, "A", "D", 9)  # Increase off the shortest-path tree.
+        d_star_modify_edge(dstar, "A", "D", 5)  # Decrease that cannot beat rhs(A) = 6.
+        d_star_modify_edge(dstar, "C", "E", 3)  # Unchanged weight.
+        assert (dstar.updates_skipped, dstar.updates_processed, dstar.replans) == (3, 0, 1)
+        d_star_modify_edge(dstar, "B", "C", 10)  # Increase on the current path.
+        assert dstar.updates_processed == 1
+        assert dstar.get_path() == ["A", "B", "E"]
+        assert dstar.get_path_cost() == 6
+
+
+class TestDStarLiteVectorized:
+    @pytest.mark.parametrize("directed", [True, False])
+    @pytest.mark.parametrize("overlay", [False, True])
+    @pytest.mark.parametrize("min_degree", [1, 16])
+    def test_matches_dict_backend(self, directed, overlay, min_degree, monkeypatch):
+        monkeypatch.setattr(DStarLite, "vector_min_degree", min_degree)
+        G = nx.gnp_random_graph(120, 0.2, seed=6, directed=directed)
+        rng = random.Random(6)
+        for u, v in G.edges():
+            G[u][v]["weight"] = rng.randint(1, 30)
+        C = to_csr_graph(G)
+        plain = new_dstar_lite_instance(C, 0, 119, overlay=overlay)
+        vector = new_dstar_lite_instance(C, 0, 119, overlay=overlay, vectorized=True)
+        edges = list(G.edges())
+        for _ in range(25):
+            updates = [(*rng.choice(edges), rng.randint(1, 60)) for _ in range(3)]
+            d_star_modify_edges(plain, updates)
+            d_star_modify_edges(vector, updates)
+            assert vector.get_path() == plain.get_path()
+            assert vector.get_path_cost() == plain.get_path_cost()
+            node = rng.randrange(120)
+            assert vector.get_cost_from(node) == plain.get_cost_from(node)
+
+    def test_requires_csr_graph(self):
+        G, source, target = create_predefined_graph()
+        with pytest.raises(nx.NetworkXError):
+            new_dstar_lite_instance(G, source, target, vectorized=True)
+
+
+class TestDStarLiteSnapshot:
+    @staticmethod
+    def manhattan(u, v):
+        return abs(u[0] - v[0]) + abs(u[1] - v[1])
+
+    @pytest.mark.parametrize(
+        "use_csr, options",
+        [
+            (False, {"overlay": True}),
+            (True, {}),
+            (True, {"overlay": True}),
+            (True, {"vectorized": True, "impact_filter": True}),
+        ],
+    )
+    def test_restored_instance_continues_like_original(self, tmp_path, use_csr, options):
+        rng = random.Random(11)
+        G = nx.grid_2d_graph(14, 14).to_directed()
+        for u, v in G.edges():
+            G[u][v]["weight"] = rng.randint(1, 9)
+        graph = to_csr_graph(G) if use_csr else G
+        original = new_dstar_lite_instance(graph, (0, 0), (13, 13), heuristic=self.manhattan, **options)
+        edges = list(G.edges())
+        d_star_modify_edges(original, [(*rng.choice(edges), rng.randint(1, 9)) for _ in range(10)])
+        d_star_move_source(original, original.get_path()[3])
+
+        state_file = tmp_path / "dstar.state"
+        d_star_save_state(original, state_file)
+        restored = d_star_load_state(state_file, graph, heuristic=self.manhattan)
+        assert restored.replans == original.replans
+        assert restored.get_path() == original.get_path()
+        assert restored.get_path_cost() == original.get_path_cost()
+
+        for _ in range(5):
+            updates = [(*rng.choice(edges), rng.randint(1, 9)) for _ in range(4)]
+            d_star_modify_edges(original, updates)
+            d_star_modify_edges(restored, updates)
+            assert restored.get_path() == original.get_path()
+            assert restored.get_path_cost() == original.get_path_cost()
+
+    def test_rejects_other_graph_and_copying_instances(self, tmp_path):
+        G, source, target = create_predefined_graph()
+        state_file = tmp_path / "dstar.state"
+        d_star_save_state(new_dstar_lite_instance(G, source, target, overlay=True), state_file)
+        other = G.copy()
+        other["B"]["C"]["weight"] = 7
+        with pytest.raises(nx.NetworkXError):
+            d_star_load_state(state_file, other)
+        assert d_star_load_state(state_file, G).get_path() == ["A", "B", "C", "E"]
+        with pytest.raises(nx.NetworkXError):
+            d_star_save_state(new_dstar_lite_instance(G, source, target), state_file)
+
+
+class TestDStarLiteTopologyChanges:
+    @pytest.mark.parametrize("directed", [True, False])
+    @pytest.mark.parametrize("mode", ["copy", "overlay", "csr"])
+    def test_random_closures_match_dijkstra(self, directed, mode):
+        G = nx.gnp_random_graph(80, 0.08, seed=23, directed=directed)
+        rng = random.Random(23)
+        for u, v in G.edges():
+            G[u][v]["weight"] = rng.randint(1, 20)
+        world = G.copy()
+        graph = to_csr_graph(G) if mode == "csr" else G
+        dstar = new_dstar_lite_instance(graph, 0, 79, overlay=mode == "overlay", impact_filter=True)
+        closed = []
+        for _ in range(40):
+            action = rng.random()
+            if action < 0.5 and world.number_of_edges():
+                u, v = rng.choice(list(world.edges()))
+                world.remove_edge(u, v)
+                dstar.remove_edge(u, v)
+                closed.append((u, v, G[u][v]["weight"]))
+            elif action < 0.8:
+                node = rng.choice([n for n in world if n not in (0, 79)])
+                closed += [(a, b, G[a][b]["weight"]) for a, b in world.edges(node)]
+                if directed:
+                    closed += [(a, b, G[a][b]["weight"]) for a, b in world.in_edges(node)]
+                world.remove_node(node)
+                dstar.remove_node(node)
+                with pytest.raises(nx.NodeNotFound):
+                    dstar.get_path_from(node)
+            elif closed:
+                u, v, w = closed.pop(rng.randrange(len(closed)))
+                if u in world and v in world and not world.has_edge(u, v):
+                    world.add_edge(u, v, weight=w)
+                    d_star_modify_edge(dstar, u, v, w)
+            if nx.has_path(world, 0, 79):
+                assert dstar.get_path_cost() == nx.dijkstra_path_length(world, 0, 79)
+                assert nx.path_weight(world, dstar.get_path(), "weight") == dstar.get_path_cost()
+            else:
+                assert dstar.get_path() is None
+
+    @pytest.mark.parametrize("overlay", [False, True])
+    def test_new_node_creates_shortcut(self, overlay):
+        G, source, target = create_predefined_graph()
+        dstar = new_dstar_lite_instance(G, source, target, overlay=overlay)
+        dstar.add_node("X")
+        assert dstar.get_path_from("X") is None
+        d_star_modify_edges(dstar, [("A", "X", 1), ("X", "E", 1)])
+        assert dstar.get_path() == ["A", "X", "E"] and dstar.get_path_cost() == 2
+        dstar.remove_node("X")
+        assert dstar.get_path() == ["A", "B", "C", "E"]
+        dstar.add_node("X")
+        assert dstar.get_cost_from("X") == float("inf")
+        assert "X" not in G
+
+    def test_invalid_topology_changes(self):
+        G, source, target = create_predefined_graph()
+        dstar = new_dstar_lite_instance(G, source, target)
+        with pytest.raises(nx.NetworkXError):
+            dstar.remove_node(target)
+        with pytest.raises(nx.NetworkXError):
+            dstar.remove_edge("E", "A")
+        with pytest.raises(nx.NodeNotFound):
+            dstar.remove_node("Z")
+        csr = new_dstar_lite_instance(to_csr_graph(G), source, target)
+        with pytest.raises(nx.NetworkXError):
+            csr.add_node("Z")
+        csr.remove_node("B")
+        assert csr.get_path() == ["A", "D", "C", "E"]
+        csr.add_node("B")
+        assert csr.get_cost_from("B") == float("inf")
+
+
+class TestPriorityQueueCompaction:
+    def test_repeated_updates_keep_heap_bounded(self):
+        queue = PriorityQueue()
+        rng = random.Random(3)
+        for step in range(20_000):
+            queue.push(rng.randrange(100), (rng.random(), step))
+            assert queue.physical_size <= max(2 * len(queue) + 1, queue.min_compact_size)
+        assert len(queue) == 100 and queue.compactions > 0
+        popped = [queue.pop() for _ in range(len(queue))]
+        assert sorted(popped) == list(range(100))
+        assert queue.empty() and queue.physical_size == queue.stale
+
+    def test_compaction_preserves_order(self):
+        queue = PriorityQueue(max_stale_ratio=0.25, min_compact_size=4)
+        uncompacted = PriorityQueue(max_stale_ratio=None)
+        rng = random.Random(9)
+        for step in range(2_000):
+            item, key = rng.randrange(50), (rng.randint(0, 30), step)
+            remove = rng.random() < 0.2
+            for q in (queue, uncompacted):
+                if remove:
+                    q.remove(item)
+                else:
+                    q.push(item, key)
+        assert uncompacted.compactions == 0 and uncompacted.physical_size > len(uncompacted)
+        assert queue.top_key() == uncompacted.top_key()
+        assert [queue.pop() for _ in range(len(queue))] == [
+            uncompacted.pop() for _ in range(len(uncompacted))
+        ]
+
+
 def run_manual_tests():
     print("===== MANUAL DEMO OF D* LITE =====")
     G, source, target = create_predefined_graph()
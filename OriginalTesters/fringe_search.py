@@ -0,0 +1,80 @@
+import random
+
+import networkx as nx
+import pytest
+
+from Algorithms.csr_graph import to_csr_graph
+from Algorithms.fringe_search import fringe_search_path, fringe_search_path_length
+from Algorithms.ida_star import idastar_path
+from Algorithms.workspace import SearchWorkspace
+
+
+def random_weighted_graph(seed, directed):
+    G = nx.gnp_random_graph(20, 0.2, seed=seed, directed=directed)
+    rng = random.Random(seed)
+    for u, v in G.edges():
+        G[u][v]["weight"] = rng.uniform(1, 9)
+    return G
+
+
+class TestFringeSearch:
+    @pytest.mark.parametrize("directed", [False, True])
+    def test_matches_dijkstra(self, directed):
+        for seed in range(30):
+            G = random_weighted_graph(seed, directed)
+            if not nx.has_path(G, 0, 19):
+                with pytest.raises(nx.NetworkXNoPath):
+                    fringe_search_path(G, 0, 19)
+                continue
+            best = nx.dijkstra_path_length(G, 0, 19)
+            path = fringe_search_path(G, 0, 19)
+            assert path[0] == 0 and path[-1] == 19
+            assert nx.path_weight(G, path, "weight") == pytest.approx(best)
+            assert fringe_search_path_length(G, 0, 19) == pytest.approx(best)
+
+    def test_heuristic_and_weight_function(self):
+        G = nx.grid_graph(dim=[3, 3])
+        nx.set_edge_attributes(G, {e: e[1][0] * 2 for e in G.edges()}, "cost")
+
+        def dist(a, b):
+            return ((a[0] - b[0]) ** 2 + (a[1] - b[1]) ** 2) ** 0.5
+
+        assert fringe_search_path(G, (0, 0), (2, 2), heuristic=dist, weight="cost") == idastar_path(
+            G, (0, 0), (2, 2), heuristic=dist, weight="cost"
+        )
+        XG = nx.DiGraph([("s", "u", {"weight": 10}), ("s", "x", {"weight": 5}), ("x", "u", {"weight": 3})])
+
+        def hidden(u, v, d):
+            return None if (u, v) == ("x", "u") else d["weight"]
+
+        assert fringe_search_path(XG, "s", "u") == ["s", "x", "u"]
+        assert fringe_search_path(XG, "s", "u", weight=hidden) == ["s", "u"]
+
+    def test_csr_and_workspace(self):
+        G = random_weighted_graph(3, directed=False)
+        C = to_csr_graph(G)
+        ws = SearchWorkspace(C)
+        for target in range(1, 20):
+            if nx.has_path(G, 0, target):
+                assert fringe_search_path(C, 0, target, workspace=ws) == fringe_search_path(C, 0, target)
+                assert fringe_search_path_length(C, 0, target) == pytest.approx(
+                    nx.dijkstra_path_length(G, 0, target)
+                )
+
+    def test_keeps_fringe_between_iterations(self):
+        G = nx.grid_2d_graph(6, 6)
+        rng = random.Random(0)
+        for u, v in G.edges():
+            G[u][v]["weight"] = rng.uniform(1, 9)
+        fringe_stats, ida_stats = {}, {}
+        fringe_search_path(G, (0, 0), (5, 5), search_stats=fringe_stats)
+        idastar_path(G, (0, 0), (5, 5), search_stats=ida_stats)
+        assert fringe_stats["iterations"] > 1
+        assert fringe_stats["expanded"] < ida_stats["expanded"]
+
+    def test_node_not_found(self):
+        with pytest.raises(nx.NodeNotFound):
+            fringe_search_path(nx.path_graph(3), 0, 7)
+        with pytest.raises(nx.NodeNotFound):
+            fringe_search_path_length(nx.path_graph(3), 7, 0)
+        assert fringe_search_path(nx.path_graph(3), 1, 1) == [1]
@@ -0,0 +1,64 @@
+import random
+
+import networkx as nx
+import pytest
+
+from Algorithms.bi_astar import bidirectional_astar
+from Algorithms.geo_heuristic import CoordinateIndex, HaversineHeuristic
+from Config import CSV_PATH, COORDS_PATH
+from CsvProcessor.generator import generate_graph_from_csv, load_coordinate_index
+from Testers.d_star_lite import DStarLiteVsAStarComparison
+
+
+@pytest.fixture(scope="module")
+def city_graph():
+    return generate_graph_from_csv(CSV_PATH)
+
+
+@pytest.fixture(scope="module")
+def heuristic(city_graph):
+    return HaversineHeuristic.calibrated(city_graph, load_coordinate_index(COORDS_PATH))
+
+
+class TestHaversineHeuristic:
+    def test_every_city_has_coordinates(self, city_graph):
+        coords = load_coordinate_index(COORDS_PATH)
+        assert all(node in coords for node in city_graph)
+
+    def test_calibrated_is_consistent(self, city_graph, heuristic):
+        assert heuristic.scale > 0
+        for u, v, data in city_graph.edges(data=True):
+            assert heuristic(u, v) <= data["weight"]
+            for t in ("Helsinki", "Lisbon"):
+                assert heuristic(u, t) <= data["weight"] + heuristic(v, t) + 1e-9
+                assert heuristic(v, t) <= data["weight"] + heuristic(u, t) + 1e-9
+
+    def test_costs_match_dijkstra(self, city_graph, heuristic):
+        nodes = sorted(city_graph)
+        for s, t in zip(nodes, reversed(nodes)):
+            if s == t:
+                continue
+            best = nx.dijkstra_path_length(city_graph, s, t)
+            cost, _, _ = bidirectional_astar(city_graph, s, t, heuristic=heuristic)
+            assert cost == pytest.approx(best)
+            assert nx.astar_path_length(city_graph, s, t, heuristic=heuristic) == pytest.approx(best)
+
+    def test_admissible_after_tester_mutations(self, heuristic):
+        world = generate_graph_from_csv(CSV_PATH)
+        tester = DStarLiteVsAStarComparison(world, "Tirana", "Helsinki", heuristic=heuristic)
+        random.seed(2)
+        tester.compare_recalculation()
+        tester.compare_bulk_modifications()
+        for u, v, data in world.edges(data=True):
+            assert heuristic(u, v) <= data["weight"]
+            assert heuristic(v, u) <= data["weight"]
+        best = nx.dijkstra_path_length(world, "Tirana", "Helsinki")
+        assert nx.astar_path_length(world, "Tirana", "Helsinki", heuristic=heuristic) == pytest.approx(best)
+
+    def test_unknown_nodes_and_calibration_errors(self):
+        coords = CoordinateIndex(["a", "b"], [0.0, 0.0], [0.0, 1.0])
+        h = HaversineHeuristic(coords, scale=2.0)
+        assert h("a", "zz") == 0
+        assert h("a", "b") == pytest.approx(2 * coords.distance_km("a", "b"))
+        with pytest.raises(nx.NetworkXError):
+            HaversineHeuristic.calibrated(nx.Graph([("x", "y")]), coords)
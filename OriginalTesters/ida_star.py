@@ -1,5 +1,8 @@
+import random
 from itertools import pairwise
 
+import pytest
+
 from Algorithms.ida_star import idastar_path, idastar_path_length
 import networkx as nx
 
@@ -191,3 +194,144 @@ def test_idastar_tuple_nodes(self):
         (1, 2),
         (2, 2),
     ]
+
+
+class TestIDAStarPathStack:
+    def test_optimal_on_cyclic_graphs(self):
+        for seed in range(40):
+            G = nx.gnp_random_graph(12, 0.3, seed=seed, directed=True)
+            rng = random.Random(seed)
+            for u, v in G.edges():
+                G[u][v]["weight"] = rng.randint(1, 9)
+            if not nx.has_path(G, 0, 11):
+                continue
+            path = idastar_path(G, 0, 11)
+            assert path[0] == 0 and path[-1] == 11
+            assert len(set(path)) == len(path)
+            assert idastar_path_length(G, 0, 11) == nx.dijkstra_path_length(G, 0, 11)
+
+    def test_deep_path_without_recursion(self):
+        depth = 1500
+        G = nx.path_graph(depth + 1)
+        G.add_edges_from((i, f"leaf{i}") for i in range(0, depth, 10))
+        nx.set_edge_attributes(G, 1, "weight")
+
+        def h(u, v):
+            return v - u if isinstance(u, int) else 0
+
+        path = idastar_path(G, 0, depth, heuristic=h)
+        assert path == list(range(depth + 1))
+
+    def test_source_is_target(self):
+        assert idastar_path(nx.cycle_graph(4), 2, 2) == [2]
+
+
+class TestIDAStarThresholdGrowth:
+    @staticmethod
+    def real_weighted_graph(seed):
+        G = nx.gnp_random_graph(14, 0.3, seed=seed, directed=True)
+        rng = random.Random(seed)
+        for u, v in G.edges():
+            G[u][v]["weight"] = rng.uniform(1, 9)
+        return G
+
+    @staticmethod
+    def cost(G, path):
+        return sum(G[u][v]["weight"] for u, v in pairwise(path))
+
+    def test_cr_thresholds_stay_optimal_with_fewer_iterations(self):
+        def h(u, v):
+            return 1.0 if u != v else 0
+
+        for seed in range(30):
+            G = self.real_weighted_graph(seed)
+            if not nx.has_path(G, 0, 13):
+                continue
+            exact, cr = {}, {}
+            best = nx.dijkstra_path_length(G, 0, 13)
+            assert self.cost(G, idastar_path(G, 0, 13, h, search_stats=exact)) == pytest.approx(best)
+            path = idastar_path(G, 0, 13, h, threshold_growth=2, search_stats=cr)
+            assert self.cost(G, path) == pytest.approx(best)
+            assert cr["iterations"] <= exact["iterations"]
+            assert cr["expanded"] == sum(it["expanded"] for it in cr["per_iteration"])
+
+    def test_bounded_suboptimality(self):
+        for seed in range(30):
+            G = self.real_weighted_graph(seed)
+            if not nx.has_path(G, 0, 13):
+                continue
+            path = idastar_path(G, 0, 13, threshold_growth=3, suboptimality=1.5)
+            assert self.cost(G, path) <= 1.5 * nx.dijkstra_path_length(G, 0, 13) + 1e-9
+
+    def test_stats_and_validation(self):
+        G = nx.path_graph(6)
+        stats = {}
+        idastar_path(G, 0, 5, search_stats=stats)
+        assert stats["iterations"] == 6
+        assert [it["threshold"] for it in stats["per_iteration"]] == [0, 1, 2, 3, 4, 5]
+        assert stats["reexpanded"] == stats["expanded"] - stats["per_iteration"][-1]["expanded"]
+        with pytest.raises(ValueError):
+            idastar_path(G, 0, 5, threshold_growth=1)
+        with pytest.raises(ValueError):
+            idastar_path(G, 0, 5, suboptimality=0.5)
+
+
+class TestIDAStarTranspositionTable:
+    @pytest.mark.parametrize("size", [1, 5, 64])
+    def test_pruning_keeps_paths_optimal(self, size):
+        for seed in range(30):
+            G = TestIDAStarThresholdGrowth.real_weighted_graph(seed)
+            if not nx.has_path(G, 0, 13):
+                continue
+            best = nx.dijkstra_path_length(G, 0, 13)
+            for growth in (None, 2):
+                path = idastar_path(G, 0, 13, threshold_growth=growth, transposition_size=size)
+                assert TestIDAStarThresholdGrowth.cost(G, path) == pytest.approx(best)
+
+    def test_prunes_revisits_on_cyclic_graph(self):
+        G = nx.grid_2d_graph(5, 5)
+        nx.set_edge_attributes(G, 1, "weight")
+        plain, tabled = {}, {}
+        assert len(idastar_path(G, (0, 0), (4, 4), search_stats=plain)) == 9
+        assert len(idastar_path(G, (0, 0), (4, 4), search_stats=tabled, transposition_size=32)) == 9
+        assert tabled["transposition_pruned"] > 0
+        assert tabled["expanded"] < plain["expanded"]
+        with pytest.raises(ValueError):
+            idastar_path(G, (0, 0), (4, 4), transposition_size=0)
+
+
+def grid_manhattan(u, v):
+    return abs(u[0] - v[0]) + abs(u[1] - v[1])
+
+
+class TestIDAStarParallel:
+    @staticmethod
+    def weighted_grid(side, seed=0):
+        G = nx.grid_2d_graph(side, side)
+        rng = random.Random(seed)
+        for u, v in G.edges():
+            G[u][v]["weight"] = rng.uniform(1, 9)
+        return G
+
+    @pytest.mark.parametrize(
+        "options",
+        [{}, {"split_depth": 1}, {"threshold_growth": 2}, {"transposition_size": 16, "split_depth": 3}],
+    )
+    def test_matches_serial_cost(self, options):
+        G = self.weighted_grid(5)
+        target = (4, 4)
+        stats = {}
+        path = idastar_path(G, (0, 0), target, grid_manhattan, processes=2, search_stats=stats, **options)
+        assert path[0] == (0, 0) and path[-1] == target
+        assert nx.path_weight(G, path, "weight") == pytest.approx(nx.dijkstra_path_length(G, (0, 0), target))
+        assert stats["subtrees"] > 0
+
+    def test_no_path_and_validation(self):
+        G = nx.Graph([(1, 2), (2, 3), (4, 5)])
+        assert idastar_path(G, 1, 3, processes=2) == [1, 2, 3]
+        with pytest.raises(nx.NetworkXNoPath):
+            idastar_path(G, 1, 5, processes=2)
+        with pytest.raises(ValueError):
+            idastar_path(G, 1, 3, processes=0)
+        with pytest.raises(ValueError):
+            idastar_path(G, 1, 3, processes=2, split_depth=0)
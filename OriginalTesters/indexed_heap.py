@@ -0,0 +1,92 @@
+import random
+
+import networkx as nx
+import pytest
+
+from Algorithms.bi_astar import bidirectional_astar
+from Algorithms.csr_graph import to_csr_graph
+from Algorithms.indexed_heap import IndexedHeap
+from Algorithms.rtaa_star import rtaa_star_path_length
+from Algorithms.sma_star import sma_star_path, sma_star_path_length
+
+
+def dense_graph(directed=False):
+    G = nx.gnp_random_graph(80, 0.2, seed=9, directed=directed)
+    rng = random.Random(9)
+    for u, v in G.edges():
+        G[u][v]["weight"] = rng.randint(1, 30)
+    return G
+
+
+class TestIndexedHeap:
+    @pytest.mark.parametrize("arity, capacity", [(2, None), (4, None), (3, 50), (8, 50)])
+    def test_keeps_one_entry_per_item(self, arity, capacity):
+        rng = random.Random(arity)
+        heap = IndexedHeap(arity, capacity)
+        best = {}
+        duplicates = 0
+        for _ in range(3000):
+            if rng.random() < 0.6 or not best:
+                item, priority = rng.randrange(50), rng.randint(0, 1000)
+                if item in best:
+                    duplicates += 1
+                if priority < best.get(item, float("inf")):
+                    best[item] = priority
+                heap.push(item, priority)
+            else:
+                priority, item = heap.pop()
+                assert priority == min(best.values())
+                assert best.pop(item) == priority
+            assert len(heap) == len(best)
+        assert heap.max_size <= 50
+        assert 0 < heap.decreases <= duplicates
+
+    def test_ties_pop_in_fifo_order(self):
+        heap = IndexedHeap()
+        for item in "abc":
+            heap.push(item, 1)
+        heap.push("d", 2)
+        heap.push("d", 1)
+        assert [heap.pop()[1] for _ in range(4)] == ["a", "b", "c", "d"]
+
+    def test_remove_priority_and_clear(self):
+        heap = IndexedHeap(capacity=5)
+        heap.push(3, 7)
+        heap.push(1, 2)
+        assert 3 in heap and heap.priority(3) == 7
+        heap.remove(3)
+        assert 3 not in heap
+        with pytest.raises(KeyError):
+            heap.remove(3)
+        heap.clear()
+        assert not heap and 1 not in heap and heap.pushes == 0
+        with pytest.raises(ValueError):
+            IndexedHeap(arity=1)
+
+
+class TestIndexedHeapSearches:
+    @pytest.mark.parametrize("directed", [False, True])
+    def test_indexed_heap_gives_same_costs(self, directed):
+        G = dense_graph(directed)
+        C = to_csr_graph(G)
+        rng = random.Random(2)
+        for _ in range(8):
+            s, t = rng.sample(list(G), 2)
+            if not nx.has_path(G, s, t):
+                continue
+            best = nx.dijkstra_path_length(G, s, t)
+            for graph in (G, C):
+                cost, path, stats = bidirectional_astar(graph, s, t, indexed_heap=True)
+                assert (cost, path) == bidirectional_astar(graph, s, t)[:2]
+                assert stats["stale_pops"] == 0
+                assert sma_star_path_length(graph, s, t, memory_limit=10_000, indexed_heap=True) == best
+            assert rtaa_star_path_length(G, s, t, indexed_heap=True) == best
+
+    def test_heap_stats_show_smaller_queue(self):
+        G = dense_graph()
+        lazy, indexed = {}, {}
+        sma_star_path(G, 0, 79, memory_limit=10_000, heap_stats=lazy)
+        sma_star_path(G, 0, 79, memory_limit=10_000, indexed_heap=True, heap_stats=indexed)
+        assert indexed["stale_pops"] == 0
+        assert indexed["max_heap_size"] <= lazy["max_heap_size"]
+        assert indexed["heap_pushes"] + indexed["decrease_keys"] == lazy["heap_pushes"]
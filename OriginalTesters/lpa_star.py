@@ -0,0 +1,103 @@
+import random
+
+import networkx as nx
+import pytest
+
+from Algorithms.d_star_lite import new_dstar_lite_instance, d_star_modify_edges
+from Algorithms.lpa_star import (
+    new_lpa_star_instance,
+    lpa_star_modify_edge,
+    lpa_star_modify_edges,
+    lpa_star_remove_edge,
+    lpa_star_recalculate_path,
+    lpa_star_get_path_cost,
+    lpa_star_get_path_length,
+)
+
+
+def random_weighted_graph(n, p, seed, directed=True):
+    G = nx.gnp_random_graph(n, p, seed=seed, directed=directed)
+    rng = random.Random(seed)
+    for u, v in G.edges():
+        G[u][v]["weight"] = rng.randint(1, 20)
+    return G
+
+
+class TestLPAStarBasic:
+    def test_source_equals_target(self):
+        G = nx.path_graph(3)
+        lpa = new_lpa_star_instance(G, 1, 1)
+        assert lpa.get_path() == [1]
+        assert lpa_star_get_path_cost(lpa) == 0 and lpa_star_get_path_length(lpa) == 0
+
+    def test_disconnected_graph(self):
+        G = nx.DiGraph([(0, 1), (2, 3)])
+        lpa = new_lpa_star_instance(G, 0, 3)
+        assert lpa.get_path() is None
+        assert lpa.get_path_cost() == float("inf")
+        lpa_star_modify_edge(lpa, 1, 2, 4)
+        assert lpa.get_path() == [0, 1, 2, 3] and lpa.get_path_cost() == 6
+
+    def test_missing_endpoint(self):
+        with pytest.raises(nx.NodeNotFound):
+            new_lpa_star_instance(nx.path_graph(3), 0, 7)
+
+
+class TestLPAStarDynamic:
+    @pytest.mark.parametrize("directed", [True, False])
+    def test_updates_match_dijkstra(self, directed):
+        G = random_weighted_graph(90, 0.06, seed=31, directed=directed)
+        world = G.copy()
+        lpa = new_lpa_star_instance(G, 0, 89)
+        rng = random.Random(31)
+        for _ in range(60):
+            u, v = rng.choice(list(world.edges()))
+            if rng.random() < 0.2:
+                world.remove_edge(u, v)
+                lpa_star_remove_edge(lpa, u, v)
+            else:
+                world[u][v]["weight"] = rng.randint(1, 40)
+                lpa_star_modify_edge(lpa, u, v, world[u][v]["weight"])
+            path = lpa_star_recalculate_path(lpa)
+            if nx.has_path(world, 0, 89):
+                assert lpa.get_path_cost() == nx.dijkstra_path_length(world, 0, 89)
+                assert nx.path_weight(world, path, "weight") == lpa.get_path_cost()
+            else:
+                assert path is None
+        assert G.number_of_edges() > world.number_of_edges()
+
+    def test_extracted_path_realizes_rhs_with_ties(self):
+        # Few distinct weights make equal-cost predecessors common.
+        G = nx.grid_2d_graph(12, 12).to_directed()
+        rng = random.Random(4)
+        for u, v in G.edges():
+            G[u][v]["weight"] = rng.choice([0.1, 0.2, 0.3])
+        world = G.copy()
+        lpa = new_lpa_star_instance(G, (0, 0), (11, 11))
+        edges = list(world.edges())
+        for _ in range(40):
+            u, v = rng.choice(edges)
+            world[u][v]["weight"] = rng.choice([0.1, 0.2, 0.3, 0.7])
+            lpa_star_modify_edge(lpa, u, v, world[u][v]["weight"])
+            path = lpa_star_recalculate_path(lpa)
+            assert nx.path_weight(world, path, "weight") == lpa.rhs[(11, 11)]
+            assert lpa.rhs[(11, 11)] == pytest.approx(nx.dijkstra_path_length(world, (0, 0), (11, 11)))
+
+    def test_matches_dstar_lite_with_heuristic(self):
+        G = nx.grid_2d_graph(15, 15).to_directed()
+        rng = random.Random(8)
+        for u, v in G.edges():
+            G[u][v]["weight"] = rng.randint(1, 9)
+
+        def manhattan(u, v):
+            return abs(u[0] - v[0]) + abs(u[1] - v[1])
+
+        lpa = new_lpa_star_instance(G, (0, 0), (14, 14), heuristic=manhattan, deferred=True)
+        dstar = new_dstar_lite_instance(G, (0, 0), (14, 14), heuristic=manhattan)
+        edges = list(G.edges())
+        for _ in range(10):
+            updates = [(*rng.choice(edges), rng.randint(1, 9)) for _ in range(8)]
+            lpa_star_modify_edges(lpa, updates)
+            d_star_modify_edges(dstar, updates)
+            assert lpa.get_path_cost() == dstar.get_path_cost()
+        assert lpa.replans == 1 + 10
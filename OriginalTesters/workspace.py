@@ -0,0 +1,62 @@
+import random
+
+import networkx as nx
+import pytest
+
+from Algorithms.bi_astar import bidirectional_astar
+from Algorithms.csr_graph import to_csr_graph
+from Algorithms.ida_star import idastar_path
+from Algorithms.sma_star import sma_star_path
+from Algorithms.workspace import SearchWorkspace
+
+
+def weighted_graph(directed):
+    G = nx.gnp_random_graph(70, 0.07, seed=21, directed=directed)
+    rng = random.Random(21)
+    for u, v in G.edges():
+        G[u][v]["weight"] = rng.randint(1, 9)
+    return G
+
+
+class TestSearchWorkspace:
+    @pytest.mark.parametrize("directed", [False, True])
+    def test_reused_workspace_matches_fresh_queries(self, directed):
+        G = weighted_graph(directed)
+        C = to_csr_graph(G)
+        ws = SearchWorkspace(C)
+        rng = random.Random(4)
+        queries = 0
+        for _ in range(25):
+            s, t = rng.sample(list(G), 2)
+            if not nx.has_path(G, s, t):
+                with pytest.raises(nx.NetworkXNoPath):
+                    bidirectional_astar(C, s, t, workspace=ws)
+                queries += 1
+                continue
+            assert bidirectional_astar(C, s, t, workspace=ws) == bidirectional_astar(C, s, t)
+            assert idastar_path(C, s, t, workspace=ws) == idastar_path(C, s, t)
+            assert sma_star_path(C, s, t, memory_limit=10_000, workspace=ws) == sma_star_path(
+                C, s, t, memory_limit=10_000
+            )
+            queries += 3
+        assert ws.queries == queries
+
+    def test_begin_is_constant_time_reset(self):
+        C = to_csr_graph(nx.path_graph(5))
+        ws = SearchWorkspace(C)
+        bidirectional_astar(C, 0, 4, workspace=ws)
+        dist_before = ws.dist[0]
+        gen = ws.begin()
+        assert ws.dist[0] is dist_before
+        assert all(stamp < gen for stamp in ws.stamp[0])
+        assert all(not heap for heap in ws.heap)
+
+    def test_workspace_rejects_other_graphs(self):
+        C = to_csr_graph(nx.path_graph(5))
+        ws = SearchWorkspace(C)
+        with pytest.raises(nx.NetworkXError):
+            bidirectional_astar(to_csr_graph(nx.path_graph(5)), 0, 4, workspace=ws)
+        with pytest.raises(nx.NetworkXError):
+            idastar_path(nx.path_graph(5), 0, 4, workspace=ws)
+        with pytest.raises(nx.NetworkXError):
+            SearchWorkspace(nx.path_graph(5))
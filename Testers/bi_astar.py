@@ -6,14 +6,82 @@ import tracemalloc
 import networkx as nx
 from tabulate import tabulate
 
-from Algorithms.bi_astar import bidirectional_astar
+from Algorithms.bi_astar import (
+    bidirectional_astar,
+    bidirectional_astar_anytime,
+    bidirectional_astar_batch,
+    bidirectional_astar_k_shortest,
+)
+
+
+def synthetic_geometric_graph(n_nodes, seed=0):
+    """Random geometric graph whose nodes are (x, y) tuples, so the default
+    Euclidean heuristic of bidirectional_astar applies, with Euclidean weights."""
+    radius = (12 / (3.14159 * n_nodes)) ** 0.5
+    G = nx.random_geometric_graph(n_nodes, radius, seed=seed)
+    G = nx.relabel_nodes(G, {n: tuple(G.nodes[n]["pos"]) for n in G})
+    for u, v in G.edges():
+        G[u][v]["weight"] = ((u[0] - v[0]) ** 2 + (u[1] - v[1]) ** 2) ** 0.5
+    return G
+
+
+def dense_random_graph(n_nodes=2000, p=0.05, seed=0):
+    """Dense G(n, p) graph with random weights, where a node is typically
+    reached through many edges before it is expanded."""
+    G = nx.gnp_random_graph(n_nodes, p, seed=seed)
+    rng = random.Random(seed)
+    for u, v in G.edges():
+        G[u][v]["weight"] = rng.uniform(1, 100)
+    return G
+
+
+def mutated_weight(rng, u, v, heuristic=None):
+    """Random new weight for the edge (u, v), raised to the heuristic's
+    estimate between its endpoints so the heuristic stays admissible (and,
+    for a metric one such as HaversineHeuristic, consistent) after the edge
+    is rewritten."""
+    new_w = rng.randint(5, 50)
+    if heuristic is not None:
+        new_w = max(new_w, heuristic(u, v), heuristic(v, u))
+    return new_w
+
+
+def naive_k_shortest(graph, source, target, k, heuristic=None):
+    """Yen's algorithm that runs bidirectional_astar on a pruned copy of the
+    graph for every spur path; the baseline for bidirectional_astar_k_shortest."""
+    cost, path, _ = bidirectional_astar(graph, source, target, heuristic=heuristic)
+    accepted = [(cost, path)]
+    candidates = []
+    while len(accepted) < k:
+        last = accepted[-1][1]
+        for i in range(len(last) - 1):
+            root = last[: i + 1]
+            pruned = graph.copy()
+            pruned.remove_nodes_from(root[:-1])
+            for _, p in accepted:
+                if p[: i + 1] == root and pruned.has_edge(p[i], p[i + 1]):
+                    pruned.remove_edge(p[i], p[i + 1])
+            try:
+                _, spur_path, _ = bidirectional_astar(pruned, last[i], target, heuristic=heuristic)
+            except nx.NetworkXNoPath:
+                continue
+            candidate = root[:-1] + spur_path
+            if all(candidate != p for _, p in accepted) and all(candidate != p for _, p in candidates):
+                cost = sum(graph[u][v]["weight"] for u, v in zip(candidate, candidate[1:]))
+                candidates.append((cost, candidate))
+        if not candidates:
+            break
+        candidates.sort(key=lambda item: item[0])
+        accepted.append(candidates.pop(0))
+    return accepted
 
 
 class AStarVsBidirectionalComparison:
-    def __init__(self, graph: nx.Graph, source, target, n_modifications=50):
+    def __init__(self, graph: nx.Graph, source, target, n_modifications=50, heuristic=None):
         self.graph = graph
         self.source = source
         self.target = target
+        self.heuristic = heuristic
         self.name = "Bidirectional A*"
         self.n_modifications = n_modifications
 
@@ -22,36 +90,122 @@ class AStarVsBidirectionalComparison:
 
     def compare_time(self):
         t0 = time.perf_counter()
-        path_astar = nx.astar_path(self.graph, self.source, self.target, weight="weight")
+        path_astar = nx.astar_path(
+            self.graph, self.source, self.target, heuristic=self.heuristic, weight="weight"
+        )
         t1 = time.perf_counter()
         time_astar = t1 - t0
         cost_astar = self.compute_cost(path_astar)
 
         t0 = time.perf_counter()
-        cost_bi, path_bi, _ = bidirectional_astar(self.graph, self.source, self.target)
+        cost_bi, path_bi, stats_bi = bidirectional_astar(
+            self.graph, self.source, self.target, heuristic=self.heuristic
+        )
         t1 = time.perf_counter()
         time_bi = t1 - t0
 
+        cost_meet, _, stats_meet = bidirectional_astar(
+            self.graph, self.source, self.target, heuristic=self.heuristic, optimal=False
+        )
+
         return {
             "A* Time (s)": time_astar,
             "Bidirectional A* Time (s)": time_bi,
             "A* Cost": cost_astar,
             "Bidirectional A* Cost": cost_bi,
+            "Bi-A* Nodes Expanded": stats_bi["total_nodes_expanded"],
+            "Bi-A* First-Meet Cost": cost_meet,
+            "Bi-A* First-Meet Nodes Expanded": stats_meet["total_nodes_expanded"],
+        }
+
+    def compare_anytime(self, epsilon=3.0):
+        t0 = time.perf_counter()
+        routes = []
+        for cost, _, bound in bidirectional_astar_anytime(
+                self.graph, self.source, self.target, heuristic=self.heuristic, epsilon=epsilon
+        ):
+            routes.append((time.perf_counter() - t0, cost, bound))
+
+        first_time, first_cost, first_bound = routes[0]
+        last_time, last_cost, last_bound = routes[-1]
+        return {
+            "Anytime First Route Time (s)": first_time,
+            "Anytime First Route Cost": first_cost,
+            "Anytime First Route Bound": first_bound,
+            "Anytime Final Route Time (s)": last_time,
+            "Anytime Final Route Cost": last_cost,
+            "Anytime Routes Yielded": len(routes),
         }
 
+    def compare_alternatives(self, k=5, synthetic_nodes=2000):
+        rng = random.Random(0)
+        synthetic = synthetic_geometric_graph(synthetic_nodes)
+        giant = synthetic.subgraph(max(nx.connected_components(synthetic), key=len))
+        result = {}
+
+        for label, graph, source, target, heuristic in (
+                ("City", self.graph, self.source, self.target, self.heuristic),
+                ("Synthetic", giant, *rng.sample(list(giant), 2), None),
+        ):
+            t0 = time.perf_counter()
+            naive = naive_k_shortest(graph, source, target, k, heuristic=heuristic)
+            t1 = time.perf_counter()
+            time_naive = t1 - t0
+
+            t0 = time.perf_counter()
+            routes = bidirectional_astar_k_shortest(graph, source, target, k=k, heuristic=heuristic)
+            t1 = time.perf_counter()
+            time_yen = t1 - t0
+
+            result[f"{label} Naive {k}-Routes Time (s)"] = time_naive
+            result[f"{label} Masked {k}-Routes Time (s)"] = time_yen
+            result[f"{label} Naive K-th Route Cost"] = naive[-1][0]
+            result[f"{label} Masked K-th Route Cost"] = routes[-1][0]
+
+        result["Alternative Routes Count"] = k
+        return result
+
+    def compare_heap(self, runs=5):
+        dense = dense_random_graph()
+        result = {}
+
+        for label, graph, source, target, heuristic in (
+                ("City", self.graph, self.source, self.target, self.heuristic),
+                ("Dense", dense, 0, len(dense) - 1, None),
+        ):
+            timings = {False: [], True: []}
+            stats = {}
+            for _ in range(runs):
+                for indexed in (False, True):
+                    t0 = time.perf_counter()
+                    _, _, stats[indexed] = bidirectional_astar(
+                        graph, source, target, heuristic=heuristic, indexed_heap=indexed
+                    )
+                    t1 = time.perf_counter()
+                    timings[indexed].append(t1 - t0)
+
+            result[f"{label} Lazy Heap Max Size"] = stats[False]["max_heap_size"]
+            result[f"{label} Indexed Heap Max Size"] = stats[True]["max_heap_size"]
+            result[f"{label} Stale Pops Avoided"] = stats[False]["stale_pops"]
+            result[f"{label} Duplicate Pushes Avoided"] = stats[True]["decrease_keys"]
+            result[f"{label} Indexed Heap Time Saved (s)"] = (
+                    statistics.mean(timings[False]) - statistics.mean(timings[True])
+            )
+        return result
+
     def compare_memory(self, runs: int = 5):
         peaks_astar = []
         peaks_bi = []
 
         for _ in range(runs):
             tracemalloc.start()
-            nx.astar_path(self.graph, self.source, self.target, weight="weight")
+            nx.astar_path(self.graph, self.source, self.target, heuristic=self.heuristic, weight="weight")
             _, peak_a = tracemalloc.get_traced_memory()
             tracemalloc.stop()
             peaks_astar.append(peak_a)
 
             tracemalloc.start()
-            bidirectional_astar(self.graph, self.source, self.target)
+            bidirectional_astar(self.graph, self.source, self.target, heuristic=self.heuristic)
             _, peak_b = tracemalloc.get_traced_memory()
             tracemalloc.stop()
             peaks_bi.append(peak_b)
@@ -69,12 +223,12 @@ class AStarVsBidirectionalComparison:
         self.graph[self.source][neighbor]["weight"] += 1
 
         t0 = time.perf_counter()
-        nx.astar_path(self.graph, self.source, self.target, weight="weight")
+        nx.astar_path(self.graph, self.source, self.target, heuristic=self.heuristic, weight="weight")
         t1 = time.perf_counter()
         time_astar = t1 - t0
 
         t0 = time.perf_counter()
-        bidirectional_astar(self.graph, self.source, self.target)
+        bidirectional_astar(self.graph, self.source, self.target, heuristic=self.heuristic)
         t1 = time.perf_counter()
         time_bi = t1 - t0
 
@@ -90,16 +244,16 @@ class AStarVsBidirectionalComparison:
 
         for _ in range(self.n_modifications):
             u, v = random.choice(all_edges)
-            new_w = random.randint(5, 50)
+            new_w = mutated_weight(random, u, v, self.heuristic)
             self.graph[u][v]["weight"] = new_w
 
             t0 = time.perf_counter()
-            nx.astar_path(self.graph, self.source, self.target, weight="weight")
+            nx.astar_path(self.graph, self.source, self.target, heuristic=self.heuristic, weight="weight")
             t1 = time.perf_counter()
             times_astar.append(t1 - t0)
 
             t0 = time.perf_counter()
-            bidirectional_astar(self.graph, self.source, self.target)
+            bidirectional_astar(self.graph, self.source, self.target, heuristic=self.heuristic)
             t1 = time.perf_counter()
             times_bi.append(t1 - t0)
 
@@ -109,13 +263,51 @@ class AStarVsBidirectionalComparison:
             "Bulk Modifications Count": self.n_modifications
         }
 
+    def compare_batch(self, n_pairs=200, n_depots=5, synthetic_nodes=20000):
+        rng = random.Random(0)
+        synthetic = synthetic_geometric_graph(synthetic_nodes)
+        result = {}
+
+        for label, graph, heuristic in (
+                ("City", self.graph, self.heuristic),
+                ("Synthetic", synthetic, None),
+        ):
+            nodes = list(graph)
+            depots = rng.sample(nodes, k=min(n_depots, len(nodes)))
+            pairs = [(rng.choice(nodes), rng.choice(depots)) for _ in range(n_pairs)]
+
+            t0 = time.perf_counter()
+            for s, t in pairs:
+                try:
+                    bidirectional_astar(graph, s, t, heuristic=heuristic)
+                except nx.NetworkXNoPath:
+                    pass
+            t1 = time.perf_counter()
+            time_single = t1 - t0
+
+            t0 = time.perf_counter()
+            bidirectional_astar_batch(graph, pairs, heuristic=heuristic)
+            t1 = time.perf_counter()
+            time_batch = t1 - t0
+
+            result[f"{label} Single Pairs/s"] = n_pairs / time_single
+            result[f"{label} Batch Pairs/s"] = n_pairs / time_batch
+
+        result["Batch Pairs Count"] = n_pairs
+        return result
+
     def run_all(self):
         time_data = self.compare_time()
+        anytime_data = self.compare_anytime()
+        alternatives_data = self.compare_alternatives()
+        heap_data = self.compare_heap()
         mem_data = self.compare_memory()
         recalc_data = self.compare_recalculation()
+        # The 20k-node synthetic graph is opt-in; a smaller one keeps run_all quick.
+        batch_data = self.compare_batch(synthetic_nodes=2000)
         bulk_data = self.compare_bulk_modifications()
 
-        result = {**time_data, **mem_data, **recalc_data, **bulk_data}
+        result = {**time_data, **anytime_data, **alternatives_data, **heap_data, **mem_data, **recalc_data, **batch_data, **bulk_data}
         table = [[k, f"{v:.6f}" if isinstance(v, float) else v] for k, v in result.items()]
         print(tabulate(table, headers=["Metric", "Value"], tablefmt="grid"))
         return result
@@ -1,36 +1,89 @@
+import asyncio
+import math
+import os
 import random
 import statistics
+import sys
+import tempfile
 import time
 import tracemalloc
 
 import networkx as nx
+import numpy as np
 from tabulate import tabulate
 
+from Algorithms.d_star_feed import DStarLiteFeed
+from Algorithms.csr_graph import CSRGraph, to_csr_graph
 from Algorithms.d_star_lite import (
+    DStarLite,
     new_dstar_lite_instance,
     d_star_modify_edge,
+    d_star_modify_edges,
+    d_star_remove_edge,
+    d_star_remove_node,
+    d_star_move_source,
     d_star_recalculate_path,
+    d_star_get_cost_from,
+    d_star_save_state,
+    d_star_load_state,
 )
+from Testers.bi_astar import dense_random_graph, mutated_weight
+
+
+def synthetic_grid_csr(side=1000):
+    """
+    Directed side x side 4-neighbour grid compiled straight into a CSRGraph,
+    without building the NetworkX graph first. Node i sits at row i // side,
+    column i % side; every edge has weight 1.
+    """
+    ids = np.arange(side * side, dtype=np.int64).reshape(side, side)
+    pairs = [
+        (ids[:, :-1], ids[:, 1:]), (ids[:, 1:], ids[:, :-1]),
+        (ids[:-1, :], ids[1:, :]), (ids[1:, :], ids[:-1, :]),
+    ]
+    rows = np.concatenate([a.ravel() for a, _ in pairs])
+    cols = np.concatenate([b.ravel() for _, b in pairs])
+    weights = np.ones(len(rows), dtype=np.float64)
+    return CSRGraph.from_edge_arrays(side * side, rows, cols, weights)
+
+
+class _EagerDStarLite(DStarLite):
+    """D* Lite with g/rhs tables filled with infinity for every node up front."""
+
+    def _cost_table(self):
+        if self._labels is not None:
+            return [float("inf")] * len(self._labels)
+        return dict.fromkeys(self.G, float("inf"))
+
+
+def _queue_bytes(queue):
+    """Approximate memory held by a D* Lite PriorityQueue's heap and entries."""
+    return sys.getsizeof(queue.heap) + sum(
+        sys.getsizeof(entry) + sys.getsizeof(entry[0]) for entry in queue.heap
+    )
 
 
 class DStarLiteVsAStarComparison:
-    def __init__(self, graph: nx.DiGraph, source, target,n_modifications=50):
+    def __init__(self, graph: nx.DiGraph, source, target,n_modifications=50, heuristic=None, state_path=None):
         self.graph = graph
         self.source = source
         self.target = target
+        self.heuristic = heuristic
         self.name = "D* Lite"
         self.n_modifications=n_modifications
+        # Saved overlay instance for source -> target, e.g. handed over by main.py
+        self.state_path = state_path
 
     def compare_initial_time(self):
         t0 = time.perf_counter()
-        dstar = new_dstar_lite_instance(self.graph, self.source, self.target)
+        dstar = new_dstar_lite_instance(self.graph, self.source, self.target, heuristic=self.heuristic)
         path_d = dstar.get_path()
         t1 = time.perf_counter()
         time_dstar = t1 - t0
         cost_d = dstar.get_path_cost()
 
         t0 = time.perf_counter()
-        path_a = nx.astar_path(self.graph, self.source, self.target, weight="weight")
+        path_a = nx.astar_path(self.graph, self.source, self.target, heuristic=self.heuristic, weight="weight")
         t1 = time.perf_counter()
         time_astar = t1 - t0
         cost_a = sum(
@@ -50,13 +103,13 @@ class DStarLiteVsAStarComparison:
 
         for _ in range(runs):
             tracemalloc.start()
-            nx.astar_path(self.graph, self.source, self.target, weight="weight")
+            nx.astar_path(self.graph, self.source, self.target, heuristic=self.heuristic, weight="weight")
             _, peak_astar = tracemalloc.get_traced_memory()
             tracemalloc.stop()
             peaks_astar.append(peak_astar)
 
             tracemalloc.start()
-            new_dstar_lite_instance(self.graph, self.source, self.target)
+            new_dstar_lite_instance(self.graph, self.source, self.target, heuristic=self.heuristic)
             _, peak_dstar = tracemalloc.get_traced_memory()
             tracemalloc.stop()
             peaks_dstar.append(peak_dstar)
@@ -69,8 +122,288 @@ class DStarLiteVsAStarComparison:
             "D* Lite Avg Memory (MiB)": statistics.mean(peaks_dstar) / mib,
         }
 
+    def compare_overlay(self, n_agents=30):
+        """Memory and set-up time of many agents sharing one graph."""
+        nodes = list(self.graph)
+        rng = random.Random(0)
+        targets = [rng.choice(nodes) for _ in range(n_agents)]
+        mib = 1024 * 1024
+        result = {}
+
+        for label, overlay in (("Copy", False), ("Overlay", True)):
+            tracemalloc.start()
+            t0 = time.perf_counter()
+            agents = [
+                new_dstar_lite_instance(
+                    self.graph, self.source, target, heuristic=self.heuristic, overlay=overlay
+                )
+                for target in targets
+            ]
+            t1 = time.perf_counter()
+            current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            result[f"D* Lite {label} Memory per Agent (MiB)"] = current / mib / n_agents
+            result[f"D* Lite {label} Init Time per Agent (s)"] = (t1 - t0) / n_agents
+            del agents
+
+        result["D* Lite Shared-Graph Agents"] = n_agents
+        return result
+
+    def compare_startup(self, side=1000, corridor=10):
+        """
+        Set-up time and peak memory of an overlay instance on a synthetic
+        side x side grid (1M nodes by default) whose search only spans a
+        short corridor, with lazy g/rhs tables versus tables allocated for
+        every node.
+        """
+        C = synthetic_grid_csr(side)
+        source, target = 0, corridor
+        mib = 1024 * 1024
+        result = {"Startup Graph Nodes": C.number_of_nodes()}
+
+        for label, cls in (("Eager", _EagerDStarLite), ("Lazy", DStarLite)):
+            t0 = time.perf_counter()
+            dstar = cls(C, source, target, overlay=True)
+            t1 = time.perf_counter()
+            if dstar.get_path_cost() != corridor:
+                raise ValueError(f"{label} instance found a wrong path")
+            del dstar
+
+            tracemalloc.start()
+            dstar = cls(C, source, target, overlay=True)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            del dstar
+            result[f"D* Lite {label} Startup Time (s)"] = t1 - t0
+            result[f"D* Lite {label} Startup Peak Memory (MiB)"] = peak / mib
+        return result
+
+    def compare_depot(self, n_vehicles=20):
+        """
+        Vehicles at random nodes all heading to the target: one shared
+        instance answering every vehicle against one instance per vehicle.
+        """
+        rng = random.Random(0)
+        starts = [
+            node for node in rng.sample(list(self.graph), min(n_vehicles, len(self.graph)))
+            if nx.has_path(self.graph, node, self.target)
+        ]
+
+        t0 = time.perf_counter()
+        per_vehicle = [
+            new_dstar_lite_instance(self.graph, node, self.target, heuristic=self.heuristic, overlay=True)
+            .get_path_cost()
+            for node in starts
+        ]
+        t1 = time.perf_counter()
+        time_per_vehicle = t1 - t0
+
+        t0 = time.perf_counter()
+        depot = new_dstar_lite_instance(
+            self.graph, self.source, self.target, heuristic=self.heuristic, overlay=True
+        )
+        shared = [d_star_get_cost_from(depot, node) for node in starts]
+        t1 = time.perf_counter()
+        time_shared = t1 - t0
+
+        if len(shared) != len(per_vehicle) or not all(
+                math.isclose(a, b) for a, b in zip(shared, per_vehicle)
+        ):
+            raise ValueError("Shared depot instance disagrees with per-vehicle instances")
+        return {
+            "Depot Vehicles": len(starts),
+            "D* Lite Instance per Vehicle Time (s)": time_per_vehicle,
+            "D* Lite Shared Depot Instance Time (s)": time_shared,
+        }
+
+    def compare_soak(self, n_modifications=1_000_000, samples=10):
+        """
+        Long-running instance absorbing a stream of random edge updates, with
+        and without compaction of the priority queue. Reports the queue's
+        live and physical size and approximate memory at the first and last
+        sample. The default million updates take minutes; run_all uses a
+        shorter soak.
+        """
+        all_edges = list(self.graph.edges)
+        every = max(1, n_modifications // samples)
+        mib = 1024 * 1024
+        result = {"Soak Modifications": n_modifications}
+
+        for label, ratio in (("Uncompacted", None), ("Compacted", 0.5)):
+            rng = random.Random(0)
+            dstar = new_dstar_lite_instance(self.graph, self.source, self.target, overlay=True)
+            dstar.queue.max_stale_ratio = ratio
+            sizes = []
+            t0 = time.perf_counter()
+            for i in range(1, n_modifications + 1):
+                u, v = rng.choice(all_edges)
+                d_star_modify_edge(dstar, u, v, mutated_weight(rng, u, v, self.heuristic))
+                if i % every == 0:
+                    sizes.append((len(dstar.queue), dstar.queue.physical_size, _queue_bytes(dstar.queue)))
+            t1 = time.perf_counter()
+            result[f"D* Lite {label} Soak Time (s)"] = t1 - t0
+            result[f"D* Lite {label} Queue Live/Physical (first sample)"] = f"{sizes[0][0]}/{sizes[0][1]}"
+            result[f"D* Lite {label} Queue Live/Physical (last sample)"] = f"{sizes[-1][0]}/{sizes[-1][1]}"
+            result[f"D* Lite {label} Queue Memory First (MiB)"] = sizes[0][2] / mib
+            result[f"D* Lite {label} Queue Memory Last (MiB)"] = sizes[-1][2] / mib
+            result[f"D* Lite {label} Queue Compactions"] = dstar.queue.compactions
+        return result
+
+    def compare_vectorized(self, n_updates=200, n_nodes=2000, p=0.05):
+        """
+        Per-update latency of the NetworkX dict backend, the CSR backend and
+        the vectorized CSR backend on a dense random graph, measured both for
+        a full edge modification (update + replanning) and for update_vertex
+        alone.
+        """
+        G = dense_random_graph(n_nodes, p)
+        C = to_csr_graph(G)
+        source, target = 0, n_nodes - 1
+        rng = random.Random(0)
+        edges = list(G.edges)
+        updates = [(*rng.choice(edges), rng.uniform(1, 100)) for _ in range(n_updates)]
+        probes = [rng.randrange(n_nodes) for _ in range(n_updates)]
+        result = {"Vectorized Graph Avg Degree": 2 * G.number_of_edges() / n_nodes}
+
+        backends = (
+            ("Dict", G, {}),
+            ("CSR", C, {}),
+            ("Vectorized CSR", C, {"vectorized": True}),
+        )
+        costs = []
+        for label, graph, options in backends:
+            dstar = new_dstar_lite_instance(graph, source, target, overlay=True, **options)
+            t0 = time.perf_counter()
+            for u, v, w in updates:
+                d_star_modify_edge(dstar, u, v, w)
+            t1 = time.perf_counter()
+            costs.append(dstar.get_path_cost())
+            nodes = [dstar._node(n) for n in probes]
+            t2 = time.perf_counter()
+            for n in nodes:
+                dstar.update_vertex(n)
+            t3 = time.perf_counter()
+            result[f"D* Lite {label} Modify Avg Time (s)"] = (t1 - t0) / n_updates
+            result[f"D* Lite {label} update_vertex Avg Time (s)"] = (t3 - t2) / n_updates
+
+        if max(costs) - min(costs) > 1e-9 * max(costs):
+            raise ValueError("D* Lite backends disagree on the path cost")
+        return result
+
+    def compare_warm_start(self):
+        """
+        Building an overlay instance from scratch against restoring a saved,
+        converged one. Uses `state_path` if given, otherwise saves a state to
+        a temporary file first.
+        """
+        state_path = self.state_path
+        temporary = state_path is None
+        if temporary:
+            fd, state_path = tempfile.mkstemp(suffix=".dstar")
+            os.close(fd)
+            d_star_save_state(
+                new_dstar_lite_instance(
+                    self.graph, self.source, self.target, heuristic=self.heuristic, overlay=True
+                ),
+                state_path,
+            )
+        try:
+            t0 = time.perf_counter()
+            cold = new_dstar_lite_instance(
+                self.graph, self.source, self.target, heuristic=self.heuristic, overlay=True
+            )
+            t1 = time.perf_counter()
+            warm = d_star_load_state(state_path, self.graph, heuristic=self.heuristic)
+            t2 = time.perf_counter()
+            state_bytes = os.path.getsize(state_path)
+        finally:
+            if temporary:
+                os.remove(state_path)
+
+        if not math.isclose(warm.get_path_cost(), cold.get_path_cost()):
+            raise ValueError("Restored D* Lite instance disagrees with a fresh one")
+        return {
+            "D* Lite Cold Start Time (s)": t1 - t0,
+            "D* Lite Warm Start Time (s)": t2 - t1,
+            "D* Lite State File Size (KiB)": state_bytes / 1024,
+        }
+
+    def compare_feed(self, n_updates=500, windows=(0.0, 0.005, 0.02), mean_gap=0.0005):
+        """
+        Streams random edge updates through a DStarLiteFeed at an average of
+        one every `mean_gap` seconds, for several coalescing windows, and
+        reports update-to-new-path latency percentiles.
+        """
+        all_edges = list(self.graph.edges)
+        result = {"Feed Updates": n_updates}
+
+        for window in windows:
+            rng = random.Random(0)
+            dstar = new_dstar_lite_instance(
+                self.graph, self.source, self.target, heuristic=self.heuristic, overlay=True
+            )
+            feed = DStarLiteFeed(dstar, window=window)
+
+            async def producer():
+                for _ in range(n_updates):
+                    u, v = rng.choice(all_edges)
+                    feed.submit(u, v, mutated_weight(rng, u, v, self.heuristic))
+                    await asyncio.sleep(rng.expovariate(1 / mean_gap))
+                feed.close()
+
+            async def stream():
+                await asyncio.gather(feed.run(), producer())
+
+            asyncio.run(stream())
+            label = f"D* Lite Feed (window={window * 1000:g} ms)"
+            for p, value in feed.latency_percentiles((50, 95, 99)).items():
+                result[f"{label} p{p} Latency (s)"] = value
+            result[f"{label} Batches"] = feed.batches
+            result[f"{label} Paths Published"] = feed.published
+        return result
+
+    def compare_topology_changes(self, n_changes=20):
+        """
+        Road closures (edge removals) and node removals applied to a live
+        instance against rebuilding the instance after every change.
+        """
+        world = self.graph.copy()
+        rng = random.Random(0)
+        dstar = new_dstar_lite_instance(world, self.source, self.target, heuristic=self.heuristic)
+        times_incremental = []
+        times_rebuild = []
+
+        for i in range(n_changes):
+            if i % 4 == 3:
+                candidates = [n for n in world if n not in (self.source, self.target)]
+                node = rng.choice(candidates)
+                t0 = time.perf_counter()
+                d_star_remove_node(dstar, node)
+                t1 = time.perf_counter()
+                world.remove_node(node)
+            else:
+                u, v = rng.choice(list(world.edges))
+                t0 = time.perf_counter()
+                d_star_remove_edge(dstar, u, v)
+                t1 = time.perf_counter()
+                world.remove_edge(u, v)
+            times_incremental.append(t1 - t0)
+
+            t0 = time.perf_counter()
+            rebuilt = new_dstar_lite_instance(world, self.source, self.target, heuristic=self.heuristic)
+            t1 = time.perf_counter()
+            times_rebuild.append(t1 - t0)
+            if not math.isclose(rebuilt.get_path_cost(), dstar.get_path_cost()):
+                raise ValueError("Incremental topology change disagrees with a rebuilt instance")
+
+        return {
+            "Topology Changes": n_changes,
+            "D* Lite Incremental Topology Change Avg Time (s)": statistics.mean(times_incremental),
+            "D* Lite Rebuild After Topology Change Avg Time (s)": statistics.mean(times_rebuild),
+        }
+
     def compare_recalculation(self):
-        dstar = new_dstar_lite_instance(self.graph, self.source, self.target)
+        dstar = new_dstar_lite_instance(self.graph, self.source, self.target, heuristic=self.heuristic)
         path = dstar.get_path()
         if not path or len(path) < 3:
             raise ValueError("Insufficient path for modification")
@@ -81,7 +414,7 @@ class DStarLiteVsAStarComparison:
         total_time_astar = 0.0
 
         for u, v in edges_to_modify:
-            new_w = random.randint(5, 50)
+            new_w = mutated_weight(random, u, v, self.heuristic)
 
             t0 = time.perf_counter()
             d_star_modify_edge(dstar, u, v, new_w)
@@ -91,7 +424,7 @@ class DStarLiteVsAStarComparison:
 
             self.graph[u][v]["weight"] = new_w
             t0 = time.perf_counter()
-            _ = nx.astar_path_length(self.graph, self.source, self.target, weight="weight")
+            _ = nx.astar_path_length(self.graph, self.source, self.target, heuristic=self.heuristic, weight="weight")
             t1 = time.perf_counter()
             total_time_astar += t1 - t0
 
@@ -101,14 +434,18 @@ class DStarLiteVsAStarComparison:
         }
 
     def compare_bulk_modifications(self):
-        dstar = new_dstar_lite_instance(self.graph, self.source, self.target)
+        dstar = new_dstar_lite_instance(self.graph, self.source, self.target, heuristic=self.heuristic)
+        filtered = new_dstar_lite_instance(
+            self.graph, self.source, self.target, heuristic=self.heuristic, impact_filter=True
+        )
         all_edges = list(self.graph.edges)
         times_dstar = []
+        times_filtered = []
         times_astar = []
 
         for _ in range(self.n_modifications):
             u, v = random.choice(all_edges)
-            new_w = random.randint(5, 50)
+            new_w = mutated_weight(random, u, v, self.heuristic)
 
             t0 = time.perf_counter()
             d_star_modify_edge(dstar, u, v, new_w)
@@ -116,25 +453,147 @@ class DStarLiteVsAStarComparison:
             t1 = time.perf_counter()
             times_dstar.append(t1 - t0)
 
+            t0 = time.perf_counter()
+            d_star_modify_edge(filtered, u, v, new_w)
+            d_star_recalculate_path(filtered)
+            t1 = time.perf_counter()
+            times_filtered.append(t1 - t0)
+
             self.graph[u][v]["weight"] = new_w
             t0 = time.perf_counter()
-            nx.astar_path(self.graph, self.source, self.target, weight="weight")
+            nx.astar_path(self.graph, self.source, self.target, heuristic=self.heuristic, weight="weight")
             t1 = time.perf_counter()
             times_astar.append(t1 - t0)
 
+        if not math.isclose(filtered.get_path_cost(), dstar.get_path_cost()):
+            raise ValueError("Impact filter changed the path cost")
         return {
             "D* Lite Bulk Avg Time (s)": statistics.mean(times_dstar),
+            "D* Lite Filtered Bulk Avg Time (s)": statistics.mean(times_filtered),
+            "D* Lite Filtered Updates Skipped": filtered.updates_skipped,
+            "D* Lite Filtered Updates Processed": filtered.updates_processed,
             "A* Bulk Avg Time (s)": statistics.mean(times_astar),
             "Bulk Modifications Count": self.n_modifications
         }
 
+    def compare_batched_modifications(self, burst_size=100):
+        """One burst of edge updates applied edge by edge, as a batch, and deferred."""
+        all_edges = list(self.graph.edges)
+        rng = random.Random(0)
+        picks = [rng.choice(all_edges) for _ in range(burst_size)]
+        updates = [(u, v, mutated_weight(rng, u, v, self.heuristic)) for u, v in picks]
+        result = {}
+
+        sequential = new_dstar_lite_instance(self.graph, self.source, self.target, heuristic=self.heuristic)
+        batched = new_dstar_lite_instance(self.graph, self.source, self.target, heuristic=self.heuristic)
+        deferred = new_dstar_lite_instance(
+            self.graph, self.source, self.target, heuristic=self.heuristic, deferred=True
+        )
+
+        t0 = time.perf_counter()
+        for u, v, w in updates:
+            d_star_modify_edge(sequential, u, v, w)
+            d_star_recalculate_path(sequential)
+        t1 = time.perf_counter()
+        result["D* Lite Sequential Burst Time (s)"] = t1 - t0
+
+        t0 = time.perf_counter()
+        d_star_modify_edges(batched, updates)
+        d_star_recalculate_path(batched)
+        t1 = time.perf_counter()
+        result["D* Lite Batched Burst Time (s)"] = t1 - t0
+
+        t0 = time.perf_counter()
+        for u, v, w in updates:
+            d_star_modify_edge(deferred, u, v, w)
+        d_star_recalculate_path(deferred)
+        t1 = time.perf_counter()
+        result["D* Lite Deferred Burst Time (s)"] = t1 - t0
+
+        for label, dstar in (("Sequential", sequential), ("Batched", batched), ("Deferred", deferred)):
+            result[f"D* Lite {label} Burst Replans"] = dstar.replans - 1
+        result["D* Lite Burst Size"] = burst_size
+        return result
+
+    def compare_moving_agent(self, changes_per_step=3, max_steps=200):
+        """
+        An agent drives from source to target while edge weights change at
+        every step. The incremental instance moves its source and replans;
+        the baselines rebuild a D* Lite instance or rerun A* from the agent's
+        position.
+        """
+        world = self.graph.copy()
+        all_edges = list(world.edges)
+        rng = random.Random(0)
+        dstar = new_dstar_lite_instance(world, self.source, self.target, heuristic=self.heuristic)
+        times = {"incremental": [], "fresh": [], "astar": []}
+        position = self.source
+        driven_cost = 0.0
+        steps = 0
+
+        while position != self.target and steps < max_steps:
+            path = dstar.get_path()
+            if path is None:
+                break
+            next_node = path[1]
+            driven_cost += world[position][next_node]["weight"]
+            position = next_node
+            steps += 1
+
+            picks = [rng.choice(all_edges) for _ in range(changes_per_step)]
+            updates = [(u, v, mutated_weight(rng, u, v, self.heuristic)) for u, v in picks]
+            for u, v, w in updates:
+                world[u][v]["weight"] = w
+
+            t0 = time.perf_counter()
+            d_star_modify_edges(dstar, updates)
+            d_star_move_source(dstar, position)
+            t1 = time.perf_counter()
+            times["incremental"].append(t1 - t0)
+
+            if position == self.target:
+                break
+
+            t0 = time.perf_counter()
+            new_dstar_lite_instance(world, position, self.target, heuristic=self.heuristic)
+            t1 = time.perf_counter()
+            times["fresh"].append(t1 - t0)
+
+            t0 = time.perf_counter()
+            nx.astar_path(world, position, self.target, heuristic=self.heuristic, weight="weight")
+            t1 = time.perf_counter()
+            times["astar"].append(t1 - t0)
+
+        return {
+            "Moving Agent Steps": steps,
+            "Moving Agent Reached Target": position == self.target,
+            "Moving Agent Driven Cost": driven_cost,
+            "D* Lite Move+Replan Avg Time (s)": statistics.mean(times["incremental"] or [0.0]),
+            "D* Lite Fresh Instance Avg Time (s)": statistics.mean(times["fresh"] or [0.0]),
+            "A* Replan From Position Avg Time (s)": statistics.mean(times["astar"] or [0.0]),
+        }
+
     def run_all(self):
         time_data = self.compare_initial_time()
         mem_data = self.compare_memory()
+        overlay_data = self.compare_overlay()
+        startup_data = self.compare_startup()
+        depot_data = self.compare_depot()
+        # The million-update default is opt-in; a short soak keeps run_all quick.
+        soak_data = self.compare_soak(n_modifications=10_000)
+        vectorized_data = self.compare_vectorized()
+        warm_data = self.compare_warm_start()
+        feed_data = self.compare_feed()
+        topology_data = self.compare_topology_changes()
         recalc_data = self.compare_recalculation()
         bulk_data = self.compare_bulk_modifications()
+        batched_data = self.compare_batched_modifications()
+        moving_data = self.compare_moving_agent()
 
-        result = {**time_data, **mem_data, **recalc_data, **bulk_data}
+        result = {
+            **time_data, **mem_data, **overlay_data, **startup_data, **depot_data, **soak_data, **vectorized_data, **warm_data, **feed_data, **topology_data, **recalc_data, **bulk_data, **batched_data,
+            **moving_data,
+        }
         table = [[k, f"{v:.6f}" if isinstance(v, float) else v] for k, v in result.items()]
         print(tabulate(table, headers=["Metric", "Value"], tablefmt="grid"))
         return result
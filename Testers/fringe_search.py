@@ -0,0 +1,135 @@
+import random
+import statistics
+import time
+import tracemalloc
+
+import networkx as nx
+from tabulate import tabulate
+
+from Algorithms.fringe_search import fringe_search_path
+from Algorithms.ida_star import idastar_path
+from Testers.bi_astar import mutated_weight
+
+
+class FringeSearchVsIDAStarComparison:
+    def __init__(self, graph: nx.Graph, source, target, n_modifications=50, heuristic=None):
+        self.graph = graph
+        self.source = source
+        self.target = target
+        self.heuristic = heuristic
+        self.name = "Fringe Search"
+        self.n_modifications = n_modifications
+
+    def compute_cost(self, graph, path):
+        return nx.path_weight(graph, path, "weight")
+
+    def compare_initial_time(self):
+        t0 = time.perf_counter()
+        path_fringe = fringe_search_path(self.graph, self.source, self.target, heuristic=self.heuristic)
+        t1 = time.perf_counter()
+        time_fringe = t1 - t0
+
+        t0 = time.perf_counter()
+        path_ida = idastar_path(self.graph, self.source, self.target, heuristic=self.heuristic)
+        t1 = time.perf_counter()
+        time_ida = t1 - t0
+
+        t0 = time.perf_counter()
+        path_astar = nx.astar_path(self.graph, self.source, self.target, heuristic=self.heuristic, weight="weight")
+        t1 = time.perf_counter()
+        time_astar = t1 - t0
+
+        return {
+            "A* Time (s)": time_astar,
+            "IDA* Time (s)": time_ida,
+            "Fringe Search Time (s)": time_fringe,
+            "A* Cost": self.compute_cost(self.graph, path_astar),
+            "IDA* Cost": self.compute_cost(self.graph, path_ida),
+            "Fringe Search Cost": self.compute_cost(self.graph, path_fringe),
+        }
+
+    def compare_search_effort(self):
+        """Iterations and node expansions of Fringe Search and IDA*, with the
+        expansions of a zero heuristic alongside to show how much the given
+        heuristic prunes."""
+        fringe_stats, ida_stats = {}, {}
+        fringe_search_path(self.graph, self.source, self.target, heuristic=self.heuristic, search_stats=fringe_stats)
+        idastar_path(self.graph, self.source, self.target, heuristic=self.heuristic, search_stats=ida_stats)
+        fringe_blind, ida_blind = {}, {}
+        fringe_search_path(self.graph, self.source, self.target, search_stats=fringe_blind)
+        idastar_path(self.graph, self.source, self.target, search_stats=ida_blind)
+        return {
+            "IDA* Iterations": ida_stats["iterations"],
+            "IDA* Expanded": ida_stats["expanded"],
+            "IDA* Expanded (h=0)": ida_blind["expanded"],
+            "Fringe Search Iterations": fringe_stats["iterations"],
+            "Fringe Search Expanded": fringe_stats["expanded"],
+            "Fringe Search Expanded (h=0)": fringe_blind["expanded"],
+            "Fringe Search Max Fringe": fringe_stats["max_fringe"],
+        }
+
+    def compare_memory(self, runs: int = 5):
+        peaks = {"A*": [], "IDA*": [], "Fringe Search": []}
+        searches = {
+            "A*": lambda: nx.astar_path(
+                self.graph, self.source, self.target, heuristic=self.heuristic, weight="weight"
+            ),
+            "IDA*": lambda: idastar_path(self.graph, self.source, self.target, heuristic=self.heuristic),
+            "Fringe Search": lambda: fringe_search_path(
+                self.graph, self.source, self.target, heuristic=self.heuristic
+            ),
+        }
+
+        for _ in range(runs):
+            for label, search in searches.items():
+                tracemalloc.start()
+                search()
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+                peaks[label].append(peak)
+
+        mib = 1024 * 1024
+        result = {}
+        for label, values in peaks.items():
+            result[f"{label} Peak Memory (MiB)"] = max(values) / mib
+            result[f"{label} Avg Memory (MiB)"] = statistics.mean(values) / mib
+        return result
+
+    def compare_bulk_modifications(self):
+        """Re-running both searches after weight changes on random edges."""
+        world = self.graph.copy()
+        all_edges = list(world.edges)
+        rng = random.Random(0)
+        times_fringe = []
+        times_ida = []
+
+        for _ in range(self.n_modifications):
+            u, v = rng.choice(all_edges)
+            world[u][v]["weight"] = mutated_weight(rng, u, v, self.heuristic)
+
+            t0 = time.perf_counter()
+            fringe_search_path(world, self.source, self.target, heuristic=self.heuristic)
+            t1 = time.perf_counter()
+            times_fringe.append(t1 - t0)
+
+            t0 = time.perf_counter()
+            idastar_path(world, self.source, self.target, heuristic=self.heuristic)
+            t1 = time.perf_counter()
+            times_ida.append(t1 - t0)
+
+        return {
+            "IDA* Bulk Avg Time (s)": statistics.mean(times_ida),
+            "Fringe Search Bulk Avg Time (s)": statistics.mean(times_fringe),
+            "Bulk Modifications Count": self.n_modifications,
+        }
+
+    def run_all(self):
+        time_data = self.compare_initial_time()
+        effort_data = self.compare_search_effort()
+        mem_data = self.compare_memory()
+        bulk_data = self.compare_bulk_modifications()
+
+        result = {**time_data, **effort_data, **mem_data, **bulk_data}
+        table = [[k, f"{v:.6f}" if isinstance(v, float) else v] for k, v in result.items()]
+        print(tabulate(table, headers=["Metric", "Value"], tablefmt="grid"))
+        return result
@@ -1,3 +1,5 @@
+import math
+import os
 import random
 import statistics
 import time
@@ -7,13 +9,56 @@ import networkx as nx
 from tabulate import tabulate
 
 from Algorithms.ida_star import idastar_path
+from Testers.bi_astar import mutated_weight
+
+
+def _grid_manhattan(u, v):
+    """Admissible on grids whose edge weights are at least 1; module-level so
+    that it can be sent to worker processes."""
+    return abs(u[0] - v[0]) + abs(u[1] - v[1])
+
+
+def _copying_idastar(G, source, target, heuristic):
+    """Reference IDA* that stores a full path copy per stacked child and checks
+    cycles with a linear scan of that copy; used as the baseline for the
+    single path stack of idastar_path."""
+    threshold = heuristic(source, target)
+    while True:
+        stack = [(source, 0, [source])]
+        visited = set()
+        min_threshold = float("inf")
+        while stack:
+            node, g_cost, path = stack.pop()
+            f_cost = g_cost + heuristic(node, target)
+            if f_cost > threshold:
+                min_threshold = min(min_threshold, f_cost)
+                continue
+            if node == target:
+                return path
+            if node in visited:
+                continue
+            visited.add(node)
+            neighbors = []
+            for neighbor, edge_attrs in G._adj[node].items():
+                if neighbor in path:
+                    continue
+                next_g = g_cost + edge_attrs.get("weight", 1)
+                f_neighbor = next_g + heuristic(neighbor, target)
+                neighbors.append((f_neighbor, neighbor, next_g, path + [neighbor]))
+            neighbors.sort(reverse=True)
+            for _, neighbor, next_g, next_path in neighbors:
+                stack.append((neighbor, next_g, next_path))
+        if min_threshold == float("inf"):
+            raise nx.NetworkXNoPath(f"Node {target} not reachable from {source}")
+        threshold = min_threshold
 
 
 class IDAStarVsAStarComparison:
-    def __init__(self, graph: nx.Graph, source, target, n_modifications=50):
+    def __init__(self, graph: nx.Graph, source, target, n_modifications=50, heuristic=None):
         self.graph = graph
         self.source = source
         self.target = target
+        self.heuristic = heuristic
         self.name = "IDA*"
         self.n_modifications = n_modifications
 
@@ -22,13 +67,13 @@ class IDAStarVsAStarComparison:
 
     def compare_initial_time(self):
         t0 = time.perf_counter()
-        path_ida = idastar_path(self.graph, self.source, self.target)
+        path_ida = idastar_path(self.graph, self.source, self.target, heuristic=self.heuristic)
         t1 = time.perf_counter()
         time_ida = t1 - t0
         cost_ida = self.compute_cost(path_ida)
 
         t0 = time.perf_counter()
-        path_astar = nx.astar_path(self.graph, self.source, self.target, weight="weight")
+        path_astar = nx.astar_path(self.graph, self.source, self.target, heuristic=self.heuristic, weight="weight")
         t1 = time.perf_counter()
         time_astar = t1 - t0
         cost_astar = self.compute_cost(path_astar)
@@ -46,13 +91,13 @@ class IDAStarVsAStarComparison:
 
         for _ in range(runs):
             tracemalloc.start()
-            nx.astar_path(self.graph, self.source, self.target, weight="weight")
+            nx.astar_path(self.graph, self.source, self.target, heuristic=self.heuristic, weight="weight")
             _, peak_astar = tracemalloc.get_traced_memory()
             tracemalloc.stop()
             peaks_astar.append(peak_astar)
 
             tracemalloc.start()
-            idastar_path(self.graph, self.source, self.target)
+            idastar_path(self.graph, self.source, self.target, heuristic=self.heuristic)
             _, peak_ida = tracemalloc.get_traced_memory()
             tracemalloc.stop()
             peaks_ida.append(peak_ida)
@@ -70,12 +115,12 @@ class IDAStarVsAStarComparison:
         self.graph[self.source][neighbor]["weight"] += 2
 
         t0 = time.perf_counter()
-        idastar_path(self.graph, self.source, self.target)
+        idastar_path(self.graph, self.source, self.target, heuristic=self.heuristic)
         t1 = time.perf_counter()
         time_ida = t1 - t0
 
         t0 = time.perf_counter()
-        nx.astar_path(self.graph, self.source, self.target, weight="weight")
+        nx.astar_path(self.graph, self.source, self.target, heuristic=self.heuristic, weight="weight")
         t1 = time.perf_counter()
         time_astar = t1 - t0
 
@@ -91,16 +136,16 @@ class IDAStarVsAStarComparison:
 
         for _ in range(self.n_modifications):
             u, v = random.choice(all_edges)
-            new_w = random.randint(5, 50)
+            new_w = mutated_weight(random, u, v, self.heuristic)
             self.graph[u][v]["weight"] = new_w
 
             t0 = time.perf_counter()
-            idastar_path(self.graph, self.source, self.target)
+            idastar_path(self.graph, self.source, self.target, heuristic=self.heuristic)
             t1 = time.perf_counter()
             times_ida.append(t1 - t0)
 
             t0 = time.perf_counter()
-            nx.astar_path(self.graph, self.source, self.target, weight="weight")
+            nx.astar_path(self.graph, self.source, self.target, heuristic=self.heuristic, weight="weight")
             t1 = time.perf_counter()
             times_astar.append(t1 - t0)
 
@@ -110,13 +155,139 @@ class IDAStarVsAStarComparison:
             "Bulk Modifications Count": self.n_modifications
         }
 
+    def compare_deep_paths(self, depth: int = 300):
+        """
+        Copy-per-child baseline vs the in-place path stack on a weighted path
+        graph of the given depth. With a zero heuristic every iteration goes
+        one edge deeper, so most expansions happen more than 50 levels down.
+        """
+        rng = random.Random(0)
+        G = nx.path_graph(depth + 1)
+        for u, v in G.edges():
+            G[u][v]["weight"] = rng.uniform(1, 10)
+        generated = [0]
+
+        def h(u, v):
+            generated[0] += 1
+            return 0
+
+        times = {}
+        for label, search in (("Copy", _copying_idastar), ("Stack", idastar_path)):
+            generated[0] = 0
+            t0 = time.perf_counter()
+            path = search(G, 0, depth, heuristic=h)
+            times[label] = time.perf_counter() - t0
+            if path != list(range(depth + 1)):
+                raise ValueError(f"{label} IDA* returned a wrong deep path")
+        # Both searches walk the same tree; the stack version calls h once per
+        # generated node (the baseline twice), so its count is the work unit.
+        nodes = generated[0]
+        return {
+            "IDA* Deep Path Depth": depth,
+            "IDA* Deep Path Nodes Generated": nodes,
+            "IDA* Deep Path Copy Time (s)": times["Copy"],
+            "IDA* Deep Path Stack Time (s)": times["Stack"],
+            "IDA* Deep Path Copy Nodes/s": nodes / times["Copy"],
+            "IDA* Deep Path Stack Nodes/s": nodes / times["Stack"],
+        }
+
+    def compare_threshold_policies(self, growth: float = 2.0, suboptimality: float = 1.1):
+        """
+        Iterations, expansions and re-expansions of classic IDA* thresholds
+        against IDA*-CR growth, optimal and with bounded suboptimality.
+        """
+        policies = {
+            "Exact": {},
+            "CR": {"threshold_growth": growth},
+            "CR Bounded": {"threshold_growth": growth, "suboptimality": suboptimality},
+        }
+        result = {}
+        for label, options in policies.items():
+            stats = {}
+            t0 = time.perf_counter()
+            path = idastar_path(
+                self.graph, self.source, self.target, heuristic=self.heuristic, search_stats=stats, **options
+            )
+            t1 = time.perf_counter()
+            result[f"IDA* {label} Time (s)"] = t1 - t0
+            result[f"IDA* {label} Iterations"] = stats["iterations"]
+            result[f"IDA* {label} Expanded"] = stats["expanded"]
+            result[f"IDA* {label} Re-expanded"] = stats["reexpanded"]
+            result[f"IDA* {label} Cost"] = self.compute_cost(path)
+        result["IDA* CR Growth Factor"] = growth
+        result["IDA* CR Suboptimality Bound"] = suboptimality
+        return result
+
+    def compare_transposition_table(self, size: int = 64, repeats: int = 20):
+        """
+        Expansions and average time with and without a transposition table of
+        `size` slots.
+        """
+        result = {}
+        for label, table_size in (("Without TT", None), ("With TT", size)):
+            stats = {}
+            t0 = time.perf_counter()
+            for _ in range(repeats):
+                idastar_path(
+                    self.graph, self.source, self.target, heuristic=self.heuristic,
+                    search_stats=stats, transposition_size=table_size,
+                )
+            t1 = time.perf_counter()
+            result[f"IDA* {label} Avg Time (s)"] = (t1 - t0) / repeats
+            result[f"IDA* {label} Expanded"] = stats["expanded"]
+            result[f"IDA* {label} Iterations"] = stats["iterations"]
+        result["IDA* TT Pruned"] = stats["transposition_pruned"]
+        result["IDA* TT Replaced"] = stats["transposition_replaced"]
+        result["IDA* TT Size"] = size
+        return result
+
+    def compare_parallel(self, side: int = 7, process_counts=None):
+        """
+        Speedup of parallel IDA* against the single-process search for a
+        growing number of worker processes, on a side x side grid with real
+        edge weights where exact thresholds take over a thousand iterations.
+        """
+        rng = random.Random(0)
+        G = nx.grid_2d_graph(side, side)
+        for u, v in G.edges():
+            G[u][v]["weight"] = rng.uniform(1, 9)
+        source, target = (0, 0), (side - 1, side - 1)
+        cores = os.cpu_count() or 1
+        if process_counts is None:
+            process_counts = sorted({1, 2, cores} | {p for p in (4, 8, 16) if p < cores})
+
+        t0 = time.perf_counter()
+        expected = idastar_path(G, source, target, heuristic=_grid_manhattan)
+        serial = time.perf_counter() - t0
+        result = {"CPU Cores": cores, "IDA* Serial Grid Time (s)": serial}
+        for processes in process_counts:
+            stats = {}
+            t0 = time.perf_counter()
+            path = idastar_path(
+                G, source, target, heuristic=_grid_manhattan, processes=processes, search_stats=stats
+            )
+            elapsed = time.perf_counter() - t0
+            if not math.isclose(nx.path_weight(G, path, "weight"), nx.path_weight(G, expected, "weight")):
+                raise ValueError("Parallel IDA* returned a costlier path")
+            result[f"IDA* Parallel Time p={processes} (s)"] = elapsed
+            result[f"IDA* Parallel Speedup p={processes}"] = serial / elapsed
+        result["IDA* Parallel Subtrees"] = stats["subtrees"]
+        return result
+
     def run_all(self):
         time_data = self.compare_initial_time()
         mem_data = self.compare_memory()
         recalc_data = self.compare_recalculation()
         bulk_data = self.compare_bulk_modifications()
+        deep_data = self.compare_deep_paths()
+        policy_data = self.compare_threshold_policies()
+        tt_data = self.compare_transposition_table()
+        parallel_data = self.compare_parallel()
 
-        result = {**time_data, **mem_data, **recalc_data, **bulk_data}
+        result = {
+            **time_data, **mem_data, **recalc_data, **bulk_data, **deep_data, **policy_data, **tt_data,
+            **parallel_data,
+        }
         table = [[k, f"{v:.6f}" if isinstance(v, float) else v] for k, v in result.items()]
         print(tabulate(table, headers=["Metric", "Value"], tablefmt="grid"))
         return result
@@ -0,0 +1,157 @@
+import math
+import random
+import statistics
+import time
+import tracemalloc
+
+import networkx as nx
+from tabulate import tabulate
+
+from Algorithms.d_star_lite import new_dstar_lite_instance, d_star_modify_edge, d_star_recalculate_path
+from Algorithms.lpa_star import new_lpa_star_instance, lpa_star_modify_edge, lpa_star_recalculate_path
+from Testers.bi_astar import mutated_weight
+
+
+class LPAStarVsDStarLiteComparison:
+    def __init__(self, graph: nx.DiGraph, source, target, n_modifications=50, heuristic=None):
+        self.graph = graph
+        self.source = source
+        self.target = target
+        self.heuristic = heuristic
+        self.name = "LPA*"
+        self.n_modifications = n_modifications
+
+    def compare_initial_time(self):
+        t0 = time.perf_counter()
+        lpa = new_lpa_star_instance(self.graph, self.source, self.target, heuristic=self.heuristic)
+        t1 = time.perf_counter()
+        time_lpa = t1 - t0
+
+        t0 = time.perf_counter()
+        dstar = new_dstar_lite_instance(self.graph, self.source, self.target, heuristic=self.heuristic)
+        t1 = time.perf_counter()
+        time_dstar = t1 - t0
+
+        t0 = time.perf_counter()
+        cost_a = nx.astar_path_length(self.graph, self.source, self.target, heuristic=self.heuristic, weight="weight")
+        t1 = time.perf_counter()
+        time_astar = t1 - t0
+
+        return {
+            "A* Time (s)": time_astar,
+            "D* Lite Time (s)": time_dstar,
+            "LPA* Time (s)": time_lpa,
+            "A* Cost": cost_a,
+            "D* Lite Cost": dstar.get_path_cost(),
+            "LPA* Cost": lpa.get_path_cost(),
+        }
+
+    def compare_memory(self, runs: int = 5):
+        peaks_lpa = []
+        peaks_dstar = []
+
+        for _ in range(runs):
+            tracemalloc.start()
+            new_lpa_star_instance(self.graph, self.source, self.target, heuristic=self.heuristic)
+            _, peak_lpa = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            peaks_lpa.append(peak_lpa)
+
+            tracemalloc.start()
+            new_dstar_lite_instance(self.graph, self.source, self.target, heuristic=self.heuristic)
+            _, peak_dstar = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            peaks_dstar.append(peak_dstar)
+
+        mib = 1024 * 1024
+        return {
+            "LPA* Peak Memory (MiB)": max(peaks_lpa) / mib,
+            "LPA* Avg Memory (MiB)": statistics.mean(peaks_lpa) / mib,
+            "D* Lite Peak Memory (MiB)": max(peaks_dstar) / mib,
+            "D* Lite Avg Memory (MiB)": statistics.mean(peaks_dstar) / mib,
+        }
+
+    def compare_recalculation(self):
+        """Replanning after weight changes on edges of the current path."""
+        world = self.graph.copy()
+        lpa = new_lpa_star_instance(world, self.source, self.target, heuristic=self.heuristic)
+        dstar = new_dstar_lite_instance(world, self.source, self.target, heuristic=self.heuristic)
+        path = lpa.get_path()
+        if not path or len(path) < 3:
+            raise ValueError("Insufficient path for modification")
+
+        rng = random.Random(0)
+        edges_to_modify = rng.sample(list(zip(path, path[1:])), k=min(10, len(path) - 1))
+        total = {"lpa": 0.0, "dstar": 0.0, "astar": 0.0}
+
+        for u, v in edges_to_modify:
+            new_w = mutated_weight(rng, u, v, self.heuristic)
+
+            t0 = time.perf_counter()
+            lpa_star_modify_edge(lpa, u, v, new_w)
+            lpa_star_recalculate_path(lpa)
+            t1 = time.perf_counter()
+            total["lpa"] += t1 - t0
+
+            t0 = time.perf_counter()
+            d_star_modify_edge(dstar, u, v, new_w)
+            d_star_recalculate_path(dstar)
+            t1 = time.perf_counter()
+            total["dstar"] += t1 - t0
+
+            world[u][v]["weight"] = new_w
+            t0 = time.perf_counter()
+            nx.astar_path_length(world, self.source, self.target, heuristic=self.heuristic, weight="weight")
+            t1 = time.perf_counter()
+            total["astar"] += t1 - t0
+
+        if not math.isclose(lpa.get_path_cost(), dstar.get_path_cost()):
+            raise ValueError("LPA* and D* Lite disagree on the path cost")
+        return {
+            "A* Recalc Total (s)": total["astar"],
+            "D* Lite Recalc Total (s)": total["dstar"],
+            "LPA* Recalc Total (s)": total["lpa"],
+        }
+
+    def compare_bulk_modifications(self):
+        """Replanning after weight changes on random edges anywhere in the graph."""
+        world = self.graph.copy()
+        lpa = new_lpa_star_instance(world, self.source, self.target, heuristic=self.heuristic)
+        dstar = new_dstar_lite_instance(world, self.source, self.target, heuristic=self.heuristic)
+        all_edges = list(world.edges)
+        rng = random.Random(0)
+        times = {"lpa": [], "dstar": []}
+
+        for _ in range(self.n_modifications):
+            u, v = rng.choice(all_edges)
+            new_w = mutated_weight(rng, u, v, self.heuristic)
+
+            t0 = time.perf_counter()
+            lpa_star_modify_edge(lpa, u, v, new_w)
+            lpa_star_recalculate_path(lpa)
+            t1 = time.perf_counter()
+            times["lpa"].append(t1 - t0)
+
+            t0 = time.perf_counter()
+            d_star_modify_edge(dstar, u, v, new_w)
+            d_star_recalculate_path(dstar)
+            t1 = time.perf_counter()
+            times["dstar"].append(t1 - t0)
+
+        return {
+            "D* Lite Bulk Avg Time (s)": statistics.mean(times["dstar"]),
+            "LPA* Bulk Avg Time (s)": statistics.mean(times["lpa"]),
+            "LPA* Replans": lpa.replans,
+            "Bulk Modifications Count": self.n_modifications,
+        }
+
+    def run_all(self):
+        time_data = self.compare_initial_time()
+        mem_data = self.compare_memory()
+        recalc_data = self.compare_recalculation()
+        bulk_data = self.compare_bulk_modifications()
+
+        result = {**time_data, **mem_data, **recalc_data, **bulk_data}
+        table = [[k, f"{v:.6f}" if isinstance(v, float) else v] for k, v in result.items()]
+        print(tabulate(table, headers=["Metric", "Value"], tablefmt="grid"))
+        return result
@@ -8,13 +8,16 @@ from networkx.algorithms.shortest_paths.astar import astar_path
 from tabulate import tabulate
 
 from Algorithms.rtaa_star import rtaa_star_path
+from Testers.bi_astar import dense_random_graph, mutated_weight
 
 
 class RTAAStarVsAStarComparison:
-    def __init__(self, graph: nx.Graph, source, target, lookahead=5, move_limit=1, n_modifications=50):
+    def __init__(self, graph: nx.Graph, source, target, lookahead=5, move_limit=1, n_modifications=50,
+                 heuristic=None):
         self.graph = graph
         self.source = source
         self.target = target
+        self.heuristic = heuristic
         self.lookahead = lookahead
         self.move_limit = move_limit
         self.name = "RTAA*"
@@ -25,13 +28,13 @@ class RTAAStarVsAStarComparison:
 
     def compare_initial_time(self):
         t0 = time.perf_counter()
-        path_astar = astar_path(self.graph, self.source, self.target, weight="weight")
+        path_astar = astar_path(self.graph, self.source, self.target, heuristic=self.heuristic, weight="weight")
         t1 = time.perf_counter()
         time_astar = t1 - t0
         cost_astar = self.compute_cost(path_astar)
 
         t0 = time.perf_counter()
-        path_rtaa = rtaa_star_path(self.graph, self.source, self.target,
+        path_rtaa = rtaa_star_path(self.graph, self.source, self.target, heuristic=self.heuristic,
                                    lookahead=self.lookahead, move_limit=self.move_limit)
         t1 = time.perf_counter()
         time_rtaa = t1 - t0
@@ -44,13 +47,44 @@ class RTAAStarVsAStarComparison:
             "RTAA* Cost": cost_rtaa,
         }
 
+    def compare_heap(self, runs=5):
+        dense = dense_random_graph()
+        result = {}
+
+        for label, graph, source, target, heuristic in (
+                ("City", self.graph, self.source, self.target, self.heuristic),
+                ("Dense", dense, 0, len(dense) - 1, None),
+        ):
+            timings = {False: [], True: []}
+            stats = {}
+            for _ in range(runs):
+                for indexed in (False, True):
+                    stats[indexed] = {}
+                    t0 = time.perf_counter()
+                    rtaa_star_path(
+                        graph, source, target, heuristic=heuristic,
+                        lookahead=self.lookahead, move_limit=self.move_limit,
+                        indexed_heap=indexed, heap_stats=stats[indexed],
+                    )
+                    t1 = time.perf_counter()
+                    timings[indexed].append(t1 - t0)
+
+            result[f"{label} Lazy Heap Max Size"] = stats[False]["max_heap_size"]
+            result[f"{label} Indexed Heap Max Size"] = stats[True]["max_heap_size"]
+            result[f"{label} Stale Pops Avoided"] = stats[False]["stale_pops"]
+            result[f"{label} Duplicate Pushes Avoided"] = stats[True]["decrease_keys"]
+            result[f"{label} Indexed Heap Time Saved (s)"] = (
+                    statistics.mean(timings[False]) - statistics.mean(timings[True])
+            )
+        return result
+
     def compare_memory(self, runs: int = 5):
         peaks_astar = []
         peaks_rtaa = []
 
         for _ in range(runs):
             tracemalloc.start()
-            astar_path(self.graph, self.source, self.target, weight="weight")
+            astar_path(self.graph, self.source, self.target, heuristic=self.heuristic, weight="weight")
             _, peak_a = tracemalloc.get_traced_memory()
             tracemalloc.stop()
             peaks_astar.append(peak_a)
@@ -60,6 +94,7 @@ class RTAAStarVsAStarComparison:
                 self.graph,
                 self.source,
                 self.target,
+                heuristic=self.heuristic,
                 lookahead=self.lookahead,
                 move_limit=self.move_limit,
             )
@@ -80,12 +115,12 @@ class RTAAStarVsAStarComparison:
         self.graph[self.source][neighbor]["weight"] += 3
 
         t0 = time.perf_counter()
-        astar_path(self.graph, self.source, self.target, weight="weight")
+        astar_path(self.graph, self.source, self.target, heuristic=self.heuristic, weight="weight")
         t1 = time.perf_counter()
         time_astar = t1 - t0
 
         t0 = time.perf_counter()
-        rtaa_star_path(self.graph, self.source, self.target,
+        rtaa_star_path(self.graph, self.source, self.target, heuristic=self.heuristic,
                        lookahead=self.lookahead, move_limit=self.move_limit)
         t1 = time.perf_counter()
         time_rtaa = t1 - t0
@@ -102,17 +137,17 @@ class RTAAStarVsAStarComparison:
 
         for _ in range(self.n_modifications):
             u, v = random.choice(all_edges)
-            new_w = random.randint(5, 50)
+            new_w = mutated_weight(random, u, v, self.heuristic)
             self.graph[u][v]["weight"] = new_w
 
             t0 = time.perf_counter()
-            rtaa_star_path(self.graph, self.source, self.target,
+            rtaa_star_path(self.graph, self.source, self.target, heuristic=self.heuristic,
                            lookahead=self.lookahead, move_limit=self.move_limit)
             t1 = time.perf_counter()
             times_rtaa.append(t1 - t0)
 
             t0 = time.perf_counter()
-            astar_path(self.graph, self.source, self.target, weight="weight")
+            astar_path(self.graph, self.source, self.target, heuristic=self.heuristic, weight="weight")
             t1 = time.perf_counter()
             times_astar.append(t1 - t0)
 
@@ -125,10 +160,11 @@ class RTAAStarVsAStarComparison:
     def run_all(self):
         time_data = self.compare_initial_time()
         mem_data = self.compare_memory()
+        heap_data = self.compare_heap()
         recalc_data = self.compare_recalculation()
         bulk_data = self.compare_bulk_modifications()
 
-        result = {**time_data, **mem_data, **recalc_data, **bulk_data}
+        result = {**time_data, **mem_data, **heap_data, **recalc_data, **bulk_data}
         table = [[k, f"{v:.6f}" if isinstance(v, float) else v] for k, v in result.items()]
         print(tabulate(table, headers=["Metric", "Value"], tablefmt="grid"))
         return result
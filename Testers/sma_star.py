@@ -9,6 +9,7 @@ from tabulate import tabulate
 
 from Algorithms.sma_star import sma_star_path
 from Config import MEMORY_LIMIT
+from Testers.bi_astar import dense_random_graph, mutated_weight
 
 
 
@@ -27,7 +28,7 @@ class SMAStarVsAStarComparison:
 
     def compare_initial_time(self):
         t0 = time.perf_counter()
-        path_astar = astar_path(self.graph, self.source, self.target, weight="weight")
+        path_astar = astar_path(self.graph, self.source, self.target, heuristic=self.heuristic, weight="weight")
         t1 = time.perf_counter()
         time_astar = t1 - t0
         cost_astar = self.compute_cost(path_astar)
@@ -49,6 +50,37 @@ class SMAStarVsAStarComparison:
             "SMA* Cost": cost_sma,
         }
 
+    def compare_heap(self, runs=5):
+        dense = dense_random_graph()
+        result = {}
+
+        for label, graph, source, target, heuristic in (
+                ("City", self.graph, self.source, self.target, self.heuristic),
+                ("Dense", dense, 0, len(dense) - 1, None),
+        ):
+            timings = {False: [], True: []}
+            stats = {}
+            for _ in range(runs):
+                for indexed in (False, True):
+                    stats[indexed] = {}
+                    t0 = time.perf_counter()
+                    sma_star_path(
+                        graph, source, target, heuristic=heuristic,
+                        memory_limit=graph.number_of_edges() + 1,
+                        indexed_heap=indexed, heap_stats=stats[indexed],
+                    )
+                    t1 = time.perf_counter()
+                    timings[indexed].append(t1 - t0)
+
+            result[f"{label} Lazy Heap Max Size"] = stats[False]["max_heap_size"]
+            result[f"{label} Indexed Heap Max Size"] = stats[True]["max_heap_size"]
+            result[f"{label} Stale Pops Avoided"] = stats[False]["stale_pops"]
+            result[f"{label} Duplicate Pushes Avoided"] = stats[True]["decrease_keys"]
+            result[f"{label} Indexed Heap Time Saved (s)"] = (
+                    statistics.mean(timings[False]) - statistics.mean(timings[True])
+            )
+        return result
+
     def compare_memory(self, runs: int = 5):
         peaks_astar = []
         peaks_sma = []
@@ -56,7 +88,7 @@ class SMAStarVsAStarComparison:
 
         for _ in range(runs):
             tracemalloc.start()
-            nx.astar_path(self.graph, self.source, self.target, weight="weight")
+            nx.astar_path(self.graph, self.source, self.target, heuristic=self.heuristic, weight="weight")
             _, peak_a = tracemalloc.get_traced_memory()
             tracemalloc.stop()
             peaks_astar.append(peak_a / mib)
@@ -83,7 +115,7 @@ class SMAStarVsAStarComparison:
         self.graph[self.source][neighbor]["weight"] += 5
 
         t0 = time.perf_counter()
-        astar_path(self.graph, self.source, self.target, weight="weight")
+        astar_path(self.graph, self.source, self.target, heuristic=self.heuristic, weight="weight")
         t1 = time.perf_counter()
         time_astar = t1 - t0
 
@@ -108,7 +140,7 @@ class SMAStarVsAStarComparison:
 
         for _ in range(self.n_modifications):
             u, v = random.choice(all_edges)
-            new_w = random.randint(5, 50)
+            new_w = mutated_weight(random, u, v, self.heuristic)
             self.graph[u][v]["weight"] = new_w
 
             t0 = time.perf_counter()
@@ -117,7 +149,7 @@ class SMAStarVsAStarComparison:
             times_sma.append(t1 - t0)
 
             t0 = time.perf_counter()
-            astar_path(self.graph, self.source, self.target, weight="weight")
+            astar_path(self.graph, self.source, self.target, heuristic=self.heuristic, weight="weight")
             t1 = time.perf_counter()
             times_astar.append(t1 - t0)
 
@@ -130,10 +162,11 @@ class SMAStarVsAStarComparison:
     def run_all(self):
         time_data = self.compare_initial_time()
         mem_data = self.compare_memory()
+        heap_data = self.compare_heap()
         recalc_data = self.compare_recalculation()
         bulk_data = self.compare_bulk_modifications()
 
-        result = {**time_data, **mem_data, **recalc_data, **bulk_data}
+        result = {**time_data, **mem_data, **heap_data, **recalc_data, **bulk_data}
         table = [[k, f"{v:.6f}" if isinstance(v, float) else v] for k, v in result.items()]
         print(tabulate(table, headers=["Metric", "Value"], tablefmt="grid"))
         return result
@@ -1,4 +1,6 @@
+import os
 import re
+import tempfile
 from multiprocessing import Process, Manager, freeze_support
 from pathlib import Path
 
@@ -7,19 +9,25 @@ import pandas as pd
 from openpyxl.styles import Alignment, Font
 from openpyxl.utils import get_column_letter
 
+from Algorithms.fringe_search import fringe_search_path
 from Algorithms.ida_star import idastar_path
 from Algorithms.rtaa_star import rtaa_star_path
 from Algorithms.sma_star import sma_star_path
 from Algorithms.bi_astar import bidirectional_astar
-from CsvProcessor.generator import generate_graph_from_csv
+from Algorithms.d_star_lite import new_dstar_lite_instance, d_star_save_state
+from Algorithms.geo_heuristic import HaversineHeuristic
+from CsvProcessor.generator import generate_graph_from_csv, load_coordinate_index
 from Testers.bi_astar import AStarVsBidirectionalComparison
 from Testers.d_star_lite import DStarLiteVsAStarComparison
+from Testers.fringe_search import FringeSearchVsIDAStarComparison
 from Testers.ida_star import IDAStarVsAStarComparison
+from Testers.lpa_star import LPAStarVsDStarLiteComparison
 from Testers.rtaa_star import RTAAStarVsAStarComparison
 from Testers.sma_star import SMAStarVsAStarComparison
 from Graphs.graphs import draw_graph, draw_big_graph
 
-from Config import MEMORY_LIMIT, LOOKAHEAD, MOVELIMIT, N_MODIFICATIONS, SOURCE, TARGET, CSV_PATH, EXCEL_FILE, DIRECTED
+from Config import MEMORY_LIMIT, LOOKAHEAD, MOVELIMIT, N_MODIFICATIONS, SOURCE, TARGET, CSV_PATH, EXCEL_FILE, DIRECTED, \
+    COORDS_PATH
 
 # ─── Excel helpers ────────────────────────────────────────────────────────────
 def sanitize_sheet_name(name: str) -> str:
@@ -59,50 +67,63 @@ def append_sheet(result_dict, sheet_name, excel_path=EXCEL_FILE):
             ws.column_dimensions[col_letter].width = max_len + 2
 
 # ─── Worker wrappers ──────────────────────────────────────────────────────────
-def run_bidirectional(graph, n_mods, shared):
-    tester = AStarVsBidirectionalComparison(graph, SOURCE, TARGET, n_mods)
+def run_bidirectional(graph, n_mods, heuristic, shared):
+    tester = AStarVsBidirectionalComparison(graph, SOURCE, TARGET, n_mods, heuristic=heuristic)
     shared["Bidirectional A*"] = tester.run_all()
     try:
-        _, full_path, _ = bidirectional_astar(graph, SOURCE, TARGET)
+        _, full_path, _ = bidirectional_astar(graph, SOURCE, TARGET, heuristic=heuristic)
         ## Drawing the original graph
         draw_big_graph(graph,output_path="Graphs/Plots/OriginalPath.svg")
         draw_graph(graph, SOURCE, TARGET, path=full_path, metrics=shared["Bidirectional A*"], output_path="Graphs/Plots/path_bidirectional_astar.svg")
     except nx.NetworkXNoPath:
         pass
 
-def run_dstar(di_graph, n_mods, shared):
-    tester = DStarLiteVsAStarComparison(di_graph, SOURCE, TARGET, n_mods)
+def run_dstar(di_graph, n_mods, heuristic, state_path, shared):
+    tester = DStarLiteVsAStarComparison(di_graph, SOURCE, TARGET, n_mods, heuristic=heuristic, state_path=state_path)
     shared["D* Lite"] = tester.run_all()
     try:
-        path = nx.astar_path(di_graph, SOURCE, TARGET, weight="weight")
+        path = nx.astar_path(di_graph, SOURCE, TARGET, heuristic=heuristic, weight="weight")
         draw_graph(di_graph, SOURCE, TARGET, path=path, metrics=shared["D* Lite"], output_path="Graphs/Plots/path_dstar_lite.svg")
     except nx.NetworkXNoPath:
         pass
 
-def run_idastar(graph, n_mods, shared):
-    tester = IDAStarVsAStarComparison(graph, SOURCE, TARGET, n_mods)
+def run_lpa(di_graph, n_mods, heuristic, shared):
+    tester = LPAStarVsDStarLiteComparison(di_graph, SOURCE, TARGET, n_mods, heuristic=heuristic)
+    shared["LPA*"] = tester.run_all()
+
+def run_idastar(graph, n_mods, heuristic, shared):
+    tester = IDAStarVsAStarComparison(graph, SOURCE, TARGET, n_mods, heuristic=heuristic)
     shared["IDA*"] = tester.run_all()
     try:
-        path = idastar_path(graph, SOURCE, TARGET)
+        path = idastar_path(graph, SOURCE, TARGET, heuristic=heuristic)
         draw_graph(graph, SOURCE, TARGET, path=path, metrics=shared["IDA*"], output_path="Graphs/Plots/path_idastar.svg")
     except Exception:
         pass
 
-def run_rtaa(graph, lookahead, move_limit, n_mods, shared):
-    tester = RTAAStarVsAStarComparison(graph, SOURCE, TARGET, lookahead, move_limit, n_mods)
+def run_fringe(graph, n_mods, heuristic, shared):
+    tester = FringeSearchVsIDAStarComparison(graph, SOURCE, TARGET, n_mods, heuristic=heuristic)
+    shared["Fringe Search"] = tester.run_all()
+    try:
+        path = fringe_search_path(graph, SOURCE, TARGET, heuristic=heuristic)
+        draw_graph(graph, SOURCE, TARGET, path=path, metrics=shared["Fringe Search"], output_path="Graphs/Plots/path_fringe_search.svg")
+    except Exception:
+        pass
+
+def run_rtaa(graph, lookahead, move_limit, n_mods, heuristic, shared):
+    tester = RTAAStarVsAStarComparison(graph, SOURCE, TARGET, lookahead, move_limit, n_mods, heuristic=heuristic)
     key = f"RTAA* (L={lookahead}, M={move_limit})"
     shared[key] = tester.run_all()
     try:
-        path = rtaa_star_path(graph, SOURCE, TARGET, lookahead=lookahead, move_limit=move_limit)
+        path = rtaa_star_path(graph, SOURCE, TARGET, heuristic=heuristic, lookahead=lookahead, move_limit=move_limit)
         draw_graph(graph, SOURCE, TARGET, path=path, metrics=shared[key], output_path="Graphs/Plots/path_rtaa_star.svg")
     except Exception:
         pass
 
-def run_sma(graph, memory_limit, n_mods, shared):
-    tester = SMAStarVsAStarComparison(graph, SOURCE, TARGET, heuristic=None, n_modifications=n_mods, memory_limit=memory_limit)
+def run_sma(graph, memory_limit, n_mods, heuristic, shared):
+    tester = SMAStarVsAStarComparison(graph, SOURCE, TARGET, heuristic=heuristic, n_modifications=n_mods, memory_limit=memory_limit)
     shared["SMA*"] = tester.run_all()
     try:
-        path = sma_star_path(graph, SOURCE, TARGET, memory_limit=memory_limit)
+        path = sma_star_path(graph, SOURCE, TARGET, heuristic=heuristic, memory_limit=memory_limit)
         draw_graph(graph, SOURCE, TARGET, path=path, metrics=shared["SMA*"], output_path="Graphs/Plots/path_sma_star.svg")
     except Exception:
         pass
@@ -119,25 +140,40 @@ if __name__ == "__main__":
         print("No path between source and target. Aborting.")
         exit(1)
 
+    # Great-circle heuristic, scaled so that it never exceeds an edge weight
+    heuristic = HaversineHeuristic.calibrated(base_graph, load_coordinate_index(COORDS_PATH))
+
     initial_path = nx.shortest_path(base_graph, SOURCE, TARGET, weight="weight")
     draw_graph(base_graph, SOURCE, TARGET, path=initial_path, output_path=f"Graphs/Plots/graph_{SOURCE}_to_{TARGET}.svg")
 
     directed_graph = base_graph.to_directed()
+
+    # Converge D* Lite once here; the worker restores it instead of re-searching
+    fd, dstar_state = tempfile.mkstemp(suffix=".dstar")
+    os.close(fd)
+    d_star_save_state(
+        new_dstar_lite_instance(directed_graph, SOURCE, TARGET, heuristic=heuristic, overlay=True),
+        dstar_state,
+    )
+
     manager = Manager()
     shared_results = manager.dict()
 
     processes = [
-        Process(target=launch, args=(run_bidirectional, base_graph, N_MODIFICATIONS, shared_results)),
-        Process(target=launch, args=(run_dstar, directed_graph, N_MODIFICATIONS, shared_results)),
-        Process(target=launch, args=(run_idastar, base_graph, N_MODIFICATIONS, shared_results)),
-        Process(target=launch, args=(run_rtaa, base_graph, LOOKAHEAD, MOVELIMIT, N_MODIFICATIONS, shared_results)),
-        Process(target=launch, args=(run_sma, base_graph, MEMORY_LIMIT, N_MODIFICATIONS, shared_results)),
+        Process(target=launch, args=(run_bidirectional, base_graph, N_MODIFICATIONS, heuristic, shared_results)),
+        Process(target=launch, args=(run_dstar, directed_graph, N_MODIFICATIONS, heuristic, dstar_state, shared_results)),
+        Process(target=launch, args=(run_lpa, directed_graph, N_MODIFICATIONS, heuristic, shared_results)),
+        Process(target=launch, args=(run_idastar, base_graph, N_MODIFICATIONS, heuristic, shared_results)),
+        Process(target=launch, args=(run_fringe, base_graph, N_MODIFICATIONS, heuristic, shared_results)),
+        Process(target=launch, args=(run_rtaa, base_graph, LOOKAHEAD, MOVELIMIT, N_MODIFICATIONS, heuristic, shared_results)),
+        Process(target=launch, args=(run_sma, base_graph, MEMORY_LIMIT, N_MODIFICATIONS, heuristic, shared_results)),
     ]
 
     for p in processes:
         p.start()
     for p in processes:
         p.join()
+    os.remove(dstar_state)
 
     for algorithm, metrics in shared_results.items():
         append_sheet(metrics, algorithm, EXCEL_FILE)